@@ -0,0 +1,142 @@
+"""
+Counter Service for materialized per-event activity totals
+Counts are kept in EventCounter rows, one per event, metric and day, and are
+updated in the same transaction as the write they describe
+"""
+from datetime import datetime
+from sqlalchemy import func, insert, update, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.models import EventCounter, View, Share, Comment, Guest
+
+METRICS = ('views', 'shares', 'comments', 'rsvp_yes', 'rsvp_no', 'rsvp_maybe')
+
+# RSVP statuses with a counter; Pending is derived from the guest total
+RSVP_METRICS = {'Yes': 'rsvp_yes', 'No': 'rsvp_no', 'Maybe': 'rsvp_maybe'}
+
+def _upsert(event_id, metric, bucket, amount):
+    """Add amount to one counter row, creating it if needed"""
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect in ('sqlite', 'postgresql'):
+        dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+        stmt = dialect_insert(EventCounter).values(event_id=event_id, metric=metric, bucket=bucket, count=amount)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['event_id', 'metric', 'bucket'],
+            set_={'count': EventCounter.count + stmt.excluded.count}
+        )
+        db.session.execute(stmt)
+        return
+
+    result = db.session.execute(
+        update(EventCounter)
+        .where(EventCounter.event_id == event_id, EventCounter.metric == metric, EventCounter.bucket == bucket)
+        .values(count=EventCounter.count + amount)
+    )
+    if result.rowcount == 0:
+        db.session.execute(insert(EventCounter).values(event_id=event_id, metric=metric, bucket=bucket, count=amount))
+
+def increment(event_id, metric, amount=1, when=None):
+    """
+    Add to a counter in the current transaction; the caller commits
+
+    Args:
+        event_id: Event ID
+        metric: One of METRICS
+        amount: Value to add, negative to subtract
+        when: Datetime of the activity, defaults to now (UTC)
+    """
+    bucket = (when or datetime.utcnow()).date()
+    _upsert(event_id, metric, bucket, amount)
+
+def increment_many(deltas):
+    """
+    Apply several counter changes in the current transaction
+
+    Args:
+        deltas: Dict of (event_id, metric, bucket date) to amount
+    """
+    for (event_id, metric, bucket), amount in deltas.items():
+        if amount:
+            _upsert(event_id, metric, bucket, amount)
+
+def record_rsvp_change(event_id, old_status, new_status):
+    """Move a guest's response from one RSVP counter to another"""
+    if old_status == new_status:
+        return
+    if old_status in RSVP_METRICS:
+        increment(event_id, RSVP_METRICS[old_status], -1)
+    if new_status in RSVP_METRICS:
+        increment(event_id, RSVP_METRICS[new_status], 1)
+
+def get_counts(event_id, metrics=METRICS):
+    """
+    Totals for an event across all days
+
+    Args:
+        event_id: Event ID
+        metrics: Metrics to return
+
+    Returns:
+        dict: Metric name to total, 0 for metrics without rows
+    """
+    rows = (
+        db.session.query(EventCounter.metric, func.sum(EventCounter.count))
+        .filter(EventCounter.event_id == event_id, EventCounter.metric.in_(metrics))
+        .group_by(EventCounter.metric)
+        .all()
+    )
+    totals = {metric: 0 for metric in metrics}
+    totals.update({metric: int(total or 0) for metric, total in rows})
+    return totals
+
+def rebuild_counters(event_id=None, metrics=METRICS):
+    """
+    Recompute counters from the raw View, Share, Comment and Guest rows
+
+    Args:
+        event_id: Only rebuild this event; all events when None
+        metrics: Metrics to rebuild. Leave out 'views' when raw view
+            rows are not recorded, or the existing totals are lost.
+
+    Returns:
+        int: Number of counter rows written
+    """
+    sources = {
+        'views': (View, View.timestamp, None),
+        'shares': (Share, Share.timestamp, None),
+        'comments': (Comment, Comment.created_at, None),
+    }
+    for status, metric in RSVP_METRICS.items():
+        sources[metric] = (Guest, func.coalesce(Guest.rsvp_time, datetime.utcnow()), Guest.rsvp_status == status)
+
+    stmt = delete(EventCounter).where(EventCounter.metric.in_(metrics))
+    if event_id:
+        stmt = stmt.where(EventCounter.event_id == event_id)
+    db.session.execute(stmt)
+
+    written = 0
+    for metric in metrics:
+        model, timestamp, condition = sources[metric]
+        day = func.date(timestamp)
+        query = db.session.query(model.event_id, day, func.count()).group_by(model.event_id, day)
+        if condition is not None:
+            query = query.filter(condition)
+        if event_id:
+            query = query.filter(model.event_id == event_id)
+
+        rows = [
+            {
+                'event_id': row_event_id,
+                'metric': metric,
+                'bucket': bucket if not isinstance(bucket, str) else datetime.strptime(bucket, '%Y-%m-%d').date(),
+                'count': count
+            }
+            for row_event_id, bucket, count in query
+        ]
+        if rows:
+            db.session.execute(insert(EventCounter), rows)
+            written += len(rows)
+
+    db.session.commit()
+    return written
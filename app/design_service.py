@@ -0,0 +1,342 @@
+"""
+Design Service for Design Studio storage
+Canvas JSON is stored zlib-compressed and thumbnails are written to
+DESIGN_THUMBNAIL_FOLDER, so design rows stay small enough to list.
+Saves can send JSON patches against a version, kept as a history
+"""
+from datetime import datetime
+import base64
+import binascii
+import copy
+import hashlib
+import io
+import json
+import os
+import zlib
+from sqlalchemy import update
+from app import db
+from app.models import CustomDesign, DesignVersion
+from app.image_service import is_image
+
+# Data URI prefixes the editor's canvas.toDataURL() produces
+THUMBNAIL_TYPES = {
+    'data:image/png;base64,': 'png',
+    'data:image/jpeg;base64,': 'jpg',
+    'data:image/webp;base64,': 'webp'
+}
+
+# Served by main.design_thumbnail; files are named <design id>_<hash>.<ext>
+THUMBNAIL_URL_PREFIX = '/design-thumbnails/'
+
+def compress_canvas(canvas_json):
+    """Compress the Fabric.js JSON string for the canvas_gz column"""
+    return zlib.compress((canvas_json or '').encode('utf-8'), 6)
+
+def decompress_canvas(data):
+    return zlib.decompress(data).decode('utf-8') if data else ''
+
+def decode_thumbnail(data_url):
+    """
+    Image bytes and extension of a thumbnail data URI
+
+    Returns:
+        tuple: (bytes, extension) or None if it is not an image data URI
+    """
+    for prefix, extension in THUMBNAIL_TYPES.items():
+        if data_url and data_url.startswith(prefix):
+            try:
+                data = base64.b64decode(data_url[len(prefix):], validate=True)
+            except (binascii.Error, ValueError):
+                return None
+            return (data, extension) if is_image(io.BytesIO(data)) else None
+    return None
+
+def save_thumbnail(design_id, data_url, folder):
+    """
+    Write a design's thumbnail to disk
+
+    The name carries a hash of the image, so browsers can cache it for as
+    long as the design keeps that thumbnail.
+
+    Args:
+        design_id: Design the thumbnail belongs to
+        data_url: Thumbnail as sent by the editor
+        folder: Thumbnail folder
+
+    Returns:
+        str: Thumbnail file name, or None if data_url is not an image
+    """
+    decoded = decode_thumbnail(data_url)
+    if decoded is None:
+        return None
+    data, extension = decoded
+
+    filename = f'{design_id}_{hashlib.sha256(data).hexdigest()[:12]}.{extension}'
+    path = os.path.join(folder, filename)
+    if not os.path.exists(path):
+        os.makedirs(folder, exist_ok=True)
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    return filename
+
+def thumbnail_design_id(filename):
+    """Design id a thumbnail file name belongs to"""
+    return filename.rsplit('_', 1)[0]
+
+def remove_thumbnail(url, folder):
+    """Delete a thumbnail file written by save_thumbnail; other URLs are ignored"""
+    if not url or not url.startswith(THUMBNAIL_URL_PREFIX):
+        return
+    filename = os.path.basename(url[len(THUMBNAIL_URL_PREFIX):])
+    try:
+        os.remove(os.path.join(folder, filename))
+    except FileNotFoundError:
+        pass
+
+# --- Versioned saves ---
+# The editor sends RFC 6902 JSON patches against the version it loaded;
+# each save stores its patch, with a full snapshot every few versions.
+
+class PatchError(ValueError):
+    """A JSON patch is malformed or does not apply to the canvas"""
+
+class VersionConflict(Exception):
+    """The design was saved elsewhere since the client's base version"""
+
+    def __init__(self, version):
+        super().__init__(f'Design is at version {version}')
+        self.version = version
+
+def dump_canvas(document):
+    return json.dumps(document, separators=(',', ':'), ensure_ascii=False)
+
+def _pointer(path):
+    if not isinstance(path, str) or (path and not path.startswith('/')):
+        raise PatchError(f"Invalid JSON pointer '{path}'")
+    if not path:
+        return []
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+def _index(token, size):
+    if not token.isdigit() or (len(token) > 1 and token[0] == '0') or int(token) >= size:
+        raise PatchError(f"Invalid array index '{token}'")
+    return int(token)
+
+def _get(document, tokens):
+    for token in tokens:
+        if isinstance(document, list):
+            document = document[_index(token, len(document))]
+        elif isinstance(document, dict) and token in document:
+            document = document[token]
+        else:
+            raise PatchError(f"Path '/{'/'.join(tokens)}' does not exist")
+    return document
+
+def _add(document, tokens, value):
+    if not tokens:
+        return value
+    parent = _get(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, list):
+        if key == '-':
+            parent.append(value)
+        else:
+            parent.insert(_index(key, len(parent) + 1), value)
+    elif isinstance(parent, dict):
+        parent[key] = value
+    else:
+        raise PatchError(f"Cannot add to '/{'/'.join(tokens[:-1])}'")
+    return document
+
+def _remove(document, tokens):
+    if not tokens:
+        raise PatchError("Cannot remove the whole canvas")
+    parent = _get(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, list):
+        parent.pop(_index(key, len(parent)))
+    elif isinstance(parent, dict) and key in parent:
+        del parent[key]
+    else:
+        raise PatchError(f"Path '/{'/'.join(tokens)}' does not exist")
+    return document
+
+def _replace(document, tokens, value):
+    if not tokens:
+        return value
+    parent = _get(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, list):
+        parent[_index(key, len(parent))] = value
+    elif isinstance(parent, dict) and key in parent:
+        parent[key] = value
+    else:
+        raise PatchError(f"Path '/{'/'.join(tokens)}' does not exist")
+    return document
+
+def apply_patch(document, operations):
+    """
+    Apply RFC 6902 operations (add, remove, replace, move, copy, test)
+
+    The document is changed in place; callers pass a freshly parsed copy.
+
+    Args:
+        document: Parsed JSON document
+        operations: List of operation dicts
+
+    Returns:
+        The patched document
+
+    Raises:
+        PatchError: If an operation is malformed or does not apply
+    """
+    if not isinstance(operations, list):
+        raise PatchError("Patch must be a list of operations")
+
+    for operation in operations:
+        if not isinstance(operation, dict) or 'path' not in operation:
+            raise PatchError("Each operation needs an op and a path")
+        kind = operation.get('op')
+        path = _pointer(operation['path'])
+        if kind in ('add', 'replace', 'test') and 'value' not in operation:
+            raise PatchError(f"'{kind}' needs a value")
+
+        if kind == 'add':
+            document = _add(document, path, operation['value'])
+        elif kind == 'remove':
+            document = _remove(document, path)
+        elif kind == 'replace':
+            document = _replace(document, path, operation['value'])
+        elif kind in ('move', 'copy'):
+            source = _pointer(operation.get('from'))
+            value = _get(document, source)
+            if kind == 'move':
+                if path[:len(source)] == source and path != source:
+                    raise PatchError("Cannot move a value into itself")
+                document = _remove(document, source)
+            else:
+                value = copy.deepcopy(value)
+            document = _add(document, path, value)
+        elif kind == 'test':
+            if _get(document, path) != operation['value']:
+                raise PatchError(f"Test failed at '{operation['path']}'")
+        else:
+            raise PatchError(f"Unknown operation '{kind}'")
+    return document
+
+def _record_version(design_id, version, canvas_json, patch, snapshot_interval):
+    # Full saves and every snapshot_interval-th version keep the whole canvas
+    snapshot = patch is None or (version - 1) % snapshot_interval == 0
+    db.session.add(DesignVersion(
+        design_id=design_id,
+        version=version,
+        patch_gz=compress_canvas(dump_canvas(patch)) if patch is not None else None,
+        snapshot_gz=compress_canvas(canvas_json) if snapshot else None
+    ))
+
+def _prune_versions(design_id, version, history_limit):
+    """Drop history older than the last snapshot the kept versions still need"""
+    floor = version - history_limit
+    if floor <= 1:
+        return
+    base = db.session.query(db.func.max(DesignVersion.version)).filter(
+        DesignVersion.design_id == design_id,
+        DesignVersion.version <= floor,
+        DesignVersion.snapshot_gz.isnot(None)
+    ).scalar()
+    if base:
+        DesignVersion.query.filter(
+            DesignVersion.design_id == design_id,
+            DesignVersion.version < base
+        ).delete(synchronize_session=False)
+
+def create_canvas(design, canvas_json, snapshot_interval=20):
+    """Store the first version of a new design; the caller commits"""
+    if canvas_json is None:
+        raise PatchError("canvas_data is required")
+    design.canvas_gz = compress_canvas(canvas_json)
+    design.version = 1
+    db.session.flush()
+    _record_version(design.id, 1, canvas_json, None, snapshot_interval)
+
+def save_canvas(design, canvas_json=None, patch=None, base_version=None,
+                snapshot_interval=20, history_limit=100):
+    """
+    Save a new version of an existing design; the caller commits
+
+    Args:
+        design: CustomDesign with canvas_gz loaded when a patch is sent
+        canvas_json: Full canvas JSON, or None when sending a patch
+        patch: JSON patch against base_version
+        base_version: Version the client edited; required with a patch
+        snapshot_interval: Versions between full snapshots
+        history_limit: Versions of history to keep
+
+    Returns:
+        int: The new version
+
+    Raises:
+        VersionConflict: If the design is no longer at base_version
+        PatchError: If the patch does not apply
+    """
+    current = design.version
+    if base_version is not None and base_version != current:
+        raise VersionConflict(current)
+
+    if patch is None and canvas_json is None:
+        raise PatchError("Send canvas_data or a patch")
+    if patch is not None:
+        if base_version is None:
+            raise PatchError("A patch needs the base_version it was made against")
+        document = json.loads(decompress_canvas(design.canvas_gz))
+        canvas_json = dump_canvas(apply_patch(document, patch))
+
+    # Conditional on the version, so concurrent saves cannot both win
+    new_version = current + 1
+    result = db.session.execute(
+        update(CustomDesign)
+        .where(CustomDesign.id == design.id, CustomDesign.version == current)
+        .values(canvas_gz=compress_canvas(canvas_json), version=new_version, updated_at=datetime.utcnow())
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
+        latest = db.session.query(CustomDesign.version).filter_by(id=design.id).scalar()
+        raise VersionConflict(latest)
+    db.session.expire(design, ['canvas_gz', 'version', 'updated_at'])
+
+    _record_version(design.id, new_version, canvas_json, patch, snapshot_interval)
+    _prune_versions(design.id, new_version, history_limit)
+    return new_version
+
+def canvas_at_version(design_id, version):
+    """
+    Rebuild a past version from the nearest snapshot and the patches after it
+
+    Returns:
+        str: Canvas JSON, or None if that version is no longer kept
+    """
+    snapshot = DesignVersion.query.filter(
+        DesignVersion.design_id == design_id,
+        DesignVersion.version <= version,
+        DesignVersion.snapshot_gz.isnot(None)
+    ).order_by(DesignVersion.version.desc()).first()
+    if snapshot is None:
+        return None
+
+    patches = db.session.query(DesignVersion.patch_gz).filter(
+        DesignVersion.design_id == design_id,
+        DesignVersion.version > snapshot.version,
+        DesignVersion.version <= version
+    ).order_by(DesignVersion.version).all()
+    if len(patches) != version - snapshot.version:
+        return None
+
+    document = json.loads(decompress_canvas(snapshot.snapshot_gz))
+    for (patch_gz,) in patches:
+        document = apply_patch(document, json.loads(decompress_canvas(patch_gz)))
+    return dump_canvas(document)
+
+def delete_versions(design_id):
+    DesignVersion.query.filter_by(design_id=design_id).delete(synchronize_session=False)
@@ -4,43 +4,306 @@ Supports Gmail SMTP and other email providers
 """
 from flask import render_template, current_app
 from flask_mail import Mail, Message
-import os
+from markupsafe import escape
+from collections import OrderedDict
+from contextlib import contextmanager
+import atexit
+import queue
+import re
+import smtplib
+import threading
+import time
 
 mail = Mail()
 
+def _is_connection_error(error):
+    """True if the SMTP session is unusable, as opposed to the message being rejected"""
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    # SMTPException subclasses OSError, so exclude protocol-level rejections
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+def is_transient_error(error):
+    """True if a failed send may succeed later: the connection failed or the server answered 4xx"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, OSError)
+
 def init_mail(app):
     """Initialize Flask-Mail with app"""
     mail.init_app(app)
 
-def send_invitation_email(event, guest, invitation_url):
+class SMTPConnectionPool:
     """
-    Send invitation email to a guest
-    
+    Keeps authenticated SMTP sessions open so bulk sends skip the
+    TCP + STARTTLS + AUTH handshake for every message
+    """
+
+    def __init__(self, size=4, idle_timeout=60):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _open(self):
+        connection = mail.connect()
+        connection.__enter__()
+        connection.last_used = time.monotonic()
+        return connection
+
+    def _close(self, connection):
+        try:
+            connection.__exit__(None, None, None)
+        except Exception:
+            pass
+
+    def _checkout(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return self._open()
+
+            # Servers drop idle sessions; reconnect rather than fail on the first send
+            if time.monotonic() - connection.last_used < self.idle_timeout:
+                return connection
+            self._close(connection)
+
+    def _checkin(self, connection):
+        connection.last_used = time.monotonic()
+        self._idle.put(connection)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a session for sending several messages
+
+        Yields:
+            PooledConnection: Object with a send(message) method
+        """
+        self._slots.acquire()
+        pooled = PooledConnection(self)
+        try:
+            yield pooled
+        finally:
+            pooled.release()
+            self._slots.release()
+
+    def send(self, message):
+        """Send a single message over a pooled session"""
+        with self.connection() as connection:
+            connection.send(message)
+
+    def close(self):
+        """Close every idle session"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(connection)
+
+class PooledConnection:
+    """A borrowed pool session that reconnects once if the server drops it"""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+
+    def send(self, message):
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = self._pool._checkout()
+            try:
+                self._connection.send(message)
+                return
+            except OSError as e:
+                if not _is_connection_error(e):
+                    raise
+                self._pool._close(self._connection)
+                self._connection = None
+                if attempt:
+                    raise
+
+    def release(self):
+        if self._connection is not None:
+            self._pool._checkin(self._connection)
+            self._connection = None
+
+_pool_lock = threading.Lock()
+
+def get_smtp_pool():
+    """Return the application's SMTP pool, sized by MAIL_POOL_SIZE"""
+    app = current_app._get_current_object()
+    with _pool_lock:
+        pool = app.extensions.get('smtp_pool')
+        if pool is None:
+            pool = SMTPConnectionPool(
+                size=app.config.get('MAIL_POOL_SIZE', 4),
+                idle_timeout=app.config.get('MAIL_POOL_IDLE_TIMEOUT', 60)
+            )
+            app.extensions['smtp_pool'] = pool
+            atexit.register(pool.close)
+    return pool
+
+# --- Pre-compiled email bodies ---
+# Templates are rendered once per event with placeholder slots for the guest
+# fields, then each guest only pays for a join of the pre-split parts.
+
+_SLOT_PATTERN = re.compile(r'%%SLOT_(\w+)%%')
+
+# Guest fields substituted per guest; everything else is rendered into the cached body
+GUEST_TEXT_FIELDS = ('name', 'email', 'phone', 'unique_token', 'dietary_restrictions', 'notes')
+# Guest fields templates may branch on; these become part of the cache key instead
+GUEST_KEY_FIELDS = ('rsvp_status', 'plus_one_count')
+
+_event_variants = OrderedDict()
+_event_variants_lock = threading.Lock()
+EVENT_TEMPLATE_CACHE_SIZE = 128
+
+def _slot(name):
+    return f'%%SLOT_{name}%%'
+
+class _SlotGuest:
+    """Guest stand-in whose text fields render as substitution slots"""
+
+    def __init__(self, guest):
+        self.__dict__['_guest'] = guest
+        self.__dict__['unknown_fields'] = set()
+        for field in GUEST_TEXT_FIELDS:
+            self.__dict__[field] = _slot(field) if getattr(guest, field, None) else ''
+        for field in GUEST_KEY_FIELDS:
+            self.__dict__[field] = getattr(guest, field, None)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        # A field we cannot substitute; the output is only valid for this guest
+        self.unknown_fields.add(name)
+        return getattr(self._guest, name)
+
+class CompiledEmail:
+    """HTML and plain-text bodies split around their guest slots"""
+
+    def __init__(self, html, body):
+        self._html = _SLOT_PATTERN.split(html)
+        self._body = _SLOT_PATTERN.split(body)
+
+    def is_valid(self, slot_names):
+        """False if a filter mangled a slot, e.g. {{ guest.name|upper }}"""
+        for parts in (self._html, self._body):
+            if any('%%' in literal or 'SLOT_' in literal for literal in parts[0::2]):
+                return False
+            if not set(parts[1::2]) <= slot_names:
+                return False
+        return True
+
+    @staticmethod
+    def _fill(parts, values):
+        filled = list(parts)
+        filled[1::2] = [values[name] for name in parts[1::2]]
+        return ''.join(filled)
+
+    def render(self, values):
+        """
+        Substitute per-guest values into the bodies
+
+        Args:
+            values: Dict of slot name to raw text
+
+        Returns:
+            tuple: (html, body)
+        """
+        html_values = {name: str(escape(value)) for name, value in values.items()}
+        return self._fill(self._html, html_values), self._fill(self._body, values)
+
+def _compile(render, event, guest, extra_slots):
+    slot_guest = _SlotGuest(guest)
+    html, body = render(event, slot_guest, **{name: _slot(name) for name in extra_slots})
+    compiled = CompiledEmail(html, body)
+    if slot_guest.unknown_fields or not compiled.is_valid(set(GUEST_TEXT_FIELDS) | set(extra_slots)):
+        return None
+    return compiled
+
+def _guest_values(guest, **extra):
+    values = {field: str(getattr(guest, field, None) or '') for field in GUEST_TEXT_FIELDS}
+    values.update(extra)
+    return values
+
+class EventEmailTemplates:
+    """
+    Email bodies for one event, compiled once per guest variant
+
+    Variants are shared between all EventEmailTemplates for the same event
+    content, so a bulk send renders Jinja a handful of times in total.
+    """
+
+    def __init__(self, event, variants):
+        self.event = event
+        self._variants = variants
+
+    def _get(self, kind, render, guest, extra_slots=()):
+        key = (
+            kind,
+            tuple(getattr(guest, field, None) for field in GUEST_KEY_FIELDS),
+            tuple(bool(getattr(guest, field, None)) for field in GUEST_TEXT_FIELDS)
+        )
+        try:
+            return self._variants[key]
+        except KeyError:
+            compiled = self._variants[key] = _compile(render, self.event, guest, extra_slots)
+            return compiled
+
+    def invitation(self, guest, invitation_url):
+        """Return (html, body) of the invitation email for a guest"""
+        compiled = self._get('invitation', _render_invitation, guest, extra_slots=('invitation_url',))
+        if compiled is None:
+            return _render_invitation(self.event, guest, invitation_url)
+        return compiled.render(_guest_values(guest, invitation_url=invitation_url))
+
+    def rsvp_confirmation(self, guest):
+        """Return (html, body) of the RSVP confirmation email for a guest"""
+        compiled = self._get('rsvp_confirmation', _render_rsvp_confirmation, guest)
+        if compiled is None:
+            return _render_rsvp_confirmation(self.event, guest)
+        return compiled.render(_guest_values(guest))
+
+def get_event_templates(event):
+    """
+    Return the email templates for an event, reusing compiled bodies
+    while the event's content is unchanged
+
     Args:
         event: Event object
-        guest: Guest object
-        invitation_url: Full URL to the invitation
-    
+
     Returns:
-        bool: True if sent successfully, False otherwise
+        EventEmailTemplates
     """
-    try:
-        msg = Message(
-            subject=f"You're Invited: {event.title}",
-            recipients=[guest.email] if guest.email else [],
-            sender=current_app.config['MAIL_DEFAULT_SENDER']
-        )
-        
-        # Render HTML email template
-        msg.html = render_template(
-            'emails/invitation_email.html',
-            event=event,
-            guest=guest,
-            invitation_url=invitation_url
-        )
-        
-        # Plain text fallback
-        msg.body = f"""
+    key = tuple(getattr(event, column.name) for column in event.__table__.columns)
+
+    with _event_variants_lock:
+        variants = _event_variants.get(key)
+        if variants is None:
+            variants = _event_variants[key] = {}
+            while len(_event_variants) > EVENT_TEMPLATE_CACHE_SIZE:
+                _event_variants.popitem(last=False)
+        else:
+            _event_variants.move_to_end(key)
+
+    return EventEmailTemplates(event, variants)
+
+def _render_invitation(event, guest, invitation_url):
+    html = render_template(
+        'emails/invitation_email.html',
+        event=event,
+        guest=guest,
+        invitation_url=invitation_url
+    )
+    
+    # Plain text fallback
+    body = f"""
 You're Invited to {event.title}!
 
 Dear {guest.name},
@@ -57,13 +320,74 @@ We hope to see you there!
 Best regards,
 {event.host_name}
         """
+    return html, body
+
+def _render_rsvp_confirmation(event, guest):
+    html = render_template(
+        'emails/rsvp_confirmation_email.html',
+        event=event,
+        guest=guest
+    )
+    
+    body = f"""
+RSVP Confirmation
+
+Dear {guest.name},
+
+Thank you for your RSVP to {event.title}!
+
+Your Response: {guest.rsvp_status}
+Event Date: {event.event_date} at {event.event_time}
+Venue: {event.venue}
+
+We look forward to seeing you!
+
+Best regards,
+{event.host_name}
+        """
+    return html, body
+
+def send_invitation_email(event, guest, invitation_url, connection=None, templates=None, raise_errors=False):
+    """
+    Send invitation email to a guest
+    
+    Args:
+        event: Event object
+        guest: Guest object
+        invitation_url: Full URL to the invitation
+        connection: Optional pooled connection to send through
+        templates: Optional EventEmailTemplates reused across a batch
+        raise_errors: Raise SMTP and connection errors instead of returning False,
+            so the caller can retry transient ones
+    
+    Returns:
+        bool: True if sent successfully, False otherwise
+    
+    Raises:
+        OSError: SMTP or connection failure, only with raise_errors
+    """
+    try:
+        msg = Message(
+            subject=f"You're Invited: {event.title}",
+            recipients=[guest.email] if guest.email else [],
+            sender=current_app.config['MAIL_DEFAULT_SENDER']
+        )
+        
+        if templates is None:
+            templates = get_event_templates(event)
+        msg.html, msg.body = templates.invitation(guest, invitation_url)
         
         if guest.email:
-            mail.send(msg)
+            if connection is None:
+                get_smtp_pool().send(msg)
+            else:
+                connection.send(msg)
             return True
         return False
         
     except Exception as e:
+        if raise_errors and isinstance(e, OSError):
+            raise
         print(f"Error sending email to {guest.email}: {str(e)}")
         return False
 
@@ -88,30 +412,9 @@ def send_rsvp_confirmation_email(event, guest):
             sender=current_app.config['MAIL_DEFAULT_SENDER']
         )
         
-        msg.html = render_template(
-            'emails/rsvp_confirmation_email.html',
-            event=event,
-            guest=guest
-        )
+        msg.html, msg.body = get_event_templates(event).rsvp_confirmation(guest)
         
-        msg.body = f"""
-RSVP Confirmation
-
-Dear {guest.name},
-
-Thank you for your RSVP to {event.title}!
-
-Your Response: {guest.rsvp_status}
-Event Date: {event.event_date} at {event.event_time}
-Venue: {event.venue}
-
-We look forward to seeing you!
-
-Best regards,
-{event.host_name}
-        """
-        
-        mail.send(msg)
+        get_smtp_pool().send(msg)
         return True
         
     except Exception as e:
@@ -137,16 +440,18 @@ def send_bulk_invitations(event, guests, base_url):
         'skipped': 0
     }
     
-    for guest in guests:
-        if not guest.email:
-            stats['skipped'] += 1
-            continue
+    templates = get_event_templates(event)
+    with get_smtp_pool().connection() as connection:
+        for guest in guests:
+            if not guest.email:
+                stats['skipped'] += 1
+                continue
+                
+            invitation_url = f"{base_url}/event/{event.id}?guest={guest.unique_token}"
             
-        invitation_url = f"{base_url}/event/{event.id}?guest={guest.unique_token}"
-        
-        if send_invitation_email(event, guest, invitation_url):
-            stats['sent'] += 1
-        else:
-            stats['failed'] += 1
+            if send_invitation_email(event, guest, invitation_url, connection=connection, templates=templates):
+                stats['sent'] += 1
+            else:
+                stats['failed'] += 1
     
     return stats
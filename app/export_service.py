@@ -1,219 +1,197 @@
 """
 Export Service for generating Excel, CSV, and PDF exports
-Also handles CSV import and QR code generation
+Also handles CSV import
 """
-import pandas as pd
-import qrcode
+import csv
 import io
 import os
+import tempfile
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
-from datetime import datetime
+from openpyxl.utils import get_column_letter
+from app import db
+from app.models import Guest
+
+EXPORT_HEADERS = ['Name', 'Email', 'Phone', 'RSVP Status', 'Plus Ones', 'Dietary Restrictions', 'Notes', 'RSVP Time']
+
+# Fixed widths replace a second pass over every cell to measure content
+EXPORT_COLUMN_WIDTHS = [25, 32, 16, 12, 10, 30, 50, 17]
+
+def iter_guest_export_rows(event_id, batch_size=1000):
+    """
+    Stream the exported guest columns without loading Guest objects
+    
+    Args:
+        event_id: Event ID
+        batch_size: Rows fetched from the cursor at a time
+    
+    Yields:
+        Row: Projected guest columns in export order
+    """
+    query = (
+        db.session.query(
+            Guest.name, Guest.email, Guest.phone, Guest.rsvp_status, Guest.plus_one_count,
+            Guest.dietary_restrictions, Guest.notes, Guest.rsvp_time
+        )
+        .filter(Guest.event_id == event_id)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from query
+
+def _export_values(guest):
+    return [
+        guest.name,
+        guest.email or '',
+        guest.phone or '',
+        guest.rsvp_status,
+        guest.plus_one_count,
+        guest.dietary_restrictions or '',
+        guest.notes or '',
+        guest.rsvp_time.strftime('%Y-%m-%d %H:%M') if guest.rsvp_time else ''
+    ]
 
 def export_guests_to_excel(event, guests):
     """
     Export guest list to Excel file
     
+    Rows go through openpyxl's write-only mode and the workbook is saved to a
+    temporary file, so memory stays flat however many guests there are.
+    
     Args:
         event: Event object
-        guests: List of Guest objects
+        guests: Iterable of Guest objects or export rows
     
     Returns:
-        BytesIO: Excel file in memory
+        file: Temporary file positioned at the start of the workbook
     """
-    # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Guest List"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Guest List")
     
-    # Add header
-    headers = ['Name', 'Email', 'Phone', 'RSVP Status', 'Plus Ones', 'Dietary Restrictions', 'Notes', 'RSVP Time']
-    ws.append(headers)
+    for index, width in enumerate(EXPORT_COLUMN_WIDTHS, start=1):
+        ws.column_dimensions[get_column_letter(index)].width = width
     
     # Style header
     header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
     header_font = Font(bold=True, color="FFFFFF")
-    
-    for cell in ws[1]:
+    header = []
+    for title in EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=title)
         cell.fill = header_fill
         cell.font = header_font
         cell.alignment = Alignment(horizontal="center")
+        header.append(cell)
+    ws.append(header)
     
-    # Add data
     for guest in guests:
-        ws.append([
-            guest.name,
-            guest.email or '',
-            guest.phone or '',
-            guest.rsvp_status,
-            guest.plus_one_count,
-            getattr(guest, 'dietary_restrictions', '') or '',
-            guest.notes or '',
-            guest.rsvp_time.strftime('%Y-%m-%d %H:%M') if guest.rsvp_time else ''
-        ])
-    
-    # Adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
-    
-    # Save to BytesIO
-    output = io.BytesIO()
+        ws.append(_export_values(guest))
+    
+    output = tempfile.TemporaryFile()
     wb.save(output)
     output.seek(0)
     
     return output
 
-def export_guests_to_csv(guests):
+def export_guests_to_csv(guests, flush_rows=500):
     """
-    Export guest list to CSV format
+    Export guest list to CSV format, one chunk at a time
     
     Args:
-        guests: List of Guest objects
+        guests: Iterable of Guest objects or export rows
+        flush_rows: Rows written per yielded chunk
     
-    Returns:
+    Yields:
         str: CSV content
     """
-    data = []
-    for guest in guests:
-        data.append({
-            'Name': guest.name,
-            'Email': guest.email or '',
-            'Phone': guest.phone or '',
-            'RSVP Status': guest.rsvp_status,
-            'Plus Ones': guest.plus_one_count,
-            'Dietary Restrictions': getattr(guest, 'dietary_restrictions', '') or '',
-            'Notes': guest.notes or '',
-            'RSVP Time': guest.rsvp_time.strftime('%Y-%m-%d %H:%M') if guest.rsvp_time else ''
-        })
-    
-    df = pd.DataFrame(data)
-    return df.to_csv(index=False)
-
-def import_guests_from_csv(csv_file):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_HEADERS)
+    
+    for count, guest in enumerate(guests, start=1):
+        writer.writerow(_export_values(guest))
+        if count % flush_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue()
+
+# CSV header to guest field, with the column length limits from the Guest model
+IMPORT_COLUMNS = {
+    'Name': ('name', 100),
+    'Email': ('email', 120),
+    'Phone': ('phone', 20),
+    'Dietary Restrictions': ('dietary_restrictions', 200),
+    'Notes': ('notes', None)
+}
+
+def _open_csv_text(csv_file):
+    """Wrap an upload or path as a text stream without reading it into memory"""
+    if isinstance(csv_file, (str, os.PathLike)):
+        return open(csv_file, 'r', encoding='utf-8-sig', newline=''), None
+
+    stream = getattr(csv_file, 'stream', csv_file)
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    return text, text
+
+def _normalise_guest_row(row):
     """
-    Import guests from CSV file
-    
-    Args:
-        csv_file: File object or path to CSV
-    
+    Clean one CSV record into guest fields
+
     Returns:
-        list: List of guest dictionaries
+        tuple: (guest dict, error message); both None for a blank row
     """
-    try:
-        df = pd.read_csv(csv_file)
-        
-        # Expected columns
-        required_columns = ['Name']
-        optional_columns = ['Email', 'Phone', 'Dietary Restrictions', 'Notes']
-        
-        # Validate required columns
-        if 'Name' not in df.columns:
-            raise ValueError("CSV must contain 'Name' column")
-        
-        guests = []
-        for _, row in df.iterrows():
-            guest_data = {
-                'name': str(row['Name']).strip(),
-                'email': str(row.get('Email', '')).strip() if pd.notna(row.get('Email')) else None,
-                'phone': str(row.get('Phone', '')).strip() if pd.notna(row.get('Phone')) else None,
-                'dietary_restrictions': str(row.get('Dietary Restrictions', '')).strip() if pd.notna(row.get('Dietary Restrictions')) else None,
-                'notes': str(row.get('Notes', '')).strip() if pd.notna(row.get('Notes')) else None
-            }
-            
-            # Skip empty rows
-            if guest_data['name']:
-                guests.append(guest_data)
-        
-        return guests
-        
-    except Exception as e:
-        raise ValueError(f"Error importing CSV: {str(e)}")
+    guest_data = {}
+    for column, (field, max_length) in IMPORT_COLUMNS.items():
+        value = (row.get(column) or '').strip()
+        if max_length and len(value) > max_length:
+            return None, f"{column} is longer than {max_length} characters"
+        guest_data[field] = value or None
 
-def generate_qr_code(url, event_id, qr_folder):
+    if not any(guest_data.values()):
+        return None, None
+    if not guest_data['name']:
+        return None, "Name is required"
+    if guest_data['email'] and '@' not in guest_data['email']:
+        return None, f"Invalid email '{guest_data['email']}'"
+
+    return guest_data, None
+
+def import_guests_from_csv(csv_file, errors=None):
     """
-    Generate QR code for event invitation URL
+    Stream guests from a CSV file one row at a time
     
     Args:
-        url: URL to encode in QR code
-        event_id: Event ID for filename
-        qr_folder: Folder to save QR code
+        csv_file: Uploaded file object or path to CSV
+        errors: Optional list that receives {'row', 'error'} for each rejected row
     
-    Returns:
-        str: Path to generated QR code image
+    Yields:
+        dict: Normalised guest data for each valid row
     """
+    text, wrapper = _open_csv_text(csv_file)
     try:
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Ensure folder exists
-        os.makedirs(qr_folder, exist_ok=True)
-        
-        # Save image
-        filename = f"qr_{event_id}.png"
-        filepath = os.path.join(qr_folder, filename)
-        img.save(filepath)
-        
-        return filepath
-        
-    except Exception as e:
-        print(f"Error generating QR code: {str(e)}")
-        return None
-
-def get_event_statistics(event, guests):
-    """
-    Generate comprehensive statistics for an event
-    
-    Args:
-        event: Event object
-        guests: List of Guest objects
-    
-    Returns:
-        dict: Statistics dictionary
-    """
-    total_guests = len(guests)
-    rsvp_yes = sum(1 for g in guests if g.rsvp_status == 'Yes')
-    rsvp_no = sum(1 for g in guests if g.rsvp_status == 'No')
-    rsvp_maybe = sum(1 for g in guests if g.rsvp_status == 'Maybe')
-    rsvp_pending = sum(1 for g in guests if g.rsvp_status == 'Pending')
-    
-    total_attendees = rsvp_yes + sum(g.plus_one_count for g in guests if g.rsvp_status == 'Yes')
-    
-    # Dietary restrictions summary
-    dietary_restrictions = {}
-    for guest in guests:
-        if hasattr(guest, 'dietary_restrictions') and guest.dietary_restrictions:
-            restrictions = guest.dietary_restrictions.split(',')
-            for restriction in restrictions:
-                restriction = restriction.strip()
-                if restriction:
-                    dietary_restrictions[restriction] = dietary_restrictions.get(restriction, 0) + 1
-    
-    return {
-        'total_guests': total_guests,
-        'rsvp_yes': rsvp_yes,
-        'rsvp_no': rsvp_no,
-        'rsvp_maybe': rsvp_maybe,
-        'rsvp_pending': rsvp_pending,
-        'total_attendees': total_attendees,
-        'response_rate': round((total_guests - rsvp_pending) / total_guests * 100, 1) if total_guests > 0 else 0,
-        'dietary_restrictions': dietary_restrictions
-    }
+        reader = csv.DictReader(text)
+        if reader.fieldnames is None:
+            raise ValueError("CSV file is empty")
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+
+        if 'Name' not in reader.fieldnames:
+            raise ValueError("CSV must contain 'Name' column")
+
+        # Data starts on line 2, after the header
+        for line_number, row in enumerate(reader, start=2):
+            guest_data, error = _normalise_guest_row(row)
+            if error:
+                if errors is not None:
+                    errors.append({'row': line_number, 'error': error})
+            elif guest_data:
+                yield guest_data
+
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Error importing CSV: {str(e)}")
+    finally:
+        if wrapper is not None:
+            # Leave the upload's own stream open for the request to clean up
+            wrapper.detach()
+        else:
+            text.close()
@@ -0,0 +1,70 @@
+"""
+Guest Service for bulk guest ingestion
+Guests are inserted with chunked Core executemany statements instead of
+one ORM object per row going through the unit of work
+"""
+from itertools import islice
+from sqlalchemy import insert
+from app import db
+from app.models import Guest, generate_uuid
+
+GUEST_CHUNK_SIZE = 1000
+
+GUEST_FIELDS = ('name', 'email', 'phone', 'dietary_restrictions', 'notes')
+
+def _guest_row(event_id, guest_data):
+    row = {field: guest_data.get(field) for field in GUEST_FIELDS}
+    row.update({
+        'id': generate_uuid(),
+        'unique_token': generate_uuid(),
+        'event_id': event_id,
+        'rsvp_status': 'Pending',
+        'plus_one_count': 0
+    })
+    return row
+
+def row_to_dict(row):
+    """Shape an inserted row like Guest.to_dict() without loading the ORM object"""
+    return {
+        'id': row['id'],
+        'name': row['name'],
+        'email': row['email'],
+        'phone': row['phone'],
+        'rsvp_status': row['rsvp_status'],
+        'plus_one_count': row['plus_one_count'],
+        'dietary_restrictions': row['dietary_restrictions'],
+        'notes': row['notes'],
+        'unique_token': row['unique_token'],
+        'invitation_sent': None,
+        'rsvp_time': None
+    }
+
+def bulk_insert_guests(event_id, guests_data, chunk_size=GUEST_CHUNK_SIZE, collect=False):
+    """
+    Insert guests in chunks within the current transaction; the caller commits
+
+    Args:
+        event_id: Event ID
+        guests_data: Iterable of dicts with name, email, phone,
+            dietary_restrictions and notes
+        chunk_size: Rows per executemany
+        collect: Also return the inserted rows as dicts
+
+    Returns:
+        tuple: (count, list of Guest.to_dict()-shaped dicts or None)
+    """
+    guests_data = iter(guests_data)
+    count = 0
+    created = [] if collect else None
+
+    while True:
+        rows = [_guest_row(event_id, guest_data) for guest_data in islice(guests_data, chunk_size)]
+        if not rows:
+            break
+
+        db.session.execute(insert(Guest), rows)
+        count += len(rows)
+        if collect:
+            created.extend(row_to_dict(row) for row in rows)
+
+    return count, created
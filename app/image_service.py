@@ -0,0 +1,230 @@
+"""
+Image Service for uploaded pictures
+Uploads are resized into width-bounded WebP/JPEG variants, a thumbnail and a
+full-size copy, all without metadata, by a background worker pool. The stored
+original is never rewritten, so its name stays the hash of its bytes
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+from PIL import Image, ImageOps
+from flask import url_for
+
+# Widths a page can ask for; each upload gets the ones below its own width
+VARIANT_WIDTHS = (480, 960, 1600)
+THUMBNAIL_SIZE = (240, 240)
+
+# Extension and Pillow save options for each variant format
+VARIANT_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True})
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Paths queued or being processed, so a re-upload does not queue them twice
+_pending = set()
+_pending_lock = threading.Lock()
+
+def _get_executor(app):
+    """Create the shared worker pool on first use, sized by IMAGE_WORKERS"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config.get('IMAGE_WORKERS', 2),
+                thread_name_prefix='image-pipeline'
+            )
+    return _executor
+
+def is_image(stream):
+    """True if Pillow recognises the stream as an image; the stream is rewound"""
+    try:
+        with Image.open(stream) as img:
+            img.verify()
+        return True
+    except Exception:
+        return False
+    finally:
+        stream.seek(0)
+
+def variant_name(filename, width, extension):
+    stem = os.path.splitext(filename)[0]
+    return f'{stem}_w{width}.{extension}'
+
+def thumbnail_name(filename, extension):
+    stem = os.path.splitext(filename)[0]
+    return f'{stem}_thumb.{extension}'
+
+def full_size_name(filename):
+    stem, extension = os.path.splitext(filename)
+    return f'{stem}_full{extension}'
+
+def _save(img, path, extension):
+    format_name, options = VARIANT_FORMATS[extension]
+    if format_name == 'JPEG' and img.mode != 'RGB':
+        # JPEG has no alpha; flatten onto white
+        background = Image.new('RGB', img.size, 'white')
+        background.paste(img, mask=img.getchannel('A') if 'A' in img.getbands() else None)
+        img = background
+
+    temp_path = f'{path}.{threading.get_ident()}.tmp'
+    img.save(temp_path, format_name, **options)
+    os.replace(temp_path, path)
+
+def _save_full_size(img, path):
+    """
+    Write a copy of the original at full size without EXIF/GPS or other metadata
+
+    Returns:
+        str: Name of the copy, or None for formats that are not re-encoded
+    """
+    if img.format not in ('JPEG', 'PNG', 'WEBP'):
+        return None
+
+    folder, filename = os.path.split(path)
+    name = full_size_name(filename)
+    options = {'quality': 92} if img.format == 'JPEG' else {}
+    clean = ImageOps.exif_transpose(img)
+    clean.info = {key: img.info[key] for key in ('transparency',) if key in img.info}
+    temp_path = f'{os.path.join(folder, name)}.{threading.get_ident()}.tmp'
+    clean.save(temp_path, img.format, **options)
+    os.replace(temp_path, os.path.join(folder, name))
+    return name
+
+def process_image(path):
+    """
+    Write the metadata-free full-size copy, resized variants and thumbnail
+    for an upload
+
+    The original is only read; animated images get no processed files.
+
+    Args:
+        path: Path of the stored original
+
+    Returns:
+        list: Names of the files written
+    """
+    folder, filename = os.path.split(path)
+    written = []
+
+    with Image.open(path) as original:
+        if getattr(original, 'is_animated', False):
+            return written
+
+        original.load()
+        full_size = _save_full_size(original, path)
+        if full_size:
+            written.append(full_size)
+        img = ImageOps.exif_transpose(original)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'transparency' in img.info or 'A' in img.getbands() else 'RGB')
+
+        # Smaller widths, plus one variant at the original size if it fits
+        # below the largest width; never upscale
+        widths = [width for width in VARIANT_WIDTHS if width < img.width]
+        if len(widths) < len(VARIANT_WIDTHS):
+            widths.append(VARIANT_WIDTHS[len(widths)])
+
+        for width in widths:
+            if width < img.width:
+                resized = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+            else:
+                resized = img
+            for extension in VARIANT_FORMATS:
+                name = variant_name(filename, width, extension)
+                _save(resized, os.path.join(folder, name), extension)
+                written.append(name)
+
+        thumb = img.copy()
+        thumb.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+        for extension in VARIANT_FORMATS:
+            name = thumbnail_name(filename, extension)
+            _save(thumb, os.path.join(folder, name), extension)
+            written.append(name)
+
+    return written
+
+def _process_in_background(path):
+    try:
+        process_image(path)
+    except Exception as e:
+        print(f"Error processing image {path}: {str(e)}")
+    finally:
+        with _pending_lock:
+            _pending.discard(path)
+
+def submit(app, path):
+    """Queue an upload for processing unless it already is; the request does not wait for it"""
+    with _pending_lock:
+        if path in _pending:
+            return None
+        _pending.add(path)
+    return _get_executor(app).submit(_process_in_background, path)
+
+def pick_variant(folder, filename, width=None, thumbnail=False, webp=True, full=False):
+    """
+    Best processed file for a request, falling back to the original until
+    processing has run
+
+    Args:
+        folder: Upload folder
+        filename: Stored original's name
+        width: Display width the page needs; largest variant when None
+        thumbnail: Return the thumbnail instead
+        webp: Client accepts WebP
+        full: Return the metadata-free copy at the original size instead
+
+    Returns:
+        tuple: (file name, whether it is a processed variant)
+    """
+    if full:
+        name = full_size_name(filename)
+        if os.path.exists(os.path.join(folder, name)):
+            return name, True
+        return filename, False
+
+    extensions = ('webp', 'jpg') if webp else ('jpg',)
+
+    for extension in extensions:
+        if thumbnail:
+            name = thumbnail_name(filename, extension)
+            if os.path.exists(os.path.join(folder, name)):
+                return name, True
+            continue
+
+        available = [
+            size for size in VARIANT_WIDTHS
+            if os.path.exists(os.path.join(folder, variant_name(filename, size, extension)))
+        ]
+        if available:
+            fitting = [size for size in available if width and size >= width]
+            size = min(fitting) if fitting else max(available)
+            return variant_name(filename, size, extension), True
+
+    return filename, False
+
+def upload_filename(url):
+    """Stored file name behind an upload or media URL, or None for other URLs"""
+    for prefix in ('/static/uploads/', '/media/'):
+        if url and url.startswith(prefix):
+            return url[len(prefix):].split('?', 1)[0]
+    return None
+
+def media_url(url, width=None):
+    """
+    Sized URL for an uploaded image; other URLs are returned unchanged
+
+    Usable in templates as upload_media_url(event.background_image_url, 960).
+    """
+    filename = upload_filename(url)
+    if filename is None:
+        return url
+    return url_for('main.upload_media', filename=filename, w=width)
+
+def media_srcset(url):
+    """srcset value listing every variant width of an uploaded image"""
+    if upload_filename(url) is None:
+        return ''
+    return ', '.join(f'{media_url(url, width)} {width}w' for width in VARIANT_WIDTHS)
@@ -0,0 +1,157 @@
+"""
+Listing Service for guest lists and comment feeds
+Pages are read with keyset cursors over indexed sort keys, so the first and
+the hundredth page cost the same, and only the requested columns are selected
+"""
+import base64
+from datetime import datetime
+import json
+from sqlalchemy import func, select, tuple_
+from app import db
+from app.models import Guest, Comment
+
+# Response key -> column; keys match Guest.to_dict() and Comment.to_dict()
+GUEST_COLUMNS = {
+    'id': Guest.id,
+    'name': Guest.name,
+    'email': Guest.email,
+    'phone': Guest.phone,
+    'rsvp_status': Guest.rsvp_status,
+    'plus_one_count': Guest.plus_one_count,
+    'dietary_restrictions': Guest.dietary_restrictions,
+    'notes': Guest.notes,
+    'unique_token': Guest.unique_token,
+    'invitation_sent': Guest.invitation_sent_at,
+    'rsvp_time': Guest.rsvp_time
+}
+
+COMMENT_COLUMNS = {
+    'id': Comment.id,
+    'name': Comment.name,
+    'content': Comment.content,
+    'created_at': Comment.created_at
+}
+
+GUEST_STATUSES = ('Yes', 'No', 'Maybe', 'Pending')
+
+class ListingError(ValueError):
+    """Raised for a malformed cursor, field list or filter"""
+
+def encode_cursor(values):
+    """Opaque cursor for the sort key of the last row on a page"""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, size):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        raise ListingError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != size:
+        raise ListingError('Invalid cursor')
+    return values
+
+def _columns(available, fields):
+    if not fields:
+        return dict(available)
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ListingError(f"Unknown fields: {', '.join(unknown)}; choose from {', '.join(available)}")
+    return {field: available[field] for field in fields}
+
+def _page(columns, keys, filters, cursor, limit, descending=False):
+    """
+    One page of rows ordered by keys, after the row the cursor points at
+
+    The keys end with the primary key so the order is total, and the
+    cursor condition is a row-value comparison the index can seek to.
+    """
+    key_labels = [f'_key{i}' for i in range(len(keys))]
+    query = select(
+        *[column.label(name) for name, column in columns.items()],
+        *[key.label(label) for key, label in zip(keys, key_labels)]
+    ).where(*filters)
+
+    if cursor:
+        after = decode_cursor(cursor, len(keys))
+        try:
+            after = [
+                datetime.fromisoformat(value) if isinstance(key.type, db.DateTime) else value
+                for key, value in zip(keys, after)
+            ]
+        except (TypeError, ValueError):
+            raise ListingError('Invalid cursor')
+        if descending:
+            query = query.where(tuple_(*keys) < tuple_(*after))
+        else:
+            query = query.where(tuple_(*keys) > tuple_(*after))
+
+    order = [key.desc() if descending else key.asc() for key in keys]
+    # One extra row tells whether there is a next page
+    rows = db.session.execute(query.order_by(*order).limit(limit + 1)).mappings().all()
+
+    items = []
+    for row in rows[:limit]:
+        items.append({
+            name: row[name].isoformat() if isinstance(row[name], datetime) else row[name]
+            for name in columns
+        })
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([rows[limit - 1][label] for label in key_labels])
+    return items, next_cursor
+
+def list_guests(event_id, cursor=None, limit=50, fields=None, statuses=None, name_prefix=None, sent=None):
+    """
+    Page of an event's guests ordered by name
+
+    Args:
+        event_id: Event ID
+        cursor: next_cursor from the previous page, or None for the first
+        limit: Guests per page
+        fields: Response keys to include, all when empty
+        statuses: RSVP statuses to keep, all when empty
+        name_prefix: Case-insensitive start of the guest name
+        sent: True for guests whose invitation was sent, False for unsent
+
+    Returns:
+        tuple: (list of guest dicts, next cursor or None)
+
+    Raises:
+        ListingError: Bad cursor, field or status
+    """
+    unknown = [status for status in statuses or () if status not in GUEST_STATUSES]
+    if unknown:
+        raise ListingError(f"Unknown status: {', '.join(unknown)}")
+
+    filters = [Guest.event_id == event_id]
+    if statuses:
+        filters.append(Guest.rsvp_status.in_(statuses))
+    if name_prefix:
+        escaped = name_prefix.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        filters.append(func.lower(Guest.name).like(escaped + '%', escape='\\'))
+    if sent is not None:
+        filters.append(Guest.invitation_sent_at.isnot(None) if sent else Guest.invitation_sent_at.is_(None))
+
+    return _page(_columns(GUEST_COLUMNS, fields), (Guest.name, Guest.id), filters, cursor, limit)
+
+def list_comments(event_id, cursor=None, limit=50, fields=None):
+    """
+    Page of an event's comments, newest first
+
+    Args:
+        event_id: Event ID
+        cursor: next_cursor from the previous page, or None for the first
+        limit: Comments per page
+        fields: Response keys to include, all when empty
+
+    Returns:
+        tuple: (list of comment dicts, next cursor or None)
+
+    Raises:
+        ListingError: Bad cursor or field
+    """
+    return _page(
+        _columns(COMMENT_COLUMNS, fields), (Comment.created_at, Comment.id),
+        [Comment.event_id == event_id], cursor, limit, descending=True
+    )
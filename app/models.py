@@ -1,7 +1,10 @@
 from app import db
 from datetime import datetime
 import uuid
+from flask import current_app, has_app_context
 from flask_login import UserMixin
+from sqlalchemy import event as orm_event, update
+from sqlalchemy.orm import object_session
 from werkzeug.security import generate_password_hash, check_password_hash
 
 def generate_uuid():
@@ -16,12 +19,18 @@ class User(UserMixin, db.Model):
     events = db.relationship('Event', backref='owner', lazy=True)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        # Scripts such as reset_password.py; the routes hash via password_service
+        method = current_app.config.get('PASSWORD_HASH_METHOD') if has_app_context() else None
+        self.password_hash = generate_password_hash(password, method or 'scrypt')
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
 class Event(db.Model):
+    __table_args__ = (
+        db.Index('ix_event_user_created', 'user_id', 'created_at'),  # user_dashboard listing
+    )
+
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     # owner_id is now a foreign key to User.id. Allowing nullable for legacy/guest events if needed, 
     # but ideally linked to user.
@@ -62,11 +71,14 @@ class Event(db.Model):
     venue_longitude = db.Column(db.Float, nullable=True)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Bumped on every change to the event or its venue; part of the invite page ETag
+    revision = db.Column(db.Integer, nullable=False, default=1)
     
     guests = db.relationship('Guest', backref='event', lazy=True, cascade="all, delete-orphan")
     comments = db.relationship('Comment', backref='event', lazy=True, cascade="all, delete-orphan")
     shares = db.relationship('Share', backref='event', lazy=True, cascade="all, delete-orphan")
     views = db.relationship('View', backref='event', lazy=True, cascade="all, delete-orphan")
+    counters = db.relationship('EventCounter', backref='event', lazy=True, cascade="all, delete-orphan")
 
     def to_dict(self):
         return {
@@ -89,6 +101,11 @@ class Event(db.Model):
         }
 
 class Guest(db.Model):
+    __table_args__ = (
+        db.Index('ix_guest_event_status_name', 'event_id', 'rsvp_status', 'name', 'id'),  # RSVP filters, paged by name
+        db.Index('ix_guest_event_name', 'event_id', 'name', 'id'),  # Guest list pages (keyset on name, id)
+    )
+
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
@@ -123,6 +140,10 @@ class Guest(db.Model):
         }
 
 class Comment(db.Model):
+    __table_args__ = (
+        db.Index('ix_comment_event_created_id', 'event_id', 'created_at', 'id'),  # Newest-first comment pages
+    )
+
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False) # Guest name or User name
@@ -138,16 +159,44 @@ class Comment(db.Model):
         }
 
 class Share(db.Model):
+    __table_args__ = (
+        db.Index('ix_share_event_timestamp', 'event_id', 'timestamp'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
     channel = db.Column(db.String(50)) # whatsapp, linkedin, copy, etc.
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
 class View(db.Model):
+    __table_args__ = (
+        db.Index('ix_view_event_timestamp', 'event_id', 'timestamp'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
+class EventCounter(db.Model):
+    """Activity totals per event, metric and UTC day, maintained alongside the raw rows"""
+    event_id = db.Column(db.String(36), db.ForeignKey('event.id'), primary_key=True)
+    metric = db.Column(db.String(30), primary_key=True)  # views, shares, comments, rsvp_yes, rsvp_no, rsvp_maybe
+    bucket = db.Column(db.Date, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+class UploadBlob(db.Model):
+    """Uploaded file stored once under the SHA-256 of its bytes, however many events use it"""
+    __table_args__ = (
+        db.Index('ix_upload_blob_refs_uploaded', 'ref_count', 'last_uploaded_at'),  # Garbage collection
+    )
+
+    digest = db.Column(db.String(64), primary_key=True)
+    filename = db.Column(db.String(80), nullable=False, unique=True)  # <digest>.<ext> in UPLOAD_FOLDER
+    size = db.Column(db.Integer, nullable=False)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)  # Events whose background_image_url uses it
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)  # Unreferenced blobs get a grace period from here
+
 class Venue(db.Model):
     """Store detailed venue information"""
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
@@ -178,18 +227,44 @@ class Venue(db.Model):
             'accessibility_notes': self.accessibility_notes
         }
 
+@orm_event.listens_for(Event, 'before_update')
+def _bump_event_revision(mapper, connection, target):
+    # Flushes can mark an event dirty without changing a column. Incremented
+    # in SQL, so a venue change in the same session is never overwritten
+    if object_session(target).is_modified(target, include_collections=False):
+        target.revision = Event.__table__.c.revision + 1
+
+@orm_event.listens_for(Venue, 'after_insert')
+@orm_event.listens_for(Venue, 'after_update')
+@orm_event.listens_for(Venue, 'after_delete')
+def _bump_venue_event_revision(mapper, connection, target):
+    connection.execute(
+        update(Event.__table__)
+        .where(Event.__table__.c.id == target.event_id)
+        .values(revision=Event.__table__.c.revision + 1)
+    )
+
 class EmailLog(db.Model):
     """Track sent emails for analytics"""
+    __table_args__ = (
+        db.Index('ix_email_log_event_status', 'event_id', 'status'),
+        db.Index('ix_email_log_job_status', 'job_id', 'status'),  # Outbox batches and job progress
+    )
+
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
     guest_id = db.Column(db.String(36), db.ForeignKey('guest.id'), nullable=True)
     
+    job_id = db.Column(db.String(36), db.ForeignKey('email_job.id'), nullable=True)  # Set for queued bulk sends
+    
     email_type = db.Column(db.String(50), nullable=False)  # invitation, confirmation, reminder
     recipient_email = db.Column(db.String(120), nullable=False)
     sent_at = db.Column(db.DateTime, default=datetime.utcnow)
     opened_at = db.Column(db.DateTime, nullable=True)
     clicked_at = db.Column(db.DateTime, nullable=True)
-    status = db.Column(db.String(20), default='sent')  # sent, delivered, opened, failed
+    status = db.Column(db.String(20), default='sent')  # queued, sending, sent, delivered, opened, failed
+    claimed_at = db.Column(db.DateTime, nullable=True)  # Lease start while a worker is sending
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Outbox send attempts
     
     def to_dict(self):
         return {
@@ -201,15 +276,38 @@ class EmailLog(db.Model):
             'status': self.status
         }
 
+class EmailJob(db.Model):
+    """Bulk email request whose messages are queued as EmailLog rows"""
+    id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
+    event_id = db.Column(db.String(36), db.ForeignKey('event.id'), nullable=False)
+    
+    email_type = db.Column(db.String(50), nullable=False, default='invitation')
+    base_url = db.Column(db.String(255), nullable=False)  # Used to build invitation links in the worker
+    total = db.Column(db.Integer, default=0)  # Guests selected for this job
+    skipped = db.Column(db.Integer, default=0)  # Guests without an email address
+    status = db.Column(db.String(20), default='queued')  # queued, completed
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+    
+    messages = db.relationship('EmailLog', backref='job', lazy=True)
+
 
 class CustomDesign(db.Model):
     """Store custom designs created in Design Studio"""
+    __table_args__ = (
+        db.Index('ix_custom_design_user_updated', 'user_id', 'updated_at'),  # My designs listing
+    )
+
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     user_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=False)
     
     title = db.Column(db.String(200), nullable=False, default='Untitled Design')
-    canvas_data = db.Column(db.Text, nullable=False)  # JSON string of Fabric.js canvas
-    thumbnail_url = db.Column(db.Text, nullable=True)  # Base64 or URL to thumbnail image
+    # zlib-compressed Fabric.js canvas JSON (design_service); deferred so
+    # listings and deletes never load it
+    canvas_gz = db.deferred(db.Column(db.LargeBinary, nullable=False))
+    thumbnail_url = db.Column(db.String(255), nullable=True)  # URL of the thumbnail file in DESIGN_THUMBNAIL_FOLDER
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')  # Bumped on every save; patches are made against it
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -218,13 +316,26 @@ class CustomDesign(db.Model):
     user = db.relationship('User', backref=db.backref('custom_designs', lazy=True))
     
     def to_dict(self):
+        """Listing metadata; load_design adds the canvas"""
         return {
             'id': self.id,
             'user_id': self.user_id,
             'title': self.title,
-            'canvas_data': self.canvas_data,
             'thumbnail_url': self.thumbnail_url,
+            'version': self.version,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
 
+class DesignVersion(db.Model):
+    """One saved version of a design: the JSON patch from the previous one, plus periodic full snapshots"""
+    __table_args__ = (
+        db.UniqueConstraint('design_id', 'version', name='uq_design_version'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    design_id = db.Column(db.String(36), db.ForeignKey('custom_design.id', ondelete='CASCADE'), nullable=False)
+    version = db.Column(db.Integer, nullable=False)
+    patch_gz = db.Column(db.LargeBinary, nullable=True)  # zlib JSON patch from version - 1; None for full saves
+    snapshot_gz = db.Column(db.LargeBinary, nullable=True)  # zlib canvas JSON at this version, every DESIGN_SNAPSHOT_INTERVAL saves
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,275 @@
+"""
+Outbox Service for queued bulk email delivery
+Messages are stored as EmailLog rows and drained by a background worker pool
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import threading
+from flask import current_app
+from sqlalchemy import case, func, or_
+from app import db, email_service
+from app.models import EmailJob, EmailLog, Event, Guest
+
+PENDING_STATUSES = ('queued', 'sending')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor(app):
+    """Create the shared worker pool on first use, sized by EMAIL_WORKERS"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config.get('EMAIL_WORKERS', 4),
+                thread_name_prefix='email-outbox'
+            )
+    return _executor
+
+def init_outbox(app):
+    """
+    Resume jobs left unfinished by a previous process
+
+    Messages whose send lease has expired are queued again, so delivery is
+    at-least-once; messages another live process is sending are left alone.
+
+    Args:
+        app: Flask application
+    """
+    with app.app_context():
+        _requeue_expired(app)
+        job_ids = [row.id for row in EmailJob.query.filter_by(status='queued').with_entities(EmailJob.id)]
+
+    for job_id in job_ids:
+        _dispatch(app, job_id)
+
+def resume_stalled(app, job_id):
+    """
+    Requeue and dispatch a job's messages whose sender stopped mid-send
+
+    Called while a client polls the job, so a job whose worker died is
+    picked up without waiting for the next process start.
+
+    Args:
+        app: Flask application
+        job_id: EmailJob ID
+    """
+    if _requeue_expired(app, job_id):
+        _dispatch(app, job_id)
+
+def _requeue_expired(app, job_id=None):
+    """Queue 'sending' messages past EMAIL_SEND_LEASE again, failing those out of attempts"""
+    expired = datetime.utcnow() - timedelta(seconds=app.config.get('EMAIL_SEND_LEASE', 300))
+    query = EmailLog.query.filter(
+        EmailLog.job_id == job_id if job_id else EmailLog.job_id.isnot(None),
+        EmailLog.status == 'sending',
+        or_(EmailLog.claimed_at.is_(None), EmailLog.claimed_at < expired)
+    )
+    requeued = query.update({
+        'status': case((EmailLog.attempts >= app.config.get('EMAIL_MAX_ATTEMPTS', 3), 'failed'), else_='queued'),
+        'claimed_at': None
+    }, synchronize_session=False)
+    db.session.commit()
+    return requeued
+
+def enqueue_invitations(event, guests, base_url):
+    """
+    Queue invitation emails for delivery by the worker pool
+
+    Args:
+        event: Event object
+        guests: List of Guest objects
+        base_url: Base URL of the application
+
+    Returns:
+        EmailJob: The created job
+    """
+    job = EmailJob(
+        event_id=event.id,
+        email_type='invitation',
+        base_url=base_url,
+        total=len(guests),
+        skipped=0
+    )
+    db.session.add(job)
+    db.session.flush()
+
+    for guest in guests:
+        if not guest.email:
+            job.skipped += 1
+            continue
+
+        db.session.add(EmailLog(
+            event_id=event.id,
+            guest_id=guest.id,
+            job_id=job.id,
+            email_type='invitation',
+            recipient_email=guest.email,
+            status='queued'
+        ))
+
+    db.session.commit()
+    _dispatch(current_app._get_current_object(), job.id)
+    return job
+
+def get_job_progress(job):
+    """
+    Summarise delivery progress for a job
+
+    Args:
+        job: EmailJob object
+
+    Returns:
+        dict: Job status with sent/failed/skipped/pending counts
+    """
+    counts = dict(
+        db.session.query(EmailLog.status, func.count(EmailLog.id))
+        .filter(EmailLog.job_id == job.id)
+        .group_by(EmailLog.status)
+        .all()
+    )
+
+    return {
+        'job_id': job.id,
+        'status': job.status,
+        'total': job.total,
+        'sent': counts.get('sent', 0),
+        'failed': counts.get('failed', 0),
+        'skipped': job.skipped,
+        'pending': sum(counts.get(status, 0) for status in PENDING_STATUSES),
+        'created_at': job.created_at.isoformat(),
+        'completed_at': job.completed_at.isoformat() if job.completed_at else None
+    }
+
+def _dispatch(app, job_id):
+    """Split a job's queued messages into batches and hand them to the pool"""
+    with app.app_context():
+        log_ids = [row.id for row in EmailLog.query.filter_by(job_id=job_id, status='queued').with_entities(EmailLog.id)]
+
+    if not log_ids:
+        with app.app_context():
+            _complete_job_if_done(job_id)
+        return
+
+    batch_size = app.config.get('EMAIL_BATCH_SIZE', 50)
+    executor = _get_executor(app)
+    for start in range(0, len(log_ids), batch_size):
+        executor.submit(_deliver_batch, app, job_id, log_ids[start:start + batch_size])
+
+def _claim(log_id):
+    """Lease a queued message for sending; False if another worker owns it"""
+    claimed = EmailLog.query.filter_by(id=log_id, status='queued').update({
+        'status': 'sending',
+        'claimed_at': datetime.utcnow(),
+        'attempts': EmailLog.attempts + 1
+    }, synchronize_session=False)
+    db.session.commit()
+    return claimed == 1
+
+def _deliver_batch(app, job_id, log_ids, retry=0):
+    """Send one batch of queued messages inside a worker thread"""
+    with app.app_context():
+        in_flight = None
+        progressed = False
+        try:
+            job = EmailJob.query.get(job_id)
+            event = Event.query.get(job.event_id)
+
+            # The whole batch shares one pooled SMTP session and one compiled body
+            templates = email_service.get_event_templates(event)
+            with email_service.get_smtp_pool().connection() as connection:
+                for log_id in log_ids:
+                    if not _claim(log_id):
+                        continue
+                    in_flight = log_id
+
+                    log = EmailLog.query.get(log_id)
+                    guest = Guest.query.get(log.guest_id) if log.guest_id else None
+
+                    sent = False
+                    if guest and guest.email:
+                        invitation_url = f"{job.base_url}/event/{event.id}?guest={guest.unique_token}"
+                        try:
+                            sent = email_service.send_invitation_email(
+                                event, guest, invitation_url, connection=connection,
+                                templates=templates, raise_errors=True
+                            )
+                        except OSError as e:
+                            # Outages and 4xx answers retry the batch, requeueing this
+                            # message until EMAIL_MAX_ATTEMPTS; rejections fail it now
+                            if email_service.is_transient_error(e):
+                                raise
+                            print(f"Error sending email to {guest.email}: {str(e)}")
+
+                    now = datetime.utcnow()
+                    log.status = 'sent' if sent else 'failed'
+                    if sent:
+                        log.sent_at = now
+                        guest.invitation_sent_at = now
+                    log.claimed_at = None
+                    db.session.commit()
+                    in_flight = None
+                    progressed = True
+
+            _complete_job_if_done(job_id)
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error delivering email batch for job {job_id}: {str(e)}")
+            _retry_batch(app, job_id, log_ids, in_flight, retry, progressed)
+        finally:
+            db.session.remove()
+
+def _retry_batch(app, job_id, log_ids, in_flight, retry, progressed=False):
+    """
+    Give a failed batch another go after EMAIL_RETRY_DELAY
+
+    The message being sent when it failed is released back to the queue,
+    or marked failed once it has used EMAIL_MAX_ATTEMPTS. A run that
+    finished any message starts the retry count again, so every message
+    gets its own attempts; after EMAIL_MAX_ATTEMPTS runs without progress
+    the batch's unsent messages are marked failed, so the job still completes.
+    """
+    max_attempts = app.config.get('EMAIL_MAX_ATTEMPTS', 3)
+    try:
+        log = EmailLog.query.get(in_flight) if in_flight else None
+        if log and log.status == 'sending':
+            exhausted = log.attempts >= max_attempts
+            log.status = 'failed' if exhausted else 'queued'
+            log.claimed_at = None
+            progressed = progressed or exhausted
+        # Runs without progress so far, this one included
+        retry = 0 if progressed else retry + 1
+        give_up = retry >= max_attempts
+        if give_up:
+            EmailLog.query.filter(EmailLog.id.in_(log_ids), EmailLog.status == 'queued').update(
+                {'status': 'failed'}, synchronize_session=False
+            )
+        db.session.commit()
+        if give_up:
+            _complete_job_if_done(job_id)
+            return
+    except Exception as e:
+        # Leased messages are requeued once their lease expires
+        db.session.rollback()
+        print(f"Error releasing email batch for job {job_id}: {str(e)}")
+        return
+
+    delay = app.config.get('EMAIL_RETRY_DELAY', 30) * max(retry, 1)
+    timer = threading.Timer(delay, _get_executor(app).submit, (_deliver_batch, app, job_id, log_ids, retry))
+    timer.daemon = True
+    timer.start()
+
+def _complete_job_if_done(job_id):
+    """Close the job once no messages are waiting"""
+    remaining = EmailLog.query.filter(
+        EmailLog.job_id == job_id,
+        EmailLog.status.in_(PENDING_STATUSES)
+    ).count()
+
+    if remaining == 0:
+        job = EmailJob.query.get(job_id)
+        if job and job.status != 'completed':
+            job.status = 'completed'
+            job.completed_at = datetime.utcnow()
+            db.session.commit()
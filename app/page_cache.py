@@ -0,0 +1,94 @@
+"""
+Page Cache for public invitation pages
+Rendered invite pages are kept in memory keyed by event and stored with
+the ETag of the event revision and the code build they were rendered from
+"""
+from collections import OrderedDict
+import hashlib
+import os
+import threading
+from flask import current_app
+
+# Static folders whose files the page layout links to
+BUILD_STATIC_DIRS = ('css', 'js')
+
+def _hash_build(app):
+    sha = hashlib.sha256()
+    folders = [os.path.join(app.root_path, app.template_folder)]
+    folders += [os.path.join(app.static_folder, name) for name in BUILD_STATIC_DIRS]
+    for folder in folders:
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                sha.update(os.path.relpath(path, app.root_path).encode('utf-8') + b'\0')
+                with open(path, 'rb') as f:
+                    sha.update(hashlib.sha256(f.read()).digest())
+    return sha.hexdigest()[:16]
+
+def build_token():
+    """
+    Hash of the templates and the CSS/JS the pages are rendered with
+
+    Part of every page ETag, so a deploy that changes them replaces cached
+    pages and browser copies without any event being edited. It is hashed
+    from file contents, so every worker of a deploy agrees on it; computed
+    once per process unless templates auto-reload.
+    """
+    app = current_app._get_current_object()
+    if app.jinja_env.auto_reload:
+        return _hash_build(app)
+    token = app.extensions.get('page_build_token')
+    if token is None:
+        token = app.extensions['page_build_token'] = _hash_build(app)
+    return token
+
+def page_etag(*parts):
+    """Strong ETag value for the inputs a page was rendered from, plus the build"""
+    parts += (build_token(),)
+    return hashlib.sha256('\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:32]
+
+class PageCache:
+    """
+    LRU of rendered pages, one entry per key
+
+    An entry is only served while its ETag matches the caller's, so a
+    newer revision replaces it instead of needing explicit invalidation.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, etag):
+        """Cached body for key if it was rendered for this ETag, else None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, etag, body):
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+_cache_lock = threading.Lock()
+
+def get_page_cache():
+    """Return the application's invite page cache, creating it on first use"""
+    app = current_app._get_current_object()
+    with _cache_lock:
+        cache = app.extensions.get('page_cache')
+        if cache is None:
+            cache = PageCache(max_entries=app.config.get('INVITE_CACHE_SIZE', 512))
+            app.extensions['page_cache'] = cache
+    return cache
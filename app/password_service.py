@@ -0,0 +1,109 @@
+"""
+Password Service for sign-in and sign-up
+Hashing runs on a small bounded pool, so a burst of logins cannot take every
+request worker's CPU, and stored hashes are upgraded to the configured cost
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Hashes running or waiting for a pool thread
+_slots = None
+
+class HashingBusy(Exception):
+    """Raised when the hashing queue stays full for PASSWORD_HASH_WAIT seconds"""
+
+    def __init__(self, retry_after):
+        super().__init__('Password hashing queue is full')
+        self.retry_after = retry_after
+
+def _get_executor(app):
+    """Create the shared hashing pool on first use, sized by PASSWORD_HASH_WORKERS"""
+    global _executor, _slots
+    with _executor_lock:
+        if _executor is None:
+            workers = app.config.get('PASSWORD_HASH_WORKERS', 2)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+            _slots = threading.BoundedSemaphore(workers + app.config.get('PASSWORD_HASH_QUEUE', 32))
+    return _executor, _slots
+
+def _run(func, *args):
+    """
+    Run a hashing call on the pool and wait for its result
+
+    hashlib's scrypt and pbkdf2 release the GIL, so at most
+    PASSWORD_HASH_WORKERS cores are spent hashing while other requests run.
+    PASSWORD_HASH_WORKERS = 0 hashes inline in the request thread.
+
+    Raises:
+        HashingBusy: No queue slot freed up within PASSWORD_HASH_WAIT seconds
+    """
+    app = current_app._get_current_object()
+    if app.config.get('PASSWORD_HASH_WORKERS', 2) <= 0:
+        return func(*args)
+
+    executor, slots = _get_executor(app)
+    wait = app.config.get('PASSWORD_HASH_WAIT', 2.0)
+    if not slots.acquire(timeout=wait):
+        raise HashingBusy(retry_after=max(1, round(wait)))
+    try:
+        return executor.submit(func, *args).result()
+    finally:
+        slots.release()
+
+@lru_cache(maxsize=8)
+def _method_prefix(method):
+    # werkzeug stores the method with its defaults filled in, e.g.
+    # 'pbkdf2' -> 'pbkdf2:sha256:1000000'; hashing a blank once tells us which
+    return generate_password_hash('', method).split('$', 1)[0]
+
+def hash_method():
+    """The configured werkzeug hashing method, e.g. 'scrypt:32768:8:1'"""
+    return current_app.config.get('PASSWORD_HASH_METHOD') or 'scrypt:32768:8:1'
+
+def needs_rehash(pwhash):
+    """True if a stored hash was made with a method other than the configured one"""
+    return pwhash.split('$', 1)[0] != _method_prefix(hash_method())
+
+def hash_password(password):
+    """
+    Hash a password with the configured method on the hashing pool
+
+    Args:
+        password: Plain-text password
+
+    Returns:
+        str: werkzeug password hash
+
+    Raises:
+        HashingBusy: The hashing queue is full
+    """
+    return _run(generate_password_hash, password, hash_method())
+
+def verify_password(pwhash, password):
+    """
+    Check a password against a stored hash on the hashing pool
+
+    A correct password stored with an outdated method is rehashed with the
+    configured one, for the caller to save on the user.
+
+    Args:
+        pwhash: User.password_hash
+        password: Plain-text password from the login form
+
+    Returns:
+        tuple: (matches, upgraded hash or None)
+
+    Raises:
+        HashingBusy: The hashing queue is full
+    """
+    if not password or not _run(check_password_hash, pwhash, password):
+        return False, None
+    if needs_rehash(pwhash):
+        return True, hash_password(password)
+    return True, None
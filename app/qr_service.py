@@ -0,0 +1,244 @@
+"""
+QR Service for invitation QR codes
+PNGs are content-addressed by a hash of the encoded URL and rendering
+parameters, stored in QR_CODE_FOLDER and kept hot in a bounded memory cache
+"""
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+import qrcode
+from flask import current_app
+from werkzeug.utils import secure_filename
+
+# Rendering parameters; they are part of the cache key, so changing
+# any of them produces new files instead of serving stale ones
+QR_PARAMS = {
+    'version': 1,
+    'error_correction': 'L',
+    'box_size': 10,
+    'border': 4,
+    'fill_color': 'black',
+    'back_color': 'white'
+}
+
+_ERROR_CORRECTION = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H
+}
+
+_KEY_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+def qr_key(url, params=QR_PARAMS):
+    """Content hash identifying the PNG for a URL and parameter set"""
+    material = url + '\0' + '\0'.join(f'{name}={params[name]}' for name in sorted(params))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:32]
+
+def render_qr_png(url, params=QR_PARAMS):
+    """
+    Render a QR code to PNG bytes
+
+    Kept at module level so it can run in a process pool.
+
+    Args:
+        url: Data to encode
+        params: Rendering parameters, see QR_PARAMS
+
+    Returns:
+        bytes: PNG image
+    """
+    qr = qrcode.QRCode(
+        version=params['version'],
+        error_correction=_ERROR_CORRECTION[params['error_correction']],
+        box_size=params['box_size'],
+        border=params['border'],
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color=params['fill_color'], back_color=params['back_color'])
+    output = io.BytesIO()
+    img.save(output)
+    return output.getvalue()
+
+class QRCache:
+    """
+    Disk cache of QR PNGs with an LRU of the most recently served bytes
+
+    Files are named qr_<key>.png, so a URL is only ever rendered once
+    per parameter set and a file never changes after it is written.
+    """
+
+    def __init__(self, folder, max_entries=256):
+        self.folder = folder
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path_for(self, key):
+        return os.path.join(self.folder, f'qr_{key}.png')
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def ensure(self, url, params=QR_PARAMS):
+        """
+        Make sure the PNG for a URL exists, rendering it only on a miss
+
+        Returns:
+            str: Cache key of the PNG
+        """
+        key = qr_key(url, params)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return key
+
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            png = render_qr_png(url, params)
+            os.makedirs(self.folder, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            temp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(png)
+            os.replace(temp_path, path)
+            self._remember(key, (png, os.path.getmtime(path)))
+
+        return key
+
+    def get(self, key):
+        """
+        PNG bytes and modification time for a key
+
+        Returns:
+            tuple: (bytes, mtime) or None if the key was never rendered
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        if not _KEY_PATTERN.fullmatch(key):
+            return None
+
+        path = self.path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = (f.read(), os.path.getmtime(path))
+        except FileNotFoundError:
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+_cache_lock = threading.Lock()
+
+def get_qr_cache():
+    """Return the application's QR cache, creating it on first use"""
+    app = current_app._get_current_object()
+    with _cache_lock:
+        cache = app.extensions.get('qr_cache')
+        if cache is None:
+            cache = QRCache(app.config['QR_CODE_FOLDER'], max_entries=app.config.get('QR_CACHE_SIZE', 256))
+            app.extensions['qr_cache'] = cache
+    return cache
+
+# --- Per-guest batches ---
+# QR rendering is CPU-bound, so guest codes are drawn in worker processes
+# and written into a ZIP that is streamed while it is being built.
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def _get_process_pool(app):
+    """Create the shared render pool on first use, sized by QR_BATCH_WORKERS"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned rather than forked: the app runs background threads
+            # whose locks a forked child could inherit mid-use. Children
+            # re-import __main__, so run.py keeps its startup out of them
+            _process_pool = ProcessPoolExecutor(
+                max_workers=app.config.get('QR_BATCH_WORKERS') or os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+    return _process_pool
+
+def _render_guest_qr(item):
+    """Render one (filename, url) pair in a worker process"""
+    filename, url = item
+    return filename, render_qr_png(url)
+
+class _ZipStream:
+    """Write-only, unseekable sink that hands out what has been written so far"""
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _guest_qr_items(guests, invitation_base):
+    for guest in guests:
+        name = secure_filename(guest.name or '') or 'guest'
+        yield f'{name}_{guest.unique_token[:8]}.png', f'{invitation_base}?guest={guest.unique_token}'
+
+def iter_guest_qr_zip(guests, invitation_base, window=256):
+    """
+    Stream a ZIP with one QR code per guest
+
+    Only one window of guests is rendered ahead of the writer, so memory
+    stays bounded however large the guest list is.
+
+    Args:
+        guests: Iterable of rows with name and unique_token
+        invitation_base: Event invitation URL the guest token is added to
+        window: Guests submitted to the render pool at a time
+
+    Yields:
+        bytes: ZIP archive content
+    """
+    executor = _get_process_pool(current_app._get_current_object())
+    stream = _ZipStream()
+    items = _guest_qr_items(guests, invitation_base)
+
+    # PNG data is already deflated, so entries are stored as-is
+    with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_STORED) as archive:
+        while True:
+            batch = list(islice(items, window))
+            if not batch:
+                break
+
+            for filename, png in executor.map(_render_guest_qr, batch, chunksize=8):
+                archive.writestr(filename, png)
+                yield stream.drain()
+
+    yield stream.drain()
@@ -0,0 +1,266 @@
+"""
+Render Service for server-side invitation images
+Invitations are composed from the template frame and the event's text into
+PNG and PDF files, cached on disk by event id and a hash of what was drawn
+"""
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import urllib.parse
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+from flask import current_app
+from app.template_catalog import get_catalog
+
+try:
+    import cairosvg
+except ImportError:  # Frames fall back to their background fill
+    cairosvg = None
+
+# Bump when the drawing code changes so cached files are re-rendered
+RENDER_VERSION = 1
+
+# A4 portrait at 150 dpi
+PAGE_SIZE = (1240, 1754)
+PAGE_DPI = 150
+MARGIN = 140
+
+FORMATS = {
+    'png': 'image/png',
+    'pdf': 'application/pdf'
+}
+
+LIGHT_TEXT = '#f3f4f6'
+DARK_TEXT = '#1f2937'
+
+_FULL_RECT = re.compile(r'<rect width=["\']100%["\'] height=["\']100%["\'] fill=["\']([^"\']+)["\']')
+_GRADIENT_STOPS = r'<(?:linear|radial)Gradient id=["\']{}["\'].*?</(?:linear|radial)Gradient>'
+_STOP_COLOR = re.compile(r'stop-color=["\']([^"\']+)["\']')
+_SVG_SIZE = re.compile(r'(<svg\b[^>]*?)\swidth=["\'][^"\']*["\']\s+height=["\'][^"\']*["\']')
+
+def _frame_svg(event, template):
+    """SVG markup of the event's frame, or None"""
+    frame = event.background_style or (template or {}).get('frame') or ''
+    if not frame.startswith('data:image/svg+xml'):
+        return None
+    return urllib.parse.unquote(frame.split(',', 1)[1])
+
+def render_fields(event):
+    """
+    Everything that affects the rendered image
+
+    Returns:
+        dict: Template id, title, text, text colour and frame hash
+    """
+    catalog = get_catalog()
+    template = catalog.get(event.template_id)
+    frame = _frame_svg(event, template)
+
+    return {
+        'version': RENDER_VERSION,
+        'template_id': event.template_id,
+        'title': template['title'] if template else event.title,
+        'text': catalog.render_text(template, event) if template else (event.message or ''),
+        'dark': catalog.is_dark(template) if template else False,
+        'frame': hashlib.sha256(frame.encode('utf-8')).hexdigest() if frame else None,
+        'svg_engine': cairosvg is not None
+    }
+
+def content_hash(fields):
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:20]
+
+def _fallback_background(svg):
+    """Approximate a frame by its full-page fill when no SVG engine is installed"""
+    image = Image.new('RGB', PAGE_SIZE, 'white')
+    match = _FULL_RECT.search(svg)
+    if not match:
+        return image
+
+    fill = match.group(1)
+    colors = [fill]
+    if fill.startswith('url(#'):
+        gradient = re.search(_GRADIENT_STOPS.format(re.escape(fill[5:-1])), svg, re.DOTALL)
+        colors = _STOP_COLOR.findall(gradient.group(0)) if gradient else []
+
+    try:
+        colors = [ImageColor.getrgb(color) for color in colors]
+    except ValueError:
+        return image
+    if not colors:
+        return image
+    if len(colors) == 1:
+        image.paste(colors[0], (0, 0, *PAGE_SIZE))
+        return image
+
+    # Top-to-bottom blend between the first and last stop
+    top, bottom = colors[0], colors[-1]
+    draw = ImageDraw.Draw(image)
+    height = PAGE_SIZE[1]
+    for y in range(height):
+        ratio = y / (height - 1)
+        draw.line([(0, y), (PAGE_SIZE[0], y)], fill=tuple(
+            round(top[i] + (bottom[i] - top[i]) * ratio) for i in range(3)
+        ))
+    return image
+
+def _background(svg):
+    if not svg:
+        return Image.new('RGB', PAGE_SIZE, 'white')
+
+    if cairosvg is not None:
+        # Percentage sizes have no viewport to resolve against, so pin the page size
+        sized = _SVG_SIZE.sub(rf'\1 width="{PAGE_SIZE[0]}" height="{PAGE_SIZE[1]}"', svg, count=1)
+        try:
+            png = cairosvg.svg2png(bytestring=sized.encode('utf-8'),
+                                   output_width=PAGE_SIZE[0], output_height=PAGE_SIZE[1])
+            return Image.open(io.BytesIO(png)).convert('RGB')
+        except Exception as e:
+            print(f"Error rasterising frame, using fallback: {str(e)}")
+
+    return _fallback_background(svg)
+
+def _font(size):
+    font_path = current_app.config.get('RENDER_FONT_PATH')
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size=size)
+
+def _wrap(draw, text, font, width):
+    """Break text into lines that fit the page width, keeping blank lines"""
+    lines = []
+    for paragraph in text.split('\n'):
+        words = paragraph.split()
+        if not words:
+            lines.append('')
+            continue
+        line = words[0]
+        for word in words[1:]:
+            candidate = f'{line} {word}'
+            if draw.textlength(candidate, font=font) <= width:
+                line = candidate
+            else:
+                lines.append(line)
+                line = word
+        lines.append(line)
+    return lines
+
+def _compose(event, fields):
+    catalog = get_catalog()
+    template = catalog.get(event.template_id)
+    image = _background(_frame_svg(event, template))
+    draw = ImageDraw.Draw(image)
+    color = LIGHT_TEXT if fields['dark'] else DARK_TEXT
+    width = PAGE_SIZE[0] - 2 * MARGIN
+
+    title_font = _font(72)
+    body_font = _font(44)
+    title_lines = _wrap(draw, fields['title'], title_font, width)
+    body_lines = _wrap(draw, fields['text'], body_font, width)
+
+    title_height = 90 * len(title_lines)
+    body_height = 62 * len(body_lines)
+    y = max(MARGIN, (PAGE_SIZE[1] - title_height - 60 - body_height) // 2)
+
+    for line in title_lines:
+        draw.text((PAGE_SIZE[0] // 2, y), line, font=title_font, fill=color, anchor='ma')
+        y += 90
+    y += 60
+    for line in body_lines:
+        if line:
+            draw.text((PAGE_SIZE[0] // 2, y), line, font=body_font, fill=color, anchor='ma')
+        y += 62
+
+    return image
+
+# Striped locks: a fixed pool shared by event id hash, so memory stays
+# bounded however many events are rendered
+RENDER_LOCK_STRIPES = 64
+_render_locks = tuple(threading.Lock() for _ in range(RENDER_LOCK_STRIPES))
+
+def _lock_for(event_id):
+    return _render_locks[hash(event_id) % RENDER_LOCK_STRIPES]
+
+def _write(image, path, format_type):
+    output = io.BytesIO()
+    if format_type == 'pdf':
+        image.save(output, 'PDF', resolution=PAGE_DPI)
+    else:
+        image.save(output, 'PNG', optimize=True)
+
+    temp_path = f'{path}.{threading.get_ident()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(output.getvalue())
+    os.replace(temp_path, path)
+
+def render_event(event, format_type='png'):
+    """
+    Return the path of the event's rendered invitation, drawing it on a miss
+
+    Args:
+        event: Event object
+        format_type: 'png' or 'pdf'
+
+    Returns:
+        tuple: (file path, whether it came from the cache)
+    """
+    if format_type not in FORMATS:
+        raise ValueError(f"Unsupported format '{format_type}'")
+
+    folder = current_app.config['RENDER_CACHE_FOLDER']
+    fields = render_fields(event)
+    digest = content_hash(fields)
+    path = os.path.join(folder, f'{event.id}_{digest}.{format_type}')
+
+    if os.path.exists(path):
+        return path, True
+
+    # One render per event at a time, so concurrent misses draw it once
+    with _lock_for(event.id):
+        if os.path.exists(path):
+            return path, True
+
+        os.makedirs(folder, exist_ok=True)
+        png_path = os.path.join(folder, f'{event.id}_{digest}.png')
+        composed = not os.path.exists(png_path)
+        if composed:
+            image = _compose(event, fields)
+        else:
+            image = Image.open(png_path).convert('RGB')
+
+        # Drop renders of this event's previous content
+        for stale in glob.glob(os.path.join(folder, f'{event.id}_*')):
+            if not os.path.basename(stale).startswith(f'{event.id}_{digest}.'):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+
+        # Keep the PNG of every composition, so a later PNG or PDF request
+        # for the same content does not draw it again
+        if composed:
+            _write(image, png_path, 'png')
+        if format_type == 'pdf':
+            _write(image, path, 'pdf')
+
+    return path, False
+
+def render_events(events, format_type='png'):
+    """
+    Render several events, skipping any whose output is already cached
+
+    Returns:
+        list: Dicts with event_id, path and cached flag
+    """
+    results = []
+    for event in events:
+        try:
+            path, cached = render_event(event, format_type)
+            results.append({'event_id': event.id, 'path': path, 'cached': cached})
+        except Exception as e:
+            print(f"Error rendering event {event.id}: {str(e)}")
+            results.append({'event_id': event.id, 'path': None, 'cached': False, 'error': str(e)})
+    return results
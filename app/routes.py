@@ -1,14 +1,16 @@
-from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash, send_file, current_app
+from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash, send_file, send_from_directory, current_app, Response, stream_with_context
 import flask
 from app import db, login_manager
-from app.models import Event, Guest, Comment, Share, View, User, Venue, EmailLog
+from app.models import Event, Guest, Comment, User, EmailLog, EmailJob
 from datetime import datetime
 from flask_login import login_user, logout_user, login_required, current_user
-from app import email_service, export_service, venue_service
+from app import email_service, export_service, venue_service, outbox_service, stats_service, counter_service, view_buffer, guest_service, qr_service, render_service, template_catalog, image_service, upload_service, design_service, page_cache, user_cache, password_service, listing_service
 from werkzeug.utils import secure_filename
 import os
 import io
-import uuid
+import hashlib
+import re
+from urllib.parse import quote
 
 
 # Reload check 1
@@ -16,7 +18,8 @@ main = Blueprint('main', __name__)
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(user_id)
+    # Memoised per request and cached for USER_CACHE_TTL seconds
+    return user_cache.load_user(user_id)
 
 # --- View Routes ---
 @main.route('/')
@@ -46,9 +49,21 @@ def login():
         if not user:
             return render_template('login.html', error='No account found with this email address')
         
-        if not user.check_password(password):
+        pwhash = user.password_hash
+        # Hand the pooled connection back while the password hashes
+        db.session.rollback()
+        try:
+            valid, upgraded_hash = password_service.verify_password(pwhash, password)
+        except password_service.HashingBusy as e:
+            return _hashing_busy('login.html', e)
+
+        if not valid:
             return render_template('login.html', error='Incorrect password')
         
+        if upgraded_hash:
+            # Stored with an older PASSWORD_HASH_METHOD
+            user.password_hash = upgraded_hash
+            db.session.commit()
         login_user(user, remember=True)
         return redirect(url_for('main.user_dashboard'))
             
@@ -68,8 +83,14 @@ def signup():
         if User.query.filter_by(email=email).first():
             return render_template('signup.html', error='Email already registered')
             
-        new_user = User(email=email, name=name, phone=phone)
-        new_user.set_password(password)
+        # Hand the pooled connection back while the password hashes
+        db.session.rollback()
+        try:
+            password_hash = password_service.hash_password(password)
+        except password_service.HashingBusy as e:
+            return _hashing_busy('signup.html', e)
+
+        new_user = User(email=email, name=name, phone=phone, password_hash=password_hash)
         db.session.add(new_user)
         db.session.commit()
         
@@ -78,6 +99,14 @@ def signup():
         
     return render_template('signup.html')
 
+def _hashing_busy(template, error):
+    # Too many sign-ins are already hashing; ask the browser to retry shortly
+    response = flask.make_response(render_template(
+        template, error='We are handling a lot of sign-ins right now. Please try again in a moment.'
+    ), 503)
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
 @main.route('/logout')
 @login_required
 def logout():
@@ -103,6 +132,14 @@ def update_profile():
             flash('Email already in use by another account')
             return redirect(url_for('main.profile'))
     
+    current_user.name = name
+    current_user.email = email
+    current_user.phone = phone if phone else None
+    
+    db.session.commit()
+    flash('Profile updated successfully!')
+    return redirect(url_for('main.profile'))
+
 @main.route('/api/download', methods=['POST'])
 def download_file():
     try:
@@ -115,48 +152,39 @@ def download_file():
         safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()
         safe_title = safe_title.replace(' ', '_') or 'invitation'
         
-        # Decode base64 image
+        # Split off the data URI header
         if ',' in image_data:
             header, encoded = image_data.split(',', 1)
         else:
             encoded = image_data
             
         import base64
-        file_bytes = base64.b64decode(encoded)
         
         if format_type == 'png':
             return send_file(
-                io.BytesIO(file_bytes),
+                io.BytesIO(base64.b64decode(encoded)),
                 mimetype='image/png',
                 as_attachment=True,
                 download_name=f"{safe_title}.png"
             )
             
         elif format_type == 'pdf':
-            # Basic Image-to-PDF using FPDF logic (simulated with standard headers implies PDF reader)
-            # Since we can't easily install FPDF, we will send the PNG but wrapped? 
-            # No, user wants PDF. 
-            # Client-side PDF generation is usually better if backend lacks libs.
-            # But we can try to return the bytes with application/pdf if we trust the client to generate it?
-            # NO. The client ALREADY generated the image.
-            # We will stick to Client-Side for PDF generation logic, 
-            # OR we simply cannot make a PDF without a lib.
-            # Wait, we can use the "img2pdf" trick if installed?
-            # Let's check imports.
-            # If no lib, we might have to revert to client-side-download for PDF,
-            # BUT relay it through the server to get the filename right.
-            # Actually, standard PDF requires a generator.
-            # Let's handle PNG and DOC (Word) here specially.
-            
-            # For this specific "Fix", we will assume the Client generates the PDF blob and sends it?
-            # No, sending large blobs is heavy.
-            pass
+            # Wrap the captured image in a single-page PDF
+            from PIL import Image
+            image = Image.open(io.BytesIO(base64.b64decode(encoded))).convert('RGB')
+            output = io.BytesIO()
+            image.save(output, 'PDF', resolution=150)
+            output.seek(0)
+            return send_file(
+                output,
+                mimetype='application/pdf',
+                as_attachment=True,
+                download_name=f"{safe_title}.pdf"
+            )
 
         elif format_type == 'word':
             # Embed Image in Word-compatible HTML
-            # This logic is extremely robust for "Opening" in Word.
-            img_b64 = base64.b64encode(file_bytes).decode('utf-8')
-            
+            # The upload is already base64, so it is embedded as received
             doc_content = f"""
             <html xmlns:o='urn:schemas-microsoft-com:office:office' xmlns:w='urn:schemas-microsoft-com:office:word' xmlns='http://www.w3.org/TR/REC-html40'>
             <head>
@@ -166,7 +194,7 @@ def download_file():
             <body>
                 <div style="text-align: center; width: 100%;">
                     <!-- Standard Word-compatible Image Embed -->
-                    <img src="data:image/png;base64,{img_b64}" style="width:100%; max-width:650px; height:auto;">
+                    <img src="data:image/png;base64,{encoded}" style="width:100%; max-width:650px; height:auto;">
                 </div>
             </body>
             </html>
@@ -184,13 +212,6 @@ def download_file():
         return jsonify({'error': str(e)}), 500
         
     return jsonify({'error': 'Invalid format'}), 400
-    current_user.name = name
-    current_user.email = email
-    current_user.phone = phone if phone else None
-    
-    db.session.commit()
-    flash('Profile updated successfully!')
-    return redirect(url_for('main.profile'))
 
 @main.route('/dashboard')
 @login_required
@@ -201,14 +222,90 @@ def user_dashboard():
     events = Event.query.filter_by(user_id=current_user.id).order_by(Event.created_at.desc()).all()
     return render_template('user_dashboard.html', events=events)
 
+def _render_invite(event):
+    # Only this event's template goes to the page, with its text already filled in
+    catalog = template_catalog.get_catalog()
+    template = catalog.get(event.template_id)
+    return render_template(
+        'invite.html',
+        event=event,
+        template=catalog.summary(template) if template else None,
+        invitation_text=catalog.render_text(template, event) if template else (event.message or ''),
+        frame_url=_frame_url(catalog, event.template_id)
+    )
+
 @main.route('/event/<event_id>')
 def view_event(event_id):
-    # Record view
+    revision = db.session.query(Event.revision).filter_by(id=event_id).scalar()
+    if revision is None:
+        flask.abort(404)
+    # Record view; written in bulk by the view buffer, off the request path.
+    # Counted before any cache check, so 304s and cached pages count too
+    view_buffer.record_view(event_id)
+    
+    # Only visitors without a session share cached pages: a session can
+    # carry a login, flashes or a CSRF token that would end up in the page
+    if current_app.config['SESSION_COOKIE_NAME'] in request.cookies:
+        return _render_invite(Event.query.get_or_404(event_id))
+    
+    catalog_version = template_catalog.get_catalog().version
+    etag = page_cache.page_etag(event_id, revision, catalog_version)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        cache = page_cache.get_page_cache()
+        body = cache.get(event_id, etag)
+        if body is None:
+            event = Event.query.get_or_404(event_id)
+            # The row may have moved on since the revision lookup
+            etag = page_cache.page_etag(event_id, event.revision, catalog_version)
+            body = _render_invite(event)
+            # A render that wrote to the session (e.g. a new CSRF token) is
+            # specific to this visitor
+            if not flask.session.modified:
+                cache.put(event_id, etag, body)
+        response = Response(body, mimetype='text/html')
+    
+    response.set_etag(etag)
+    # Browsers revalidate every time, so each visit still reaches the view counter
+    response.cache_control.no_cache = True
+    return response
+
+@main.route('/event/<event_id>/invitation.<format_type>')
+def render_invitation(event_id, format_type):
+    """Server-rendered invitation as PNG or PDF, cached until the event changes"""
     event = Event.query.get_or_404(event_id)
-    new_view = View(event_id=event_id)
-    db.session.add(new_view)
-    db.session.commit()
-    return render_template('invite.html', event=event)
+    if format_type not in render_service.FORMATS:
+        return jsonify({'error': 'Invalid format. Use png or pdf'}), 400
+    
+    path, _ = render_service.render_event(event, format_type)
+    safe_title = secure_filename(event.title) or 'invitation'
+    return send_file(
+        path,
+        mimetype=render_service.FORMATS[format_type],
+        as_attachment=request.args.get('download') == '1',
+        download_name=f'{safe_title}.{format_type}',
+        conditional=True
+    )
+
+@main.route('/api/my-events/render', methods=['POST'])
+@login_required
+def render_my_events():
+    """Render every event of the current user; cached ones are not redrawn"""
+    format_type = (request.json or {}).get('format', 'png')
+    if format_type not in render_service.FORMATS:
+        return jsonify({'error': 'Invalid format. Use png or pdf'}), 400
+    
+    results = render_service.render_events(current_user.events, format_type)
+    return jsonify([
+        {
+            'event_id': result['event_id'],
+            'url': url_for('main.render_invitation', event_id=result['event_id'], format_type=format_type) if result['path'] else None,
+            'cached': result['cached'],
+            'error': result.get('error')
+        }
+        for result in results
+    ])
 
 @main.route('/dashboard/<event_id>')
 @login_required
@@ -226,12 +323,131 @@ def delete_event(event_id):
     # Ensure user can only delete their own events
     if event.user_id != current_user.id:
         return flask.redirect(flask.url_for('main.user_dashboard'))
+    upload_service.release(event.background_image_url)
     db.session.delete(event)
     db.session.commit()
+    page_cache.get_page_cache().discard(event_id)
     return flask.redirect(flask.url_for('main.user_dashboard'))
 
 # --- API Routes ---
 
+# --- Template Catalog ---
+
+TEMPLATE_PAGE_SIZE = 24
+
+def _catalog_response(payload, etag, max_age=300):
+    """JSON with a strong ETag; answers 304 when the client already has it"""
+    response = jsonify(payload)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+def _split_arg(name):
+    return [value for value in request.args.get(name, '').split(',') if value]
+
+def _frame_url(catalog, template_id):
+    """Hashed frame asset when built, otherwise the frame decoded on request"""
+    asset = catalog.frame_assets.get(template_id)
+    if asset:
+        return url_for('main.frame_asset', filename=asset)
+    if template_id in catalog.frames:
+        return url_for('main.template_frame', template_id=template_id)
+    return None
+
+@main.route('/api/templates', methods=['GET'])
+def list_templates():
+    """Paginated template metadata, filtered by category, style and search text"""
+    catalog = template_catalog.get_catalog()
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', TEMPLATE_PAGE_SIZE, type=int), 1), 100)
+    
+    results = catalog.search(
+        categories=_split_arg('category'),
+        styles=_split_arg('style'),
+        query=request.args.get('q', '').strip(),
+        sort=request.args.get('sort', 'popular')
+    )
+    start = (page - 1) * per_page
+    templates = []
+    for template in results[start:start + per_page]:
+        summary = catalog.summary(template)
+        summary['frame_url'] = _frame_url(catalog, template['id'])
+        templates.append(summary)
+    
+    # Same catalog and same query always give the same body
+    query = '&'.join(f'{key}={value}' for key, value in sorted(request.args.items(multi=True)))
+    etag = hashlib.sha256(f'{catalog.version}?{query}'.encode('utf-8')).hexdigest()[:32]
+    
+    return _catalog_response({
+        'templates': templates,
+        'total': len(results),
+        'page': page,
+        'per_page': per_page,
+        'pages': (len(results) + per_page - 1) // per_page,
+        'categories': catalog.categories,
+        'styles': catalog.styles
+    }, etag)
+
+@main.route('/api/templates/<template_id>', methods=['GET'])
+def get_template(template_id):
+    """One template with its text; ?include=frame adds the frame data URI"""
+    catalog = template_catalog.get_catalog()
+    template = catalog.get(template_id)
+    if template is None:
+        return jsonify({'error': 'Template not found'}), 404
+    
+    include_frame = request.args.get('include') == 'frame'
+    payload = catalog.summary(template)
+    payload['text'] = template['text']
+    payload['frame_url'] = _frame_url(catalog, template_id)
+    if include_frame:
+        payload['frame'] = template.get('frame') or ''
+    
+    etag = f"{catalog.version}-{template_id}{'-frame' if include_frame else ''}"
+    return _catalog_response(payload, etag)
+
+@main.route('/api/templates/<template_id>/frame.svg', methods=['GET'])
+def template_frame(template_id):
+    """A template's frame as plain SVG, cached separately from the listing"""
+    frame = template_catalog.get_catalog().frames.get(template_id)
+    if frame is None:
+        return jsonify({'error': 'Frame not found'}), 404
+    
+    svg, etag = frame
+    response = Response(svg, mimetype='image/svg+xml')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response.make_conditional(request)
+
+FRAME_ASSET_PATTERN = re.compile(r'[0-9a-f]{16}\.svg')
+
+@main.route('/frames/<filename>', methods=['GET'])
+def frame_asset(filename):
+    """Built frame files; names are content hashes, so they are cached forever"""
+    folder = current_app.config['FRAME_ASSET_FOLDER']
+    if filename == 'manifest.json':
+        return send_from_directory(folder, filename, max_age=300)
+    if not FRAME_ASSET_PATTERN.fullmatch(filename):
+        return jsonify({'error': 'Frame not found'}), 404
+    
+    # Serve the precompressed sibling the client accepts, best first
+    encoding = None
+    for candidate, extension in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings[candidate] and os.path.exists(os.path.join(folder, filename + extension)):
+            encoding = candidate
+            filename += extension
+            break
+    
+    response = send_from_directory(folder, filename, mimetype='image/svg+xml', max_age=31536000)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
 @main.route('/api/upload', methods=['POST'])
 @login_required
 def upload_file():
@@ -241,23 +457,55 @@ def upload_file():
     if file.filename == '':
         return jsonify({'error': 'No selected file'}), 400
     
+    extension = file.filename.rsplit('.', 1)[-1].lower() if '.' in file.filename else ''
+    if extension not in current_app.config['ALLOWED_EXTENSIONS'] or not image_service.is_image(file.stream):
+        return jsonify({'error': 'Only image files are allowed'}), 400
+    
     if file:
-        filename = secure_filename(file.filename)
-        # Unique filename to avoid collisions
-        unique_filename = f"{uuid.uuid4().hex}_{filename}"
-        
         upload_folder = current_app.config['UPLOAD_FOLDER']
-        if not os.path.exists(upload_folder):
-            os.makedirs(upload_folder)
-            
-        file.save(os.path.join(upload_folder, unique_filename))
         
-        # Return URL
-        url = url_for('static', filename=f'uploads/{unique_filename}')
-        return jsonify({'url': url}), 200
+        # Stored once under its content hash; re-uploads reuse the file
+        blob, created = upload_service.save_upload(file.stream, extension, upload_folder)
+        db.session.commit()
+        
+        # Resized variants are produced off the request thread, once per file
+        path = os.path.join(upload_folder, blob.filename)
+        if created or not image_service.pick_variant(upload_folder, blob.filename)[1]:
+            image_service.submit(current_app._get_current_object(), path)
+        
+        # Return URL; /media/ serves the best variant once it is ready
+        return jsonify({
+            'url': url_for('main.upload_media', filename=blob.filename),
+            'original_url': url_for('main.upload_media', filename=blob.filename, full=1)
+        }), 200
     
     return jsonify({'error': 'Upload failed'}), 500
 
+@main.route('/media/<filename>', methods=['GET'])
+def upload_media(filename):
+    """An uploaded image at the size the page asks for (?w=<px>, ?thumb=1, ?full=1)"""
+    folder = current_app.config['UPLOAD_FOLDER']
+    filename = secure_filename(filename)
+    if not os.path.isfile(os.path.join(folder, filename)):
+        return jsonify({'error': 'Image not found'}), 404
+    
+    name, processed = image_service.pick_variant(
+        folder,
+        filename,
+        width=request.args.get('w', type=int),
+        thumbnail=request.args.get('thumb') == '1',
+        webp='image/webp' in request.headers.get('Accept', ''),
+        full=request.args.get('full') == '1'
+    )
+    
+    # Variants never change; the original is only served until they exist
+    response = send_from_directory(folder, name, max_age=31536000 if processed else 60)
+    response.vary.add('Accept')
+    return response
+
+main.add_app_template_global(image_service.media_url, 'upload_media_url')
+main.add_app_template_global(image_service.media_srcset, 'upload_srcset')
+
 @main.route('/api/events', methods=['POST'])
 @login_required
 def create_event():
@@ -282,6 +530,7 @@ def create_event():
         venue_longitude=data.get('venue_longitude')
     )
     db.session.add(new_event)
+    upload_service.retain(new_event.background_image_url)
     db.session.commit()
     return jsonify(new_event.to_dict()), 201
 
@@ -300,35 +549,49 @@ def handle_guests(event_id):
             # Fallback to single guest
             guests_data = [data]
         
-        created_guests = []
-        for g_data in guests_data:
-            new_guest = Guest(
-                event_id=event_id,
-                name=g_data.get('name'),
-                email=g_data.get('email'),
-                phone=g_data.get('phone')
-            )
-            db.session.add(new_guest)
-            created_guests.append(new_guest)
-        
+        if any(not g_data.get('name') for g_data in guests_data):
+            return jsonify({'error': 'Guest name is required'}), 400
+
+        # ?return=count skips serialising every created guest
+        counts_only = request.args.get('return') == 'count'
+        count, created_guests = guest_service.bulk_insert_guests(event_id, guests_data, collect=not counts_only)
         db.session.commit()
-        return jsonify([g.to_dict() for g in created_guests]), 201
+
+        if counts_only:
+            return jsonify({'count': count}), 201
+        return jsonify(created_guests), 201
     else:
-        # GET all guests for event
-        guests = Guest.query.filter_by(event_id=event_id).all()
-        return jsonify([g.to_dict() for g in guests])
+        # One keyset page, ordered by name; ?cursor= comes from next_cursor
+        sent = request.args.get('sent')
+        try:
+            guests, next_cursor = listing_service.list_guests(
+                event_id,
+                cursor=request.args.get('cursor'),
+                limit=_page_size(),
+                fields=_split_arg('fields'),
+                statuses=_split_arg('status'),
+                name_prefix=request.args.get('q', '').strip(),
+                sent=None if sent is None else sent.lower() in ('1', 'true', 'yes')
+            )
+        except listing_service.ListingError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify({'guests': guests, 'next_cursor': next_cursor})
 
 @main.route('/api/events/<event_id>/rsvp', methods=['POST'])
 def rsvp(event_id):
     data = request.json
     guest_id = data.get('guest_id') # Optional if using token
     token = data.get('token')
+    plus_ones = _plus_one_count(data.get('plus_one_count'))
+    if plus_ones is None:
+        return jsonify({'error': 'plus_one_count must be a whole number, 0 or more'}), 400
     
+    # Only this event's guests; another event's guest would move its counters here
     guest = None
     if token:
-        guest = Guest.query.filter_by(unique_token=token).first()
+        guest = Guest.query.filter_by(unique_token=token, event_id=event_id).first()
     elif guest_id:
-        guest = Guest.query.get(guest_id)
+        guest = Guest.query.filter_by(id=guest_id, event_id=event_id).first()
         
     if not guest:
         # Allow anonymous RSVP or create new guest functionality could go here
@@ -338,23 +601,93 @@ def rsvp(event_id):
     # Get event for email
     event = Event.query.get_or_404(event_id)
     
-    # Update guest information
+    _apply_rsvp(guest, data, plus_ones)
+    db.session.commit()
+    
+    _send_rsvp_confirmation(event, guest)
+    
+    return jsonify({'message': 'RSVP updated', 'guest': guest.to_dict()})
+
+RSVP_STATUSES = ('Yes', 'No', 'Maybe')
+
+def _plus_one_count(value):
+    """plus_one_count from a request as a non-negative int, 0 when absent, None if invalid"""
+    if value is None or value == '':
+        return 0
+    if isinstance(value, bool):
+        return None
+    try:
+        count = int(value) if isinstance(value, int) else int(str(value).strip())
+    except ValueError:
+        return None
+    return count if count >= 0 else None
+
+def _apply_rsvp(guest, data, plus_ones):
+    """Record a guest's response and its counter change on the guest's event; the caller commits"""
+    counter_service.record_rsvp_change(guest.event_id, guest.rsvp_status, data.get('status'))
     guest.rsvp_status = data.get('status') # Yes, No, Maybe
-    guest.plus_one_count = data.get('plus_one_count', 0)
+    guest.plus_one_count = plus_ones
     guest.notes = data.get('notes', '')
     guest.dietary_restrictions = data.get('dietary_restrictions', '')
     guest.rsvp_time = datetime.utcnow()
-    
-    db.session.commit()
-    
+
+def _send_rsvp_confirmation(event, guest):
     # Send confirmation email if guest has email
     if guest.email:
         try:
             email_service.send_rsvp_confirmation_email(event, guest)
         except Exception as e:
             print(f"Failed to send confirmation email: {str(e)}")
+
+@main.route('/api/events/<event_id>/rsvp/submit', methods=['POST'])
+def submit_rsvp(event_id):
+    """
+    RSVP from the invite page in one request and one transaction
     
-    return jsonify({'message': 'RSVP updated', 'guest': guest.to_dict()})
+    The guest is found by their invitation token or created by name, then
+    the response and an optional comment are written together.
+    """
+    data = request.json or {}
+    status = data.get('status')
+    if status not in RSVP_STATUSES:
+        return jsonify({'error': f"status must be one of {', '.join(RSVP_STATUSES)}"}), 400
+    plus_ones = _plus_one_count(data.get('plus_one_count'))
+    if plus_ones is None:
+        return jsonify({'error': 'plus_one_count must be a whole number, 0 or more'}), 400
+    
+    event = Event.query.get_or_404(event_id)
+    
+    guest = None
+    token = data.get('token')
+    if token:
+        guest = Guest.query.filter_by(unique_token=token, event_id=event_id).first()
+    
+    created = guest is None
+    if created:
+        name = (data.get('name') or '').strip()
+        if not name:
+            return jsonify({'error': 'Guest name is required'}), 400
+        guest = Guest(event_id=event_id, name=name[:100], email=data.get('email') or None)
+        db.session.add(guest)
+    
+    _apply_rsvp(guest, data, plus_ones)
+    
+    comment = None
+    content = (data.get('comment') or '').strip()
+    if content:
+        comment = Comment(event_id=event_id, name=guest.name, content=content)
+        db.session.add(comment)
+        counter_service.increment(event_id, 'comments')
+    
+    db.session.commit()
+    
+    _send_rsvp_confirmation(event, guest)
+    
+    return jsonify({
+        'message': 'RSVP recorded',
+        'guest': guest.to_dict(),
+        'comment': comment.to_dict() if comment else None
+    }), 201 if created else 200
 
 @main.route('/api/events/<event_id>/comments', methods=['GET', 'POST'])
 def handle_comments(event_id):
@@ -366,30 +699,37 @@ def handle_comments(event_id):
             content=data.get('content')
         )
         db.session.add(new_comment)
+        counter_service.increment(event_id, 'comments')
         db.session.commit()
         return jsonify(new_comment.to_dict()), 201
     else:
-        comments = Comment.query.filter_by(event_id=event_id).order_by(Comment.created_at.desc()).all()
-        return jsonify([c.to_dict() for c in comments])
+        # One keyset page, newest first; ?cursor= comes from next_cursor
+        try:
+            comments, next_cursor = listing_service.list_comments(
+                event_id,
+                cursor=request.args.get('cursor'),
+                limit=_page_size(),
+                fields=_split_arg('fields')
+            )
+        except listing_service.ListingError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify({'comments': comments, 'next_cursor': next_cursor})
+
+LIST_PAGE_SIZE = 50
+
+def _page_size():
+    return min(max(request.args.get('per_page', LIST_PAGE_SIZE, type=int), 1), 200)
 
 @main.route('/api/events/<event_id>/dashboard_stats', methods=['GET'])
 def get_dashboard_stats(event_id):
-    event = Event.query.get_or_404(event_id)
-    total_guests = Guest.query.filter_by(event_id=event_id).count()
-    yes_count = Guest.query.filter_by(event_id=event_id, rsvp_status='Yes').count()
-    maybe_count = Guest.query.filter_by(event_id=event_id, rsvp_status='Maybe').count()
-    no_count = Guest.query.filter_by(event_id=event_id, rsvp_status='No').count()
-    views_count = View.query.filter_by(event_id=event_id).count()
-    comments_count = Comment.query.filter_by(event_id=event_id).count()
-    
-    return jsonify({
-        'total_guests': total_guests,
-        'rsvp_yes': yes_count,
-        'rsvp_maybe': maybe_count,
-        'rsvp_no': no_count,
-        'views': views_count,
-        'comments': comments_count
-    })
+    Event.query.get_or_404(event_id)
+    return jsonify(stats_service.get_dashboard_stats(event_id))
+
+@main.route('/api/metrics/view-buffer', methods=['GET'])
+@login_required
+def view_buffer_metrics():
+    """Pending, flushed and dropped page views in this process"""
+    return jsonify(view_buffer.get_view_buffer().stats())
 
 # --- Professional Features API Endpoints ---
 
@@ -441,30 +781,27 @@ def import_guests(event_id):
         return jsonify({'error': 'Only CSV files are supported'}), 400
     
     try:
-        # Import guests from CSV
-        guests_data = export_service.import_guests_from_csv(file)
-        
-        # Create guest records
-        created_guests = []
-        for guest_data in guests_data:
-            new_guest = Guest(
-                event_id=event_id,
-                name=guest_data['name'],
-                email=guest_data.get('email'),
-                phone=guest_data.get('phone'),
-                dietary_restrictions=guest_data.get('dietary_restrictions'),
-                notes=guest_data.get('notes')
-            )
-            db.session.add(new_guest)
-            created_guests.append(new_guest)
+        # Stream rows from the upload straight into chunked bulk inserts;
+        # invalid rows are collected and skipped instead of failing the file
+        row_errors = []
+        guests_data = export_service.import_guests_from_csv(file, errors=row_errors)
         
+        counts_only = request.args.get('return') == 'count'
+        count, created_guests = guest_service.bulk_insert_guests(event_id, guests_data, collect=not counts_only)
         db.session.commit()
         
-        return jsonify({
-            'message': f'Successfully imported {len(created_guests)} guests',
-            'count': len(created_guests),
-            'guests': [g.to_dict() for g in created_guests]
-        }), 201
+        message = f'Successfully imported {count} guests'
+        if row_errors:
+            message += f', skipped {len(row_errors)} invalid rows'
+        result = {
+            'message': message,
+            'count': count,
+            'skipped': len(row_errors),
+            'errors': row_errors[:100]
+        }
+        if not counts_only:
+            result['guests'] = created_guests
+        return jsonify(result), 201
         
     except Exception as e:
         db.session.rollback()
@@ -481,7 +818,7 @@ def export_guests(event_id):
         return jsonify({'error': 'Unauthorized'}), 403
     
     format_type = request.args.get('format', 'excel')
-    guests = Guest.query.filter_by(event_id=event_id).all()
+    guests = export_service.iter_guest_export_rows(event_id)
     
     if format_type == 'excel':
         output = export_service.export_guests_to_excel(event, guests)
@@ -492,18 +829,23 @@ def export_guests(event_id):
             download_name=f'{event.title}_guests.xlsx'
         )
     elif format_type == 'csv':
-        csv_content = export_service.export_guests_to_csv(guests)
-        output = io.BytesIO(csv_content.encode('utf-8'))
-        output.seek(0)
-        return send_file(
-            output,
+        # Rows are written as they come off the cursor
+        return Response(
+            stream_with_context(export_service.export_guests_to_csv(guests)),
             mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'{event.title}_guests.csv'
+            headers={'Content-Disposition': _attachment_disposition(f'{event.title}_guests.csv')}
         )
     else:
         return jsonify({'error': 'Invalid format. Use excel or csv'}), 400
 
+def _attachment_disposition(download_name):
+    """Content-Disposition for a streamed download, as send_file would set it"""
+    try:
+        download_name.encode('ascii')
+        return 'attachment; filename="{}"'.format(download_name.replace('"', '\\"'))
+    except UnicodeEncodeError:
+        return f"attachment; filename*=UTF-8''{quote(download_name)}"
+
 @main.route('/api/events/<event_id>/qrcode', methods=['GET'])
 @login_required
 def generate_qrcode(event_id):
@@ -518,19 +860,57 @@ def generate_qrcode(event_id):
     base_url = request.url_root.rstrip('/')
     invitation_url = f"{base_url}/event/{event_id}"
     
-    # Generate QR code
-    qr_folder = current_app.config['QR_CODE_FOLDER']
-    qr_path = export_service.generate_qr_code(invitation_url, event_id, qr_folder)
+    # Rendered once per URL; later calls only hash the URL
+    qr_key = qr_service.get_qr_cache().ensure(invitation_url)
     
-    if qr_path:
-        # Return relative path for frontend
-        qr_filename = os.path.basename(qr_path)
-        return jsonify({
-            'qr_code_url': f'/static/qrcodes/{qr_filename}',
-            'invitation_url': invitation_url
-        })
-    else:
-        return jsonify({'error': 'Failed to generate QR code'}), 500
+    return jsonify({
+        'qr_code_url': url_for('main.qrcode_image', key=qr_key),
+        'invitation_url': invitation_url
+    })
+
+@main.route('/api/events/<event_id>/guests/qrcodes.zip', methods=['GET'])
+@login_required
+def guest_qrcodes_zip(event_id):
+    """Download one check-in QR code per guest as a ZIP"""
+    event = Event.query.get_or_404(event_id)
+    
+    # Verify ownership
+    if event.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    invitation_base = f"{request.url_root.rstrip('/')}/event/{event_id}"
+    guests = (
+        db.session.query(Guest.name, Guest.unique_token)
+        .filter(Guest.event_id == event_id)
+        .execution_options(yield_per=1000)
+    )
+    
+    # The archive is sent while the worker processes are still drawing codes
+    return Response(
+        stream_with_context(qr_service.iter_guest_qr_zip(guests, invitation_base)),
+        mimetype='application/zip',
+        headers={'Content-Disposition': _attachment_disposition(f'{event.title}_guest_qrcodes.zip')}
+    )
+
+@main.route('/qrcodes/<key>.png', methods=['GET'])
+def qrcode_image(key):
+    """Serve a cached QR code; the key is a content hash, so it never changes"""
+    entry = qr_service.get_qr_cache().get(key)
+    if entry is None:
+        return jsonify({'error': 'QR code not found'}), 404
+    
+    png, modified = entry
+    response = send_file(
+        io.BytesIO(png),
+        mimetype='image/png',
+        etag=key,
+        last_modified=modified,
+        max_age=31536000,
+        conditional=True
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 @main.route('/api/events/<event_id>/send-invitations', methods=['POST'])
 @login_required
@@ -549,40 +929,44 @@ def send_invitations(event_id):
     if guest_ids:
         guests = Guest.query.filter(Guest.id.in_(guest_ids), Guest.event_id == event_id).all()
     else:
-        # Send to all guests with email addresses who haven't been sent invitations
+        # Send to all guests with email addresses who haven't been sent or queued invitations
+        queued_guest_ids = db.session.query(EmailLog.guest_id).filter(
+            EmailLog.event_id == event_id,
+            EmailLog.status.in_(outbox_service.PENDING_STATUSES)
+        )
         guests = Guest.query.filter_by(event_id=event_id).filter(
             Guest.email.isnot(None),
-            Guest.invitation_sent_at.is_(None)
+            Guest.invitation_sent_at.is_(None),
+            Guest.id.notin_(queued_guest_ids)
         ).all()
     
     if not guests:
         return jsonify({'message': 'No guests to send invitations to'}), 200
     
-    # Send emails
+    # Queue emails; the outbox workers deliver them in the background
     base_url = request.url_root.rstrip('/')
-    stats = email_service.send_bulk_invitations(event, guests, base_url)
+    job = outbox_service.enqueue_invitations(event, guests, base_url)
     
-    # Update invitation_sent_at for successfully sent emails
-    for guest in guests:
-        if guest.email:
-            guest.invitation_sent_at = datetime.utcnow()
-            
-            # Log email
-            email_log = EmailLog(
-                event_id=event_id,
-                guest_id=guest.id,
-                email_type='invitation',
-                recipient_email=guest.email,
-                status='sent'
-            )
-            db.session.add(email_log)
+    return jsonify({
+        'message': 'Invitations queued',
+        'job_id': job.id,
+        'stats': outbox_service.get_job_progress(job)
+    }), 202
+
+@main.route('/api/events/<event_id>/send-invitations/<job_id>', methods=['GET'])
+@login_required
+def send_invitations_status(event_id, job_id):
+    """Report delivery progress of a queued invitation job"""
+    event = Event.query.get_or_404(event_id)
     
-    db.session.commit()
+    # Verify ownership
+    if event.user_id != current_user.id:
+        return jsonify({'error': 'Unauthorized'}), 403
     
-    return jsonify({
-        'message': 'Invitations sent',
-        'stats': stats
-    })
+    job = EmailJob.query.filter_by(id=job_id, event_id=event_id).first_or_404()
+    if job.status != 'completed':
+        outbox_service.resume_stalled(current_app._get_current_object(), job.id)
+    return jsonify(outbox_service.get_job_progress(job))
 
 @main.route('/api/events/<event_id>/statistics', methods=['GET'])
 @login_required
@@ -594,15 +978,7 @@ def get_event_statistics(event_id):
     if event.user_id != current_user.id:
         return jsonify({'error': 'Unauthorized'}), 403
     
-    guests = Guest.query.filter_by(event_id=event_id).all()
-    stats = export_service.get_event_statistics(event, guests)
-    
-    # Add email statistics
-    email_logs = EmailLog.query.filter_by(event_id=event_id).all()
-    stats['emails_sent'] = len(email_logs)
-    stats['emails_opened'] = sum(1 for log in email_logs if log.opened_at)
-    
-    return jsonify(stats)
+    return jsonify(stats_service.get_event_statistics(event_id))
 
 @main.route('/api/rsvp/<guest_id>/dietary', methods=['PUT'])
 def update_dietary_restrictions(guest_id):
@@ -627,40 +1003,77 @@ def design_editor():
 @main.route('/api/save-design', methods=['POST'])
 @login_required
 def save_design():
-    """Save custom design to database"""
+    """
+    Save custom design to database
+    
+    Updates send either the full canvas_data or a JSON patch made against
+    base_version; a stale base_version is answered with 409.
+    """
     try:
         data = request.json
-        from app.models import CustomDesign
+        from app.models import CustomDesign, generate_uuid
+        config = current_app.config
         
         # Check if updating existing design
         design_id = data.get('id')
+        old_thumbnail = None
         if design_id:
-            design = CustomDesign.query.get(design_id)
+            query = CustomDesign.query
+            if data.get('patch') is not None:
+                query = query.options(db.undefer(CustomDesign.canvas_gz))
+            design = query.filter_by(id=design_id).first()
             if design and design.user_id == current_user.id:
                 design.title = data.get('title', design.title)
-                design.canvas_data = data.get('canvas_data')
-                design.thumbnail_url = data.get('thumbnail')
-                design.updated_at = datetime.utcnow()
+                old_thumbnail = design.thumbnail_url
+                design_service.save_canvas(
+                    design,
+                    canvas_json=data.get('canvas_data'),
+                    patch=data.get('patch'),
+                    base_version=data.get('base_version'),
+                    snapshot_interval=config['DESIGN_SNAPSHOT_INTERVAL'],
+                    history_limit=config['DESIGN_HISTORY_LIMIT']
+                )
             else:
                 return jsonify({'success': False, 'error': 'Design not found or unauthorized'}), 403
         else:
-            # Create new design
+            # Create new design; the id is needed up front for the thumbnail name
             design = CustomDesign(
+                id=generate_uuid(),
                 user_id=current_user.id,
-                title=data.get('title', 'Untitled Design'),
-                canvas_data=data.get('canvas_data'),
-                thumbnail_url=data.get('thumbnail')
+                title=data.get('title', 'Untitled Design')
             )
             db.session.add(design)
+            design_service.create_canvas(design, data.get('canvas_data'), config['DESIGN_SNAPSHOT_INTERVAL'])
+        
+        # The editor sends a data URI; only a file URL is kept on the row
+        thumbnail = design_service.save_thumbnail(
+            design.id, data.get('thumbnail'), config['DESIGN_THUMBNAIL_FOLDER']
+        )
+        if thumbnail:
+            design.thumbnail_url = url_for('main.design_thumbnail', filename=thumbnail)
         
         db.session.commit()
         
+        if old_thumbnail and old_thumbnail != design.thumbnail_url:
+            design_service.remove_thumbnail(old_thumbnail, config['DESIGN_THUMBNAIL_FOLDER'])
+        
         return jsonify({
             'success': True,
             'design_id': design.id,
+            'version': design.version,
             'message': 'Design saved successfully'
         })
         
+    except design_service.VersionConflict as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': 'This design was changed elsewhere. Reload it before saving again.',
+            'version': e.version
+        }), 409
+    except design_service.PatchError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -671,22 +1084,27 @@ def load_design(design_id):
     """Load custom design from database"""
     try:
         from app.models import CustomDesign
-        design = CustomDesign.query.get_or_404(design_id)
+        design = CustomDesign.query.options(
+            db.undefer(CustomDesign.canvas_gz)
+        ).filter_by(id=design_id).first_or_404()
         
         # Verify ownership
         if design.user_id != current_user.id:
             return jsonify({'error': 'Unauthorized'}), 403
         
+        payload = design.to_dict()
+        version = request.args.get('version', type=int)
+        if version is None or version == design.version:
+            payload['canvas_data'] = design_service.decompress_canvas(design.canvas_gz)
+        else:
+            # An earlier version, rebuilt from the history
+            payload['canvas_data'] = design_service.canvas_at_version(design.id, version)
+            if payload['canvas_data'] is None:
+                return jsonify({'success': False, 'error': 'Version not found'}), 404
+            payload['version'] = version
         return jsonify({
             'success': True,
-            'design': {
-                'id': design.id,
-                'title': design.title,
-                'canvas_data': design.canvas_data,
-                'thumbnail_url': design.thumbnail_url,
-                'created_at': design.created_at.isoformat(),
-                'updated_at': design.updated_at.isoformat()
-            }
+            'design': payload
         })
         
     except Exception as e:
@@ -698,7 +1116,14 @@ def get_my_designs():
     """Get all designs for current user"""
     try:
         from app.models import CustomDesign
-        designs = CustomDesign.query.filter_by(user_id=current_user.id).order_by(
+        # Metadata columns only; the canvas is fetched by load_design
+        designs = db.session.query(
+            CustomDesign.id,
+            CustomDesign.title,
+            CustomDesign.thumbnail_url,
+            CustomDesign.created_at,
+            CustomDesign.updated_at
+        ).filter(CustomDesign.user_id == current_user.id).order_by(
             CustomDesign.updated_at.desc()
         ).all()
         
@@ -728,8 +1153,11 @@ def delete_design(design_id):
         if design.user_id != current_user.id:
             return jsonify({'error': 'Unauthorized'}), 403
         
+        thumbnail = design.thumbnail_url
+        design_service.delete_versions(design.id)
         db.session.delete(design)
         db.session.commit()
+        design_service.remove_thumbnail(thumbnail, current_app.config['DESIGN_THUMBNAIL_FOLDER'])
         
         return jsonify({
             'success': True,
@@ -740,3 +1168,21 @@ def delete_design(design_id):
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@main.route('/design-thumbnails/<filename>', methods=['GET'])
+@login_required
+def design_thumbnail(filename):
+    """Thumbnail of one of the current user's designs"""
+    from app.models import CustomDesign
+    filename = secure_filename(filename)
+    owner = db.session.query(CustomDesign.user_id).filter_by(
+        id=design_service.thumbnail_design_id(filename)
+    ).scalar()
+    if owner != current_user.id:
+        return jsonify({'error': 'Thumbnail not found'}), 404
+    
+    # The name changes with the image, so it can be cached for good
+    response = send_from_directory(current_app.config['DESIGN_THUMBNAIL_FOLDER'], filename, max_age=31536000)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
@@ -1,748 +1,54 @@
-// --- Frame Generator (SVG Data URIs) ---
-const Frames = {
-    gold: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='white'/%3E%3Crect x='20' y='20' width='calc(100%25 - 40px)' height='calc(100%25 - 40px)' fill='none' stroke='%23d4af37' stroke-width='4'/%3E%3Crect x='30' y='30' width='calc(100%25 - 60px)' height='calc(100%25 - 60px)' fill='none' stroke='%23d4af37' stroke-width='1'/%3E%3C/svg%3E",
-
-    neon: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='%23111'/%3E%3Crect x='10' y='10' width='calc(100%25 - 20px)' height='calc(100%25 - 20px)' fill='none' stroke='%230ff' stroke-width='4' filter='drop-shadow(0 0 5px %230ff)'/%3E%3Cpath d='M0 0 L100 100' stroke='%23f0f' stroke-width='2' opacity='0.5'/%3E%3C/svg%3E",
-
-    floral: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='%23fffaf0'/%3E%3Ccircle cx='0' cy='0' r='100' fill='none' stroke='%23fca5a5' stroke-width='20' opacity='0.3'/%3E%3Ccircle cx='100%25' cy='100%25' r='150' fill='none' stroke='%23fca5a5' stroke-width='30' opacity='0.3'/%3E%3Crect x='40' y='40' width='calc(100%25 - 80px)' height='calc(100%25 - 80px)' fill='none' stroke='%2378350f' stroke-width='2'/%3E%3C/svg%3E",
-
-    minimal: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='white'/%3E%3Cline x1='50' y1='50' x2='calc(100%25 - 50px)' y2='50' stroke='black' stroke-width='8'/%3E%3Ctext x='50%25' y='90%25' text-anchor='middle' font-family='sans-serif' font-size='12' fill='%23ccc'%3EMINIMALIST%3C/text%3E%3C/svg%3E",
+// --- Template Catalog ---
+// Templates are served by /api/templates; frames are separate cacheable SVGs
+const TEMPLATE_PAGE_SIZE = 24;
+
+async function fetchTemplatePage(params) {
+    const query = new URLSearchParams(params);
+    const res = await fetch(`/api/templates?${query.toString()}`);
+    if (!res.ok) throw new Error('Could not load templates');
+    return res.json();
+}
 
-    playful: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='%23fff'/%3E%3Ccircle cx='50' cy='50' r='20' fill='%23fbbf24'/%3E%3Ccircle cx='calc(100%25 - 50px)' cy='calc(100%25 - 50px)' r='30' fill='%2334d399'/%3E%3Crect x='30' y='30' width='calc(100%25 - 60px)' height='calc(100%25 - 60px)' fill='none' stroke='%23f472b6' stroke-width='4' stroke-dasharray='10,10'/%3E%3C/svg%3E",
+async function fetchTemplate(templateId, includeFrame = false) {
+    const suffix = includeFrame ? '?include=frame' : '';
+    const res = await fetch(`/api/templates/${encodeURIComponent(templateId)}${suffix}`);
+    if (!res.ok) return null;
+    return res.json();
+}
 
-    modern: "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect x='0' y='0' width='100%25' height='100%25' fill='white'/%3E%3Cpolygon points='0,0 150,0 0,150' fill='%233b82f6' opacity='0.2'/%3E%3Crect x='40' y='40' width='calc(100%25 - 80px)' height='calc(100%25 - 80px)' fill='none' stroke='%231e3a8a' stroke-width='2'/%3E%3C/svg%3E"
-};
+// --- Keyset Pages ---
+// Guest and comment lists come a page at a time; next_cursor asks for the next
+async function fetchListPage(url, params, cursor = null) {
+    const query = new URLSearchParams(params);
+    if (cursor) query.set('cursor', cursor);
+    const res = await fetch(`${url}?${query.toString()}`);
+    if (!res.ok) throw new Error('Could not load list');
+    return res.json();
+}
 
-const TEMPLATES = {
-    "birthday": [
-        {
-            "id": "bday_clean_white",
-            "title": "Clean Minimalist",
-            "style": "Minimal",
-            "text": "BIRTHDAY\n{{host_name}}\n{{event_date}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg width='100%25' height='100%25' xmlns='http://www.w3.org/2000/svg'%3E%3Crect width='100%25' height='100%25' fill='white'/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_1_midnight_blue",
-            "title": "Midnight Blue",
-            "style": "Modern",
-            "text": "JOIN US FOR A\nMIDNIGHT BLUE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230a192f%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2210%25%22%20cy%3D%2210%25%22%20r%3D%22150%22%20fill%3D%22%2364ffda%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2290%25%22%20cy%3D%2290%25%22%20r%3D%22200%22%20fill%3D%22%2364ffda%22%20opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Crect%20x%3D%2280%25%22%20y%3D%2210%25%22%20width%3D%22100%22%20height%3D%22100%22%20transform%3D%22rotate%2845%29%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.15%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_2_electric_purple",
-            "title": "Electric Purple",
-            "style": "Party",
-            "text": "JOIN US FOR A\nELECTRIC PURPLE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%234c1d95%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_3_neon_pink",
-            "title": "Neon Pink",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nNEON PINK\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23be185d%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fbcfe8%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2210%25%22%20cy%3D%2210%25%22%20r%3D%22150%22%20fill%3D%22%23fbcfe8%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2290%25%22%20cy%3D%2290%25%22%20r%3D%22200%22%20fill%3D%22%23fbcfe8%22%20opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Crect%20x%3D%2280%25%22%20y%3D%2210%25%22%20width%3D%22100%22%20height%3D%22100%22%20transform%3D%22rotate%2845%29%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.15%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_4_deep_teal",
-            "title": "Deep Teal",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nDEEP TEAL\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23134e4a%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_5_sunset_orange",
-            "title": "Sunset Orange",
-            "style": "Warm",
-            "text": "JOIN US FOR A\nSUNSET ORANGE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23c2410c%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fdba74%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_6_royal_gold",
-            "title": "Royal Gold",
-            "style": "Luxury",
-            "text": "JOIN US FOR A\nROYAL GOLD\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%2378350f%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_7_charcoal_minimal",
-            "title": "Charcoal Minimal",
-            "style": "Modern",
-            "text": "JOIN US FOR A\nCHARCOAL MINIMAL\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%2318181b%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2210%25%22%20cy%3D%2210%25%22%20r%3D%22150%22%20fill%3D%22%23e4e4e7%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2290%25%22%20cy%3D%2290%25%22%20r%3D%22200%22%20fill%3D%22%23e4e4e7%22%20opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Crect%20x%3D%2280%25%22%20y%3D%2210%25%22%20width%3D%22100%22%20height%3D%22100%22%20transform%3D%22rotate%2845%29%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.15%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_8_ruby_red",
-            "title": "Ruby Red",
-            "style": "Bold",
-            "text": "JOIN US FOR A\nRUBY RED\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23991b1b%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fecaca%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_9_forest_green",
-            "title": "Forest Green",
-            "style": "Nature",
-            "text": "JOIN US FOR A\nFOREST GREEN\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22grad1%22%20cx%3D%2250%25%22%20cy%3D%2250%25%22%20r%3D%2250%25%22%20fx%3D%2250%25%22%20fy%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%2386efac%22%20stop-opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%2386efac%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%2314532d%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28-20%2C-20%29%20scale%281.5%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%22%20cy%3D%2240%22%20r%3D%2220%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M50%2C50%20Q80%2C20%20100%2C50%20T150%2C50%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.3%29%22%20stroke-width%3D%223%22%20fill%3D%22none%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28calc%28100%25%20-%20100px%29%2C%20calc%28100%25%20-%20100px%29%29%20scale%281.5%29%20rotate%28180%2050%2050%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_10_ocean_depth",
-            "title": "Ocean Depth",
-            "style": "Cool",
-            "text": "JOIN US FOR A\nOCEAN DEPTH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%231e3a8a%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%2360a5fa%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash1%22%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%2240%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%2360a5fa%22%20stop-opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%2360a5fa%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash2%22%20cx%3D%2270%25%22%20cy%3D%2280%25%22%20r%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%231e3a8a%22%20stop-opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%2360a5fa%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231e3a8a%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%22200%22%20fill%3D%22url%28%23splash1%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%25%22%20cy%3D%2280%25%22%20r%3D%22250%22%20fill%3D%22url%28%23splash2%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bir_11_vibrant_party_1",
-            "title": "Vibrant Party 1",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 1\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%280%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_12_vibrant_party_2",
-            "title": "Vibrant Party 2",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 2\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%2830%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_13_vibrant_party_3",
-            "title": "Vibrant Party 3",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 3\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%2860%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_14_vibrant_party_4",
-            "title": "Vibrant Party 4",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 4\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%2890%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_15_vibrant_party_5",
-            "title": "Vibrant Party 5",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 5\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28120%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_16_vibrant_party_6",
-            "title": "Vibrant Party 6",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 6\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28150%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_17_vibrant_party_7",
-            "title": "Vibrant Party 7",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 7\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28180%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_18_vibrant_party_8",
-            "title": "Vibrant Party 8",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 8\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28210%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_19_vibrant_party_9",
-            "title": "Vibrant Party 9",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 9\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28240%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_20_vibrant_party_10",
-            "title": "Vibrant Party 10",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 10\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28270%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_21_vibrant_party_11",
-            "title": "Vibrant Party 11",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 11\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28300%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_22_vibrant_party_12",
-            "title": "Vibrant Party 12",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 12\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%28330%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_23_vibrant_party_13",
-            "title": "Vibrant Party 13",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 13\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%280%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bir_24_vibrant_party_14",
-            "title": "Vibrant Party 14",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nVIBRANT PARTY 14\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22hsl%2830%2C%2070%25%2C%2040%25%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        }
-    ],
-    "wedding": [
-        {
-            "id": "wed_0_royal_navy_gold",
-            "title": "Royal Navy Gold",
-            "style": "Luxury",
-            "text": "JOIN US FOR A\nROYAL NAVY GOLD\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230a192f%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_1_emerald_velvet",
-            "title": "Emerald Velvet",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nEMERALD VELVET\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22grad1%22%20cx%3D%2250%25%22%20cy%3D%2250%25%22%20r%3D%2250%25%22%20fx%3D%2250%25%22%20fy%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23d1fae5%22%20stop-opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23d1fae5%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23064e3b%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28-20%2C-20%29%20scale%281.5%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%22%20cy%3D%2240%22%20r%3D%2220%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M50%2C50%20Q80%2C20%20100%2C50%20T150%2C50%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.3%29%22%20stroke-width%3D%223%22%20fill%3D%22none%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28calc%28100%25%20-%20100px%29%2C%20calc%28100%25%20-%20100px%29%29%20scale%281.5%29%20rotate%28180%2050%2050%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_2_burgundy_wine",
-            "title": "Burgundy Wine",
-            "style": "Romantic",
-            "text": "JOIN US FOR A\nBURGUNDY WINE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23450a0a%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_3_charcoal_&_gold",
-            "title": "Charcoal & Gold",
-            "style": "Modern",
-            "text": "JOIN US FOR A\nCHARCOAL & GOLD\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23111827%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_4_deep_plum",
-            "title": "Deep Plum",
-            "style": "Majestic",
-            "text": "JOIN US FOR A\nDEEP PLUM\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22grad1%22%20cx%3D%2250%25%22%20cy%3D%2250%25%22%20r%3D%2250%25%22%20fx%3D%2250%25%22%20fy%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23ddd6fe%22%20stop-opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23ddd6fe%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%234c1d95%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28-20%2C-20%29%20scale%281.5%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%22%20cy%3D%2240%22%20r%3D%2220%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M50%2C50%20Q80%2C20%20100%2C50%20T150%2C50%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.3%29%22%20stroke-width%3D%223%22%20fill%3D%22none%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28calc%28100%25%20-%20100px%29%2C%20calc%28100%25%20-%20100px%29%29%20scale%281.5%29%20rotate%28180%2050%2050%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_5_black_tie",
-            "title": "Black Tie",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nBLACK TIE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23000000%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_6_midnight_star",
-            "title": "Midnight Star",
-            "style": "Celestial",
-            "text": "JOIN US FOR A\nMIDNIGHT STAR\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%231e1b4b%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23e0e7ff%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "wed_7_rich_chocolate",
-            "title": "Rich Chocolate",
-            "style": "Vintage",
-            "text": "JOIN US FOR A\nRICH CHOCOLATE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%233f2c22%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_8_sapphire_night",
-            "title": "Sapphire Night",
-            "style": "Blue",
-            "text": "JOIN US FOR A\nSAPPHIRE NIGHT\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash1%22%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%2240%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bfdbfe%22%20stop-opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23bfdbfe%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash2%22%20cx%3D%2270%25%22%20cy%3D%2280%25%22%20r%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23172554%22%20stop-opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23bfdbfe%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23172554%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23172554%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%22200%22%20fill%3D%22url%28%23splash1%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%25%22%20cy%3D%2280%25%22%20r%3D%22250%22%20fill%3D%22url%28%23splash2%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_9_crimson_love",
-            "title": "Crimson Love",
-            "style": "Passion",
-            "text": "JOIN US FOR A\nCRIMSON LOVE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22grad1%22%20cx%3D%2250%25%22%20cy%3D%2250%25%22%20r%3D%2250%25%22%20fx%3D%2250%25%22%20fy%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23fca5a5%22%20stop-opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fca5a5%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%237f1d1d%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28-20%2C-20%29%20scale%281.5%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%22%20cy%3D%2240%22%20r%3D%2220%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M50%2C50%20Q80%2C20%20100%2C50%20T150%2C50%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.3%29%22%20stroke-width%3D%223%22%20fill%3D%22none%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28calc%28100%25%20-%20100px%29%2C%20calc%28100%25%20-%20100px%29%29%20scale%281.5%29%20rotate%28180%2050%2050%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_10_luxury_wedding_1",
-            "title": "Luxury Wedding 1",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 1\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_11_luxury_wedding_2",
-            "title": "Luxury Wedding 2",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 2\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_12_luxury_wedding_3",
-            "title": "Luxury Wedding 3",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 3\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_13_luxury_wedding_4",
-            "title": "Luxury Wedding 4",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 4\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_14_luxury_wedding_5",
-            "title": "Luxury Wedding 5",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 5\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_15_luxury_wedding_6",
-            "title": "Luxury Wedding 6",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 6\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_16_luxury_wedding_7",
-            "title": "Luxury Wedding 7",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 7\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_17_luxury_wedding_8",
-            "title": "Luxury Wedding 8",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 8\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_18_luxury_wedding_9",
-            "title": "Luxury Wedding 9",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 9\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_19_luxury_wedding_10",
-            "title": "Luxury Wedding 10",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 10\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_20_luxury_wedding_11",
-            "title": "Luxury Wedding 11",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 11\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_21_luxury_wedding_12",
-            "title": "Luxury Wedding 12",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 12\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_22_luxury_wedding_13",
-            "title": "Luxury Wedding 13",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 13\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_23_luxury_wedding_14",
-            "title": "Luxury Wedding 14",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 14\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "wed_24_luxury_wedding_15",
-            "title": "Luxury Wedding 15",
-            "style": "Formal",
-            "text": "JOIN US FOR A\nLUXURY WEDDING 15\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231a1a1a%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        }
-    ],
-    "anniversary": [
-        {
-            "id": "ann_0_golden_50th",
-            "title": "Golden 50th",
-            "style": "Luxury",
-            "text": "JOIN US FOR A\nGOLDEN 50TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23000000%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23ffd700%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_1_silver_25th",
-            "title": "Silver 25th",
-            "style": "Classic",
-            "text": "JOIN US FOR A\nSILVER 25TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%231f2937%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23e5e7eb%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_2_ruby_40th",
-            "title": "Ruby 40th",
-            "style": "Romantic",
-            "text": "JOIN US FOR A\nRUBY 40TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash1%22%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%2240%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23fb7185%22%20stop-opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fb7185%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash2%22%20cx%3D%2270%25%22%20cy%3D%2280%25%22%20r%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23881337%22%20stop-opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fb7185%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23881337%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23881337%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%22200%22%20fill%3D%22url%28%23splash1%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%25%22%20cy%3D%2280%25%22%20r%3D%22250%22%20fill%3D%22url%28%23splash2%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_3_sapphire_45th",
-            "title": "Sapphire 45th",
-            "style": "Blue",
-            "text": "JOIN US FOR A\nSAPPHIRE 45TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%231e3a8a%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_4_emerald_55th",
-            "title": "Emerald 55th",
-            "style": "Green",
-            "text": "JOIN US FOR A\nEMERALD 55TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22grad1%22%20cx%3D%2250%25%22%20cy%3D%2250%25%22%20r%3D%2250%25%22%20fx%3D%2250%25%22%20fy%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%236ee7b7%22%20stop-opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%236ee7b7%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23065f46%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28-20%2C-20%29%20scale%281.5%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%22%20cy%3D%2240%22%20r%3D%2220%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M50%2C50%20Q80%2C20%20100%2C50%20T150%2C50%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.3%29%22%20stroke-width%3D%223%22%20fill%3D%22none%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cg%20transform%3D%22translate%28calc%28100%25%20-%20100px%29%2C%20calc%28100%25%20-%20100px%29%29%20scale%281.5%29%20rotate%28180%2050%2050%29%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2250%22%20cy%3D%2250%22%20r%3D%2230%22%20fill%3D%22url%28%23grad1%29%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3C/g%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_5_bronze_8th",
-            "title": "Bronze 8th",
-            "style": "Warm",
-            "text": "JOIN US FOR A\nBRONZE 8TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23451a03%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "ann_6_pearl_30th",
-            "title": "Pearl 30th",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nPEARL 30TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23374151%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "ann_7_diamond_60th",
-            "title": "Diamond 60th",
-            "style": "Modern",
-            "text": "JOIN US FOR A\nDIAMOND 60TH\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%230f172a%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%2338bdf8%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2210%25%22%20cy%3D%2210%25%22%20r%3D%22150%22%20fill%3D%22%2338bdf8%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2290%25%22%20cy%3D%2290%25%22%20r%3D%22200%22%20fill%3D%22%2338bdf8%22%20opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Crect%20x%3D%2280%25%22%20y%3D%2210%25%22%20width%3D%22100%22%20height%3D%22100%22%20transform%3D%22rotate%2845%29%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.15%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_8_anniversary_gala_8",
-            "title": "Anniversary Gala 8",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 8\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_9_anniversary_gala_9",
-            "title": "Anniversary Gala 9",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 9\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_10_anniversary_gala_10",
-            "title": "Anniversary Gala 10",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 10\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_11_anniversary_gala_11",
-            "title": "Anniversary Gala 11",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 11\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_12_anniversary_gala_12",
-            "title": "Anniversary Gala 12",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 12\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_13_anniversary_gala_13",
-            "title": "Anniversary Gala 13",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 13\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_14_anniversary_gala_14",
-            "title": "Anniversary Gala 14",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 14\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_15_anniversary_gala_15",
-            "title": "Anniversary Gala 15",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 15\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_16_anniversary_gala_16",
-            "title": "Anniversary Gala 16",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 16\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_17_anniversary_gala_17",
-            "title": "Anniversary Gala 17",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 17\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_18_anniversary_gala_18",
-            "title": "Anniversary Gala 18",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 18\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "ann_19_anniversary_gala_19",
-            "title": "Anniversary Gala 19",
-            "style": "Elegant",
-            "text": "JOIN US FOR A\nANNIVERSARY GALA 19\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%232c2c2c%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2220%22%20y%3D%2220%22%20width%3D%22calc%28100%25%20-%2040px%29%22%20height%3D%22calc%28100%25%20-%2040px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%226%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20x%3D%2215%22%20y%3D%2215%22%20width%3D%22calc%28100%25%20-%2030px%29%22%20height%3D%22calc%28100%25%20-%2030px%29%22%20fill%3D%22none%22%20stroke%3D%22url%28%23gold-grad%29%22%20stroke-width%3D%222%22%20opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
+// Calls loadMore() while the sentinel is near the viewport. loadMore resolves
+// to whether more pages remain; refresh() starts watching again after a reset
+function onScrollEnd(sentinel, loadMore) {
+    let busy = false;
+    const observer = new IntersectionObserver(async entries => {
+        if (busy || !entries[entries.length - 1].isIntersecting) return;
+        busy = true;
+        const more = await loadMore().catch(() => false);
+        busy = false;
+        // Observing again reports the sentinel afresh, so a page that did not
+        // fill the screen is followed by the next one
+        observer.unobserve(sentinel);
+        if (more) observer.observe(sentinel);
+    }, { rootMargin: '200px' });
+    observer.observe(sentinel);
+
+    return {
+        refresh() {
+            observer.unobserve(sentinel);
+            observer.observe(sentinel);
         }
-    ],
-    "baby": [
-        {
-            "id": "bab_0_vibrant_yellow",
-            "title": "Vibrant Yellow",
-            "style": "Bright",
-            "text": "JOIN US FOR A\nVIBRANT YELLOW\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23fbbf24%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fffbeb%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_1_deep_sky_blue",
-            "title": "Deep Sky Blue",
-            "style": "Boy",
-            "text": "JOIN US FOR A\nDEEP SKY BLUE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230284c7%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2210%25%22%20cy%3D%2210%25%22%20r%3D%22150%22%20fill%3D%22%23bae6fd%22%20opacity%3D%220.9%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2290%25%22%20cy%3D%2290%25%22%20r%3D%22200%22%20fill%3D%22%23bae6fd%22%20opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Crect%20x%3D%2280%25%22%20y%3D%2210%25%22%20width%3D%22100%22%20height%3D%22100%22%20transform%3D%22rotate%2845%29%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.15%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bab_2_hot_pink_pop",
-            "title": "Hot Pink Pop",
-            "style": "Girl",
-            "text": "JOIN US FOR A\nHOT PINK POP\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash1%22%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%2240%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23fbcfe8%22%20stop-opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fbcfe8%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash2%22%20cx%3D%2270%25%22%20cy%3D%2280%25%22%20r%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23db2777%22%20stop-opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fbcfe8%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23db2777%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23db2777%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%22200%22%20fill%3D%22url%28%23splash1%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%25%22%20cy%3D%2280%25%22%20r%3D%22250%22%20fill%3D%22url%28%23splash2%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bab_3_lush_jungle",
-            "title": "Lush Jungle",
-            "style": "Safari",
-            "text": "JOIN US FOR A\nLUSH JUNGLE\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%2315803d%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_4_purple_play",
-            "title": "Purple Play",
-            "style": "Fun",
-            "text": "JOIN US FOR A\nPURPLE PLAY\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%237c3aed%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23ddd6fe%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_5_orange_zest",
-            "title": "Orange Zest",
-            "style": "Energy",
-            "text": "JOIN US FOR A\nORANGE ZEST\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash1%22%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%2240%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23fed7aa%22%20stop-opacity%3D%220.8%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fed7aa%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%3CradialGradient%20id%3D%22splash2%22%20cx%3D%2270%25%22%20cy%3D%2280%25%22%20r%3D%2250%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23ea580c%22%20stop-opacity%3D%220.7%22/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fed7aa%22%20stop-opacity%3D%220%22/%3E%0A%20%20%20%20%20%20%20%20%3C/radialGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23ea580c%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.3%22/%3E%0A%20%20%20%20%20%20%20%20%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%23ea580c%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2230%25%22%20cy%3D%2230%25%22%20r%3D%22200%22%20fill%3D%22url%28%23splash1%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%2280%25%22%20cy%3D%2280%25%22%20r%3D%22250%22%20fill%3D%22url%28%23splash2%29%22%20filter%3D%22url%28%23watercolor%29%22/%3E%0A%20%20%20%20%20%20%20%20%3C/svg%3E"
-        },
-        {
-            "id": "bab_6_teal_toybox",
-            "title": "Teal Toybox",
-            "style": "Modern",
-            "text": "JOIN US FOR A\nTEAL TOYBOX\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230d9488%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20filter%3D%22url%28%23noise%29%22%20opacity%3D%220.4%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_7_navy_night",
-            "title": "Navy Night",
-            "style": "Sleepy",
-            "text": "JOIN US FOR A\nNAVY NIGHT\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%20%20%20%20%3ClinearGradient%20id%3D%22grad1%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23172554%22%20/%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23fde047%22%20/%3E%0A%20%20%20%20%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23grad1%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_8_baby_shower_fun_8",
-            "title": "Baby Shower Fun 8",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 8\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_9_baby_shower_fun_9",
-            "title": "Baby Shower Fun 9",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 9\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_10_baby_shower_fun_10",
-            "title": "Baby Shower Fun 10",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 10\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_11_baby_shower_fun_11",
-            "title": "Baby Shower Fun 11",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 11\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_12_baby_shower_fun_12",
-            "title": "Baby Shower Fun 12",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 12\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_13_baby_shower_fun_13",
-            "title": "Baby Shower Fun 13",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 13\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_14_baby_shower_fun_14",
-            "title": "Baby Shower Fun 14",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 14\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_15_baby_shower_fun_15",
-            "title": "Baby Shower Fun 15",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 15\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_16_baby_shower_fun_16",
-            "title": "Baby Shower Fun 16",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 16\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_17_baby_shower_fun_17",
-            "title": "Baby Shower Fun 17",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 17\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_18_baby_shower_fun_18",
-            "title": "Baby Shower Fun 18",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 18\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        },
-        {
-            "id": "bab_19_baby_shower_fun_19",
-            "title": "Baby Shower Fun 19",
-            "style": "Cute",
-            "text": "JOIN US FOR A\nBABY SHOWER FUN 19\n\n{{host_name}}\n\n{{event_date}} @ {{event_time}}\n{{venue}}",
-            "image": "",
-            "frame": "data:image/svg+xml,%3Csvg%20width%3D%22100%25%22%20height%3D%22100%25%22%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3Cdefs%3E%0A%20%20%20%20%3Cfilter%20id%3D%22noise%22%20x%3D%220%25%22%20y%3D%220%25%22%20width%3D%22100%25%22%20height%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.65%22%20numOctaves%3D%223%22%20stitchTiles%3D%22stitch%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeColorMatrix%20type%3D%22matrix%22%20values%3D%221%200%200%200%200%20%200%201%200%200%200%20%200%200%201%200%200%20%200%200%200%200.1%200%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22gold-foil%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.2%22%20numOctaves%3D%223%22%20result%3D%22noise%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDiffuseLighting%20in%3D%22noise%22%20lighting-color%3D%22%23ffd700%22%20surfaceScale%3D%223%22%3E%0A%20%20%20%20%20%20%20%20%20%20%20%20%3CfeDistantLight%20azimuth%3D%2245%22%20elevation%3D%2260%22/%3E%0A%20%20%20%20%20%20%20%20%3C/feDiffuseLighting%3E%0A%20%20%20%20%20%20%20%20%3CfeComposite%20operator%3D%22in%22%20in2%3D%22SourceGraphic%22/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%3Cfilter%20id%3D%22watercolor%22%20x%3D%22-20%25%22%20y%3D%22-20%25%22%20width%3D%22140%25%22%20height%3D%22140%25%22%3E%0A%20%20%20%20%20%20%20%20%3CfeTurbulence%20type%3D%22fractalNoise%22%20baseFrequency%3D%220.03%22%20numOctaves%3D%223%22%20seed%3D%221%22/%3E%0A%20%20%20%20%20%20%20%20%3CfeDisplacementMap%20in%3D%22SourceGraphic%22%20scale%3D%2220%22%20/%3E%0A%20%20%20%20%20%20%20%20%3CfeGaussianBlur%20stdDeviation%3D%225%22%20/%3E%0A%20%20%20%20%3C/filter%3E%0A%20%20%20%20%0A%20%20%20%20%3Cpattern%20id%3D%22grid%22%20width%3D%2240%22%20height%3D%2240%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Cpath%20d%3D%22M%2040%200%20L%200%200%200%2040%22%20fill%3D%22none%22%20stroke%3D%22rgba%28255%2C255%2C255%2C0.1%29%22%20stroke-width%3D%221%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3Cpattern%20id%3D%22dots%22%20width%3D%2220%22%20height%3D%2220%22%20patternUnits%3D%22userSpaceOnUse%22%3E%0A%20%20%20%20%20%20%20%20%3Ccircle%20cx%3D%222%22%20cy%3D%222%22%20r%3D%221.5%22%20fill%3D%22rgba%28255%2C255%2C255%2C0.2%29%22/%3E%0A%20%20%20%20%3C/pattern%3E%0A%20%20%20%20%3ClinearGradient%20id%3D%22gold-grad%22%20x1%3D%220%25%22%20y1%3D%220%25%22%20x2%3D%22100%25%22%20y2%3D%22100%25%22%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%220%25%22%20stop-color%3D%22%23bf953f%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2225%25%22%20stop-color%3D%22%23fcf6ba%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2250%25%22%20stop-color%3D%22%23b38728%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%2275%25%22%20stop-color%3D%22%23fbf5b7%22%20/%3E%0A%20%20%20%20%20%20%20%20%3Cstop%20offset%3D%22100%25%22%20stop-color%3D%22%23aa771c%22%20/%3E%0A%20%20%20%20%3C/linearGradient%3E%0A%20%20%20%20%3C/defs%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22%230ea5e9%22/%3E%3Crect%20width%3D%22100%25%22%20height%3D%22100%25%22%20fill%3D%22url%28%23dots%29%22/%3E%3C/svg%3E"
-        }
-    ]
-};
+    };
+}
 
 // --- Filtering State ---
 let activeFilters = {
@@ -818,124 +124,118 @@ function filterByCategory(category) {
 }
 
 
-function getAllTemplates() {
-    let all = [];
-    for (const [category, templates] of Object.entries(TEMPLATES)) {
-        templates.forEach(t => all.push({ ...t, category }));
-    }
-    return all;
+// Query string for the current filters; the server does the filtering
+function galleryQuery(page) {
+    const params = { page, per_page: TEMPLATE_PAGE_SIZE };
+    if (!activeFilters.category.has('all')) params.category = [...activeFilters.category].join(',');
+    if (activeFilters.style.size > 0) params.style = [...activeFilters.style].join(',');
+    if (activeFilters.search) params.q = activeFilters.search;
+
+    const sortSelect = document.getElementById('sort-select');
+    params.sort = sortSelect ? sortSelect.value : 'popular';
+    return params;
 }
 
-function renderGallery() {
+// Incremented on every re-render so responses to stale filters are ignored
+let galleryRequest = 0;
+
+async function renderGallery(page = 1) {
     const container = document.getElementById('template-gallery');
     if (!container) return;
 
     const noResults = document.getElementById('no-results');
     const heading = document.getElementById('gallery-heading');
+    const request = page === 1 ? ++galleryRequest : galleryRequest;
 
-    container.innerHTML = '';
-
-    // 1. Collect all templates
-    let templates = getAllTemplates();
-
-
-    // 2. Filter
-    templates = templates.filter(t => {
-        // Category Filter
-        if (!activeFilters.category.has('all')) {
-            if (!activeFilters.category.has(t.category)) return false;
-        }
-
-        // Style Filter
-        if (activeFilters.style.size > 0) {
-            if (!activeFilters.style.has(t.style)) return false;
-        }
-
-        // Search Filter
-        if (activeFilters.search) {
-            const term = activeFilters.search;
-            const match = t.title.toLowerCase().includes(term) ||
-                t.style.toLowerCase().includes(term) ||
-                t.category.toLowerCase().includes(term);
-            if (!match) return false;
-        }
-
-        return true;
-    });
-
-    // 3. Sort
-    const sortType = document.getElementById('sort-select') ? document.getElementById('sort-select').value : 'popular';
-    if (sortType === 'name') {
-        templates.sort((a, b) => a.title.localeCompare(b.title));
-    } else if (sortType === 'new') {
-        templates.reverse();
+    let data;
+    try {
+        data = await fetchTemplatePage(galleryQuery(page));
+    } catch (err) {
+        console.error(err);
+        return;
     }
-    // 'popular' is default order
+    if (request !== galleryRequest) return;
+
+    if (page === 1) container.innerHTML = '';
+    const oldMore = document.getElementById('gallery-load-more');
+    if (oldMore) oldMore.remove();
 
-    // 4. Update UI
-    if (templates.length === 0) {
+    if (data.total === 0) {
         noResults.style.display = 'block';
         if (heading) heading.textContent = `0 Templates Found`;
-    } else {
-        noResults.style.display = 'none';
-        if (heading) heading.textContent = `${templates.length} Templates`;
-
-        templates.forEach(t => {
-            const card = document.createElement('div');
-            card.className = 'template-card';
-
-            // Generate visual preview using visual frame (not header image)
-            // If t.frame is an SVG, use it as background.
-            // Adjust text brightness for dark frames (Neon/Modern)
-            const isDark = t.style === 'Modern' || t.id.includes('neon');
-            const textColor = isDark ? '#f3f4f6' : '#1f2937';
-            const mutedColor = isDark ? '#9ca3af' : '#6b7280';
-            const separatorColor = isDark ? 'rgba(255,255,255,0.2)' : '#e5e7eb';
+        return;
+    }
 
-            card.onclick = () => window.location.href = `/create/${t.id}`;
-            card.innerHTML = `
-                <div class="card-preview">
-                    <!-- Apply visual frame to preview -->
-                    <div class="preview-doc" style="background-image: url(&quot;${t.frame || ''}&quot;); background-size: 100% 100%;">
-                       <div style="font-family: ${t.style === 'Formal' ? 'serif' : 'sans-serif'}; text-align: center; padding: 1.5rem; height: 100%; display: flex; flex-direction: column; justify-content: center;">
-                            <h4 style="margin: 0; margin-bottom: 0.5rem; font-size: 0.7rem; text-transform: uppercase; letter-spacing: 0.1em; color: ${mutedColor}">${t.category}</h4>
-                            <h3 style="margin: 0; font-size: 1.1rem; line-height: 1.3; margin-bottom: 1rem; color: ${textColor}">${t.title}</h3>
-                            <div style="background: ${separatorColor}; height: 1px; width: 40px; margin: 0 auto 1rem;"></div>
-                            <p style="font-size: 0.6rem; color: ${mutedColor}; line-height: 1.5; max-width: 80%; margin: 0 auto;">
-                                JOIN US FOR<br>A CELEBRATION<br>...
-                            </p>
-                       </div>
-                    </div>
-                    
-                    <div class="card-overlay">
-                         <a href="/create/${t.id}" class="btn-customize">Edit Design</a>
-                    </div>
-                </div>
-                <div class="card-info">
-                   <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                        <span style="font-size: 0.75rem; font-weight: 600; color: var(--primary); background: #e0e7ff; padding: 0.2rem 0.6rem; border-radius: 4px;">${t.style}</span>
-                        ${Math.random() > 0.7 ? '<span style="font-size: 0.75rem; color: #059669; font-weight: 600;">NEW</span>' : ''}
+    noResults.style.display = 'none';
+    if (heading) heading.textContent = `${data.total} Templates`;
+
+    data.templates.forEach(t => {
+        const card = document.createElement('div');
+        card.className = 'template-card';
+
+        // Generate visual preview using visual frame (not header image)
+        // The frame SVG is loaded by URL so the browser caches it once.
+        // Adjust text brightness for dark frames (Neon/Modern)
+        const isDark = t.style === 'Modern' || t.id.includes('neon');
+        const textColor = isDark ? '#f3f4f6' : '#1f2937';
+        const mutedColor = isDark ? '#9ca3af' : '#6b7280';
+        const separatorColor = isDark ? 'rgba(255,255,255,0.2)' : '#e5e7eb';
+
+        card.onclick = () => window.location.href = `/create/${t.id}`;
+        card.innerHTML = `
+            <div class="card-preview">
+                <!-- Apply visual frame to preview -->
+                <div class="preview-doc" style="background-image: url(&quot;${t.frame_url || ''}&quot;); background-size: 100% 100%;">
+                   <div style="font-family: ${t.style === 'Formal' ? 'serif' : 'sans-serif'}; text-align: center; padding: 1.5rem; height: 100%; display: flex; flex-direction: column; justify-content: center;">
+                        <h4 style="margin: 0; margin-bottom: 0.5rem; font-size: 0.7rem; text-transform: uppercase; letter-spacing: 0.1em; color: ${mutedColor}">${t.category}</h4>
+                        <h3 style="margin: 0; font-size: 1.1rem; line-height: 1.3; margin-bottom: 1rem; color: ${textColor}">${t.title}</h3>
+                        <div style="background: ${separatorColor}; height: 1px; width: 40px; margin: 0 auto 1rem;"></div>
+                        <p style="font-size: 0.6rem; color: ${mutedColor}; line-height: 1.5; max-width: 80%; margin: 0 auto;">
+                            JOIN US FOR<br>A CELEBRATION<br>...
+                        </p>
                    </div>
-                   <h3 style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.25rem;">${t.title}</h3>
-                   <span style="font-size: 0.85rem; color: #6b7280;">${t.category.charAt(0).toUpperCase() + t.category.slice(1)}</span>
                 </div>
-            `;
-            container.appendChild(card);
-        });
+                
+                <div class="card-overlay">
+                     <a href="/create/${t.id}" class="btn-customize">Edit Design</a>
+                </div>
+            </div>
+            <div class="card-info">
+               <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+                    <span style="font-size: 0.75rem; font-weight: 600; color: var(--primary); background: #e0e7ff; padding: 0.2rem 0.6rem; border-radius: 4px;">${t.style}</span>
+                    ${Math.random() > 0.7 ? '<span style="font-size: 0.75rem; color: #059669; font-weight: 600;">NEW</span>' : ''}
+               </div>
+               <h3 style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.25rem;">${t.title}</h3>
+               <span style="font-size: 0.85rem; color: #6b7280;">${t.category.charAt(0).toUpperCase() + t.category.slice(1)}</span>
+            </div>
+        `;
+        container.appendChild(card);
+    });
+
+    if (data.page < data.pages) {
+        const more = document.createElement('button');
+        more.id = 'gallery-load-more';
+        more.className = 'btn-customize';
+        more.textContent = 'Load more templates';
+        more.style.gridColumn = '1 / -1';
+        more.onclick = () => renderGallery(data.page + 1);
+        container.appendChild(more);
     }
 }
 
 // --- Invite Page Logic ---
 // --- Invite Page Logic ---
-function initInvitePage() {
+async function initInvitePage() {
     const eventId = document.getElementById('event_id').value;
     loadComments(eventId);
 
-    // Render full template text (Client-side hydration to match preview)
+    // Render full template text (Client-side hydration to match preview).
+    // view_event already renders it; this only runs for pages that do not
+    // mark the message with data-rendered="server"
     const container = document.querySelector('.invite-container');
     const messageEl = document.getElementById('invite-message');
 
-    if (container && messageEl) {
+    if (container && messageEl && messageEl.dataset.rendered !== 'server') {
         const templateId = container.dataset.templateId;
         const hostName = container.dataset.hostName;
         const partnerName = container.dataset.partnerName;
@@ -946,15 +246,8 @@ function initInvitePage() {
         const customMessage = container.dataset.customMessage || '';
         const eventTitle = container.dataset.eventTitle || '';
 
-        // Find template definition
-        let template = null;
-        for (const list of Object.values(TEMPLATES)) {
-            const found = list.find(t => t.id === templateId);
-            if (found) {
-                template = found;
-                break;
-            }
-        }
+        // Only this page's template is fetched, without its frame
+        const template = await fetchTemplate(templateId);
 
         if (template) {
             let text = template.text;
@@ -989,29 +282,19 @@ function initInvitePage() {
             const formData = new FormData(rsvpForm);
             const name = formData.get('name');
 
-            // First create guest if anonymous
-            let guestId = null;
+            // Guest, response and the "coming" comment are written in one request
+            const status = formData.get('rsvp_status');
+            const rsvpData = {
+                name: name,
+                token: new URLSearchParams(window.location.search).get('guest'),
+                status: status,
+                plus_one_count: parseInt(formData.get('plus_one_count') || 0),
+                dietary_restrictions: formData.get('dietary_restrictions') || '',
+                comment: status === 'Yes' ? "I'll be there! 🎉" : ''
+            };
 
             try {
-                // Check if we are creating a new guest entry
-                const guestRes = await fetch(`/api/events/${eventId}/guests`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ name: name })
-                });
-                const guests = await guestRes.json();
-                const guest = guests[0];
-                guestId = guest.id;
-
-                // Now RSVP
-                const rsvpData = {
-                    guest_id: guestId,
-                    status: formData.get('rsvp_status'),
-                    plus_one_count: parseInt(formData.get('plus_one_count') || 0),
-                    dietary_restrictions: formData.get('dietary_restrictions') || ''
-                };
-
-                const rsvpRes = await fetch(`/api/events/${eventId}/rsvp`, {
+                const rsvpRes = await fetch(`/api/events/${eventId}/rsvp/submit`, {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify(rsvpData)
@@ -1021,10 +304,12 @@ function initInvitePage() {
                     document.getElementById('rsvp-form').style.display = 'none';
                     document.getElementById('rsvp-success').style.display = 'block';
 
-                    // Auto-post a "Coming" comment if yes
-                    if (rsvpData.status === 'Yes') {
-                        postComment(eventId, name, "I'll be there! 🎉");
+                    if (rsvpData.comment) {
+                        loadComments(eventId);
                     }
+                } else {
+                    const result = await rsvpRes.json();
+                    alert(result.error || 'Error submitting RSVP');
                 }
             } catch (err) {
                 console.error(err);
@@ -1227,20 +512,26 @@ function parseIndianAddress(address) {
 }
 
 
-async function loadComments(eventId) {
+const COMMENT_PAGE_SIZE = 20;
+
+async function loadComments(eventId, cursor = null) {
     try {
-        const res = await fetch(`/api/events/${eventId}/comments`);
-        const comments = await res.json();
+        const page = await fetchListPage(`/api/events/${eventId}/comments`, {
+            per_page: COMMENT_PAGE_SIZE,
+            fields: 'name,content,created_at'
+        }, cursor);
+        const comments = page.comments;
 
         const container = document.getElementById('comment-carousel');
         if (!container) return;
 
-        if (comments.length === 0) {
+        if (!cursor && comments.length === 0) {
             container.innerHTML = '<p style="font-style: italic; color: #999;">No messages yet.</p>';
             return;
         }
 
-        container.innerHTML = '';
+        if (!cursor) container.innerHTML = '';
+        container.querySelector('.comment-more')?.remove();
         comments.forEach(c => {
             const card = document.createElement('div');
             card.className = 'comment-card';
@@ -1251,6 +542,16 @@ async function loadComments(eventId) {
                     `;
             container.appendChild(card);
         });
+
+        if (page.next_cursor) {
+            const more = document.createElement('button');
+            more.type = 'button';
+            more.className = 'comment-more';
+            more.textContent = 'Older messages';
+            more.style.cssText = 'background: none; border: 1px solid #ddd; border-radius: 8px; padding: 0.5rem 1rem; cursor: pointer; color: #666;';
+            more.onclick = () => loadComments(eventId, page.next_cursor);
+            container.appendChild(more);
+        }
     } catch (err) {
         console.error('Failed to load comments');
     }
@@ -1287,32 +588,41 @@ async function initDashboard(eventId) {
         console.error('Failed to load stats');
     }
 
-    // Load Guest List
+    // Load Guest List a page at a time, the next page when the table end scrolls into view
+    const tbody = document.getElementById('guest-list-body');
+    if (!tbody) return;
+    tbody.innerHTML = '';
+
+    let cursor = null;
+    const loadGuestPage = async () => {
+        const page = await fetchListPage(`/api/events/${eventId}/guests`, {
+            fields: 'name,rsvp_status,plus_one_count,notes'
+        }, cursor);
+        page.guests.forEach(g => {
+            const tr = document.createElement('tr');
+            tr.style.borderBottom = '1px solid #eee';
+
+            let statusColor = '#6b7280';
+            if (g.rsvp_status === 'Yes') statusColor = 'var(--success)';
+            if (g.rsvp_status === 'No') statusColor = 'var(--danger)';
+            if (g.rsvp_status === 'Maybe') statusColor = 'var(--warning)';
+
+            tr.innerHTML = `
+                <td style="padding: 1rem;">${g.name}</td>
+                <td style="padding: 1rem; color: ${statusColor}; font-weight: 500;">${g.rsvp_status}</td>
+                <td style="padding: 1rem;">${g.plus_one_count}</td>
+                <td style="padding: 1rem; color: #666;">${g.notes || '-'}</td>
+                `;
+            tbody.appendChild(tr);
+        });
+        cursor = page.next_cursor;
+        return Boolean(cursor);
+    };
+
+    const sentinel = document.createElement('div');
+    tbody.closest('table').after(sentinel);
     try {
-        const res = await fetch(`/api/events/${eventId}/guests`);
-        if (res.ok) {
-            const guests = await res.json();
-            const tbody = document.getElementById('guest-list-body');
-            tbody.innerHTML = '';
-
-            guests.forEach(g => {
-                const tr = document.createElement('tr');
-                tr.style.borderBottom = '1px solid #eee';
-
-                let statusColor = '#6b7280';
-                if (g.rsvp_status === 'Yes') statusColor = 'var(--success)';
-                if (g.rsvp_status === 'No') statusColor = 'var(--danger)';
-                if (g.rsvp_status === 'Maybe') statusColor = 'var(--warning)';
-
-                tr.innerHTML = `
-                    <td style="padding: 1rem;">${g.name}</td>
-                    <td style="padding: 1rem; color: ${statusColor}; font-weight: 500;">${g.rsvp_status}</td>
-                    <td style="padding: 1rem;">${g.plus_one_count}</td>
-                    <td style="padding: 1rem; color: #666;">${g.notes || '-'}</td>
-                    `;
-                tbody.appendChild(tr);
-            });
-        }
+        if (await loadGuestPage()) onScrollEnd(sentinel, loadGuestPage);
     } catch (err) {
         console.error('Failed to load guests');
     }
@@ -1348,19 +658,12 @@ function copyLink() {
 // ... (renderGallery code remains) ...
 
 // --- Editor Logic ---
-function initEditor() {
+async function initEditor() {
     const templateId = document.getElementById('template_id').value;
     if (!templateId) return;
 
-    // Find template data
-    let template = null;
-    for (const [type, list] of Object.entries(TEMPLATES)) {
-        const found = list.find(t => t.id === templateId);
-        if (found) {
-            template = { ...found, category: type };
-            break;
-        }
-    }
+    // Find template data; the editor stores the frame, so it is included
+    const template = await fetchTemplate(templateId, true);
 
     if (!template) {
         alert('Template not found!');
@@ -1252,9 +1252,57 @@ function updateZoomDisplay() {
 
 // ==================== SAVE & EXPORT ====================
 
+// Last saved state: later saves send a JSON patch against this version,
+// and the thumbnail only when it differs from the last one sent
+let savedDesign = { id: null, version: null, canvas: null, thumbnail: null };
+
+function escapePointer(key) {
+    return String(key).replace(/~/g, '~0').replace(/\//g, '~1');
+}
+
+// RFC 6902 operations turning `before` into `after`
+function diffJson(before, after, path = '', ops = []) {
+    if (before === after) return ops;
+
+    const bothArrays = Array.isArray(before) && Array.isArray(after);
+    const bothObjects = before && after && typeof before === 'object' && typeof after === 'object'
+        && !Array.isArray(before) && !Array.isArray(after);
+
+    if (bothArrays) {
+        const shared = Math.min(before.length, after.length);
+        for (let i = 0; i < shared; i++) {
+            diffJson(before[i], after[i], `${path}/${i}`, ops);
+        }
+        for (let i = before.length - 1; i >= shared; i--) {
+            ops.push({ op: 'remove', path: `${path}/${i}` });
+        }
+        for (let i = shared; i < after.length; i++) {
+            ops.push({ op: 'add', path: `${path}/-`, value: after[i] });
+        }
+    } else if (bothObjects) {
+        Object.keys(before).forEach(key => {
+            if (!(key in after)) ops.push({ op: 'remove', path: `${path}/${escapePointer(key)}` });
+        });
+        Object.keys(after).forEach(key => {
+            const keyPath = `${path}/${escapePointer(key)}`;
+            if (!(key in before)) {
+                ops.push({ op: 'add', path: keyPath, value: after[key] });
+            } else {
+                diffJson(before[key], after[key], keyPath, ops);
+            }
+        });
+    } else {
+        ops.push({ op: 'replace', path: path, value: after });
+    }
+    return ops;
+}
+
 function saveDesign() {
     const title = document.getElementById('design-title').value || 'Untitled Design';
     const json = JSON.stringify(canvas.toJSON());
+    // Diff the plain JSON that is sent and stored, not the live object:
+    // keys holding undefined would otherwise become ops with no value
+    const state = JSON.parse(json);
 
     // Create thumbnail
     const dataURL = canvas.toDataURL({
@@ -1263,22 +1311,42 @@ function saveDesign() {
         multiplier: 0.2
     });
 
+    const payload = { title: title };
+    if (dataURL !== savedDesign.thumbnail) {
+        payload.thumbnail = dataURL;
+    }
+    if (savedDesign.id) {
+        payload.id = savedDesign.id;
+        payload.base_version = savedDesign.version;
+    }
+    // Send only what changed, unless the patch is bigger than the canvas
+    const patch = savedDesign.canvas ? diffJson(savedDesign.canvas, state) : null;
+    if (patch && JSON.stringify(patch).length < json.length) {
+        payload.patch = patch;
+    } else {
+        payload.canvas_data = json;
+    }
+
     // Send to server
     fetch('/api/save-design', {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-            title: title,
-            canvas_data: json,
-            thumbnail: dataURL
-        })
+        body: JSON.stringify(payload)
     })
-        .then(response => response.json())
-        .then(data => {
+        .then(response => response.json().then(data => ({ status: response.status, data: data })))
+        .then(({ status, data }) => {
             if (data.success) {
+                savedDesign = {
+                    id: data.design_id,
+                    version: data.version,
+                    canvas: state,
+                    thumbnail: dataURL
+                };
                 alert('Design saved successfully!');
+            } else if (status === 409) {
+                resolveSaveConflict(data.version);
             } else {
                 alert('Error saving design: ' + data.error);
             }
@@ -1289,6 +1357,46 @@ function saveDesign() {
         });
 }
 
+// The design was saved from another tab or device since this editor's version
+function resolveSaveConflict(version) {
+    const reload = confirm('This design was changed elsewhere.\n\n' +
+        'OK: load the saved design (changes made here are lost)\n' +
+        'Cancel: keep editing; your next save replaces the saved design');
+    if (reload) {
+        reloadSavedDesign();
+    } else {
+        // Next save sends the whole canvas and thumbnail on top of the newer version
+        savedDesign = { ...savedDesign, version: version, canvas: null, thumbnail: null };
+    }
+}
+
+function reloadSavedDesign() {
+    fetch(`/api/load-design/${savedDesign.id}`)
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                throw new Error(data.error);
+            }
+            const design = data.design;
+            canvas.loadFromJSON(design.canvas_data, function () {
+                canvas.renderAll();
+                savedDesign = {
+                    id: design.id,
+                    version: design.version,
+                    canvas: JSON.parse(design.canvas_data),
+                    thumbnail: null
+                };
+                // Undo starts again from the loaded design
+                history = [design.canvas_data];
+                historyStep = 0;
+            });
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Error loading the saved design');
+        });
+}
+
 function downloadDesign(format) {
     const title = document.getElementById('design-title').value || 'design';
 
@@ -0,0 +1,131 @@
+"""
+Statistics Service for event dashboards
+RSVP, attendance and dietary figures come from grouped SQL aggregates,
+so the cost does not grow with the number of guest rows loaded into Python
+"""
+from sqlalchemy import func, select
+from app import db, counter_service
+from app.models import Guest, EmailLog
+
+RSVP_STATUSES = ('Yes', 'No', 'Maybe', 'Pending')
+UNSENT_EMAIL_STATUSES = ('queued', 'sending', 'failed')
+
+def _guest_breakdown(event_id, by_dietary=False):
+    """
+    Count guests and plus-ones per RSVP status in a single grouped query
+
+    Args:
+        event_id: Event ID
+        by_dietary: Also group by dietary_restrictions for the dietary tally
+
+    Returns:
+        dict: Status counts, attendee total and optional dietary tally
+    """
+    columns = [
+        Guest.rsvp_status,
+        func.count(Guest.id),
+        func.coalesce(func.sum(Guest.plus_one_count), 0)
+    ]
+    if by_dietary:
+        columns.append(Guest.dietary_restrictions)
+
+    query = db.session.query(*columns).filter(Guest.event_id == event_id).group_by(*(
+        [Guest.rsvp_status, Guest.dietary_restrictions] if by_dietary else [Guest.rsvp_status]
+    ))
+
+    counts = {status: 0 for status in RSVP_STATUSES}
+    plus_ones_yes = 0
+    total_guests = 0
+    dietary_restrictions = {}
+
+    for row in query:
+        status, count, plus_ones = row[0], row[1], row[2]
+        total_guests += count
+        if status in counts:
+            counts[status] += count
+        if status == 'Yes':
+            plus_ones_yes += plus_ones
+
+        # Each distinct restrictions string arrives once with its guest count
+        if by_dietary and row[3]:
+            for restriction in row[3].split(','):
+                restriction = restriction.strip()
+                if restriction:
+                    dietary_restrictions[restriction] = dietary_restrictions.get(restriction, 0) + count
+
+    return {
+        'total_guests': total_guests,
+        'counts': counts,
+        'total_attendees': counts['Yes'] + plus_ones_yes,
+        'dietary_restrictions': dietary_restrictions
+    }
+
+def _activity_counts(event_id):
+    """View and comment totals from the materialized counters"""
+    return counter_service.get_counts(event_id, ('views', 'comments'))
+
+def _email_counts(event_id):
+    """Email totals fetched together as scalar subqueries"""
+    row = db.session.execute(select(
+        select(func.count(EmailLog.id)).where(
+            EmailLog.event_id == event_id,
+            EmailLog.status.notin_(UNSENT_EMAIL_STATUSES)
+        ).scalar_subquery(),
+        select(func.count(EmailLog.opened_at)).where(EmailLog.event_id == event_id).scalar_subquery()
+    )).one()
+
+    return {
+        'emails_sent': row[0],
+        'emails_opened': row[1]
+    }
+
+def get_dashboard_stats(event_id):
+    """
+    Headline numbers for the event dashboard
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        dict: Guest, RSVP, view and comment counts
+    """
+    guests = _guest_breakdown(event_id)
+    activity = _activity_counts(event_id)
+
+    return {
+        'total_guests': guests['total_guests'],
+        'rsvp_yes': guests['counts']['Yes'],
+        'rsvp_maybe': guests['counts']['Maybe'],
+        'rsvp_no': guests['counts']['No'],
+        'views': activity['views'],
+        'comments': activity['comments']
+    }
+
+def get_event_statistics(event_id):
+    """
+    Generate comprehensive statistics for an event
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        dict: Statistics dictionary
+    """
+    guests = _guest_breakdown(event_id, by_dietary=True)
+    emails = _email_counts(event_id)
+
+    total_guests = guests['total_guests']
+    rsvp_pending = guests['counts']['Pending']
+
+    return {
+        'total_guests': total_guests,
+        'rsvp_yes': guests['counts']['Yes'],
+        'rsvp_no': guests['counts']['No'],
+        'rsvp_maybe': guests['counts']['Maybe'],
+        'rsvp_pending': rsvp_pending,
+        'total_attendees': guests['total_attendees'],
+        'response_rate': round((total_guests - rsvp_pending) / total_guests * 100, 1) if total_guests > 0 else 0,
+        'dietary_restrictions': guests['dietary_restrictions'],
+        'emails_sent': emails['emails_sent'],
+        'emails_opened': emails['emails_opened']
+    }
@@ -0,0 +1,148 @@
+"""
+Template Catalog for invitation designs
+templates_output.json is loaded and indexed once per process, so templates
+are looked up by id instead of scanning the data embedded in app.js
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import urllib.parse
+from flask import current_app
+
+# Same rule as updatePreview() in app.js: frames with these words in the id
+# are dark, so their text is drawn light
+DARK_KEYWORDS = ('midnight', 'neon', 'dark', 'purple', 'teal', 'ruby', 'forest', 'charcoal',
+                 'night', 'ocean', 'black', 'navy', 'deep', 'luxury', 'royal', 'premium')
+
+_PLACEHOLDER = re.compile(r'{{\s*(\w+)\s*}}')
+_ANNIVERSARY_YEAR = re.compile(r'(\d+(?:st|nd|rd|th))\s+Anniversary', re.IGNORECASE)
+
+class TemplateCatalog:
+    """In-memory index of every template, by id and by category"""
+
+    def __init__(self, path, manifest_path=None):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+
+        # Hashed frame files written by build_frame_assets.py, if it has been run
+        self.frame_assets = {}
+        if manifest_path and os.path.exists(manifest_path):
+            with open(manifest_path, 'rb') as f:
+                manifest = f.read()
+            raw += manifest
+            self.frame_assets = json.loads(manifest)['frames']
+
+        # Changes whenever the catalog or frame manifest does; used to build ETags
+        self.version = hashlib.sha256(raw).hexdigest()[:16]
+        self.categories = list(data)
+        self.templates = []
+        self.by_id = {}
+        self.frames = {}
+        for category, templates in data.items():
+            for template in templates:
+                template = dict(template, category=category)
+                self.templates.append(template)
+                self.by_id[template['id']] = template
+                if template.get('frame', '').startswith('data:image/svg+xml'):
+                    svg = urllib.parse.unquote(template['frame'].split(',', 1)[1]).encode('utf-8')
+                    self.frames[template['id']] = (svg, hashlib.sha256(svg).hexdigest()[:16])
+
+        self.styles = sorted({template['style'] for template in self.templates})
+
+    def get(self, template_id):
+        return self.by_id.get(template_id)
+
+    def summary(self, template):
+        """Listing metadata; the frame itself is fetched separately"""
+        return {
+            'id': template['id'],
+            'title': template['title'],
+            'style': template['style'],
+            'category': template['category'],
+            'image': template.get('image') or '',
+            'dark': self.is_dark(template),
+            'has_frame': template['id'] in self.frames
+        }
+
+    def search(self, categories=None, styles=None, query=None, sort='popular'):
+        """
+        Filter the catalog the way the gallery does
+
+        Args:
+            categories: Categories to keep, all when empty
+            styles: Styles to keep, all when empty
+            query: Case-insensitive match on title, style or category
+            sort: 'popular' (catalog order), 'name' or 'new'
+
+        Returns:
+            list: Matching template dicts
+        """
+        results = self.templates
+        if categories:
+            results = [t for t in results if t['category'] in categories]
+        if styles:
+            results = [t for t in results if t['style'] in styles]
+        if query:
+            query = query.lower()
+            results = [
+                t for t in results
+                if query in t['title'].lower() or query in t['style'].lower() or query in t['category']
+            ]
+
+        if sort == 'name':
+            results = sorted(results, key=lambda t: t['title'].lower())
+        elif sort == 'new':
+            results = list(reversed(results))
+        return results
+
+    @staticmethod
+    def is_dark(template):
+        return any(keyword in template['id'] for keyword in DARK_KEYWORDS)
+
+    @staticmethod
+    def render_text(template, event):
+        """
+        Fill a template's placeholders from an event, as the invite page does
+
+        Args:
+            template: Template dict
+            event: Event object
+
+        Returns:
+            str: Invitation text with the custom message appended
+        """
+        match = _ANNIVERSARY_YEAR.search(event.title or '')
+        values = {
+            'host_name': event.host_name or '',
+            'partner_name': event.partner_name or '',
+            'guest_name': 'Guest',
+            'event_date': event.event_date or '',
+            'event_time': event.event_time or '',
+            'venue': event.venue or '',
+            'dress_code': event.dress_code or '',
+            'RSVP_link': '(Please RSVP below)',
+            'anniversary_year': match.group(1) if match else ''
+        }
+
+        text = _PLACEHOLDER.sub(lambda m: values.get(m.group(1), m.group(0)), template['text'])
+        if event.message:
+            text += f'\n\n{event.message}'
+        return text
+
+_catalog_lock = threading.Lock()
+
+def get_catalog():
+    """Return the application's template catalog, loading it on first use"""
+    app = current_app._get_current_object()
+    with _catalog_lock:
+        catalog = app.extensions.get('template_catalog')
+        if catalog is None:
+            catalog = TemplateCatalog(
+                app.config['TEMPLATE_CATALOG_PATH'],
+                manifest_path=os.path.join(app.config['FRAME_ASSET_FOLDER'], 'manifest.json')
+            )
+            app.extensions['template_catalog'] = catalog
+    return catalog
@@ -0,0 +1,188 @@
+"""
+Upload Service for content-addressed image storage
+Uploads are hashed while they stream to disk and stored once as
+<sha256>.<ext>; UploadBlob rows count the events using each file
+"""
+from datetime import datetime, timedelta
+import glob
+import hashlib
+import os
+import re
+import uuid
+from sqlalchemy import case, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models import Event, UploadBlob
+from app.image_service import upload_filename
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# One stored name per format, so photo.jpeg and photo.jpg share a file
+EXTENSION_ALIASES = {'jpeg': 'jpg'}
+
+_BLOB_NAME = re.compile(r'[0-9a-f]{64}\.[a-z0-9]+')
+
+def blob_filename(digest, extension):
+    extension = extension.lower()
+    return f'{digest}.{EXTENSION_ALIASES.get(extension, extension)}'
+
+def save_upload(stream, extension, folder):
+    """
+    Store an upload under its content hash, reusing the file if it exists
+
+    The stream is copied to a temporary file in chunks while it is hashed,
+    so the upload is never held in memory. The caller commits.
+
+    Args:
+        stream: Readable binary stream of the upload
+        extension: File extension the upload was sent with
+        folder: Upload folder
+
+    Returns:
+        tuple: (UploadBlob, whether the file was new)
+    """
+    os.makedirs(folder, exist_ok=True)
+    temp_path = os.path.join(folder, f'.upload-{uuid.uuid4().hex}.tmp')
+    sha = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(temp_path, 'wb') as f:
+            for chunk in iter(lambda: stream.read(UPLOAD_CHUNK_SIZE), b''):
+                sha.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+
+        digest = sha.hexdigest()
+        blob = db.session.get(UploadBlob, digest)
+        filename = blob.filename if blob else blob_filename(digest, extension)
+        path = os.path.join(folder, filename)
+
+        created = not os.path.exists(path)
+        if created:
+            os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    now = datetime.utcnow()
+    if blob is None:
+        try:
+            # Savepoint, so a concurrent first upload of the same bytes
+            # only costs this request a re-read
+            with db.session.begin_nested():
+                blob = UploadBlob(digest=digest, filename=filename, size=size,
+                                  ref_count=0, created_at=now, last_uploaded_at=now)
+                db.session.add(blob)
+        except IntegrityError:
+            blob = db.session.get(UploadBlob, digest)
+    blob.last_uploaded_at = now
+
+    return blob, created
+
+def referenced_blobs(value):
+    """
+    Stored names of the content-addressed uploads a background_image_url uses
+
+    Couple templates keep two photos as "<groom url>|<bride url>".
+
+    Returns:
+        set: Blob file names
+    """
+    names = set()
+    for url in (value or '').split('|'):
+        filename = upload_filename(url.strip())
+        if filename and _BLOB_NAME.fullmatch(filename):
+            names.add(filename)
+    return names
+
+def _adjust_refs(value, delta):
+    names = referenced_blobs(value)
+    if not names:
+        return 0
+    # A single UPDATE, so concurrent saves never lose a count
+    count = UploadBlob.ref_count + delta
+    result = db.session.execute(
+        update(UploadBlob)
+        .where(UploadBlob.filename.in_(names))
+        .values(ref_count=case((count < 0, 0), else_=count))
+    )
+    return result.rowcount
+
+def retain(value):
+    """Count a new reference to every upload in a background_image_url; the caller commits"""
+    return _adjust_refs(value, 1)
+
+def release(value):
+    """Drop a reference to every upload in a background_image_url; the caller commits"""
+    return _adjust_refs(value, -1)
+
+def rebuild_ref_counts(batch_size=1000):
+    """
+    Recount references from every event's background_image_url
+
+    Returns:
+        int: Blobs with at least one reference
+    """
+    counts = {}
+    rows = db.session.query(Event.background_image_url).filter(
+        Event.background_image_url.isnot(None)
+    ).yield_per(batch_size)
+    for (value,) in rows:
+        for name in referenced_blobs(value):
+            counts[name] = counts.get(name, 0) + 1
+
+    db.session.execute(update(UploadBlob).values(ref_count=0))
+    for name, count in counts.items():
+        db.session.execute(
+            update(UploadBlob).where(UploadBlob.filename == name).values(ref_count=count)
+        )
+    db.session.commit()
+    return len(counts)
+
+def blob_files(folder, filename):
+    """The stored file and every variant image_service wrote for it"""
+    stem = os.path.splitext(filename)[0]
+    paths = [os.path.join(folder, filename)]
+    paths.extend(glob.glob(os.path.join(folder, f'{stem}_*')))
+    return paths
+
+def collect_garbage(folder, grace_hours=24, dry_run=False):
+    """
+    Delete unreferenced blobs and their variants
+
+    Blobs get a grace period after their last upload, since the editor
+    uploads a photo before the event that uses it is saved.
+
+    Args:
+        folder: Upload folder
+        grace_hours: Hours an unreferenced blob is kept after its last upload
+        dry_run: Only report what would be deleted
+
+    Returns:
+        tuple: (blobs removed, bytes freed)
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=grace_hours)
+    candidates = UploadBlob.query.filter(
+        UploadBlob.ref_count <= 0,
+        UploadBlob.last_uploaded_at < cutoff
+    ).all()
+
+    removed = 0
+    freed = 0
+    for blob in candidates:
+        for path in blob_files(folder, blob.filename):
+            try:
+                size = os.path.getsize(path)
+                if not dry_run:
+                    os.remove(path)
+                freed += size
+            except FileNotFoundError:
+                pass
+        if not dry_run:
+            db.session.delete(blob)
+        removed += 1
+
+    if not dry_run:
+        db.session.commit()
+    return removed, freed
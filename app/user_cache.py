@@ -0,0 +1,135 @@
+"""
+User Cache for flask_login's user loader
+Users are memoised per request and kept in a short-TTL process-local cache,
+so authenticated requests do not each pay a primary-key lookup
+"""
+import threading
+import time
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event as orm_event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from app import db
+from app.models import User
+
+class UserCache:
+    """
+    Column values of recently loaded users, expiring after ttl seconds
+
+    Changes committed through the ORM in this process invalidate an entry
+    straight away; changes from other processes (e.g. reset_password.py)
+    are picked up once the entry expires.
+    """
+
+    def __init__(self, ttl=30.0, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so a row read before one is not cached after it
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id, state, generation=None):
+        """Cache a user's columns, unless an invalidation happened since generation was read"""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if len(self._entries) >= self.max_entries:
+                # Drop expired entries first, then the oldest
+                now = time.monotonic()
+                for key in [k for k, (expires, _) in self._entries.items() if expires < now]:
+                    del self._entries[key]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[user_id] = (time.monotonic() + self.ttl, state)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(user_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+_cache_lock = threading.Lock()
+
+def get_user_cache():
+    """Return the application's user cache, creating it on first use"""
+    app = current_app._get_current_object()
+    with _cache_lock:
+        cache = app.extensions.get('user_cache')
+        if cache is None:
+            cache = UserCache(
+                ttl=app.config.get('USER_CACHE_TTL', 30),
+                max_entries=app.config.get('USER_CACHE_SIZE', 10000)
+            )
+            app.extensions['user_cache'] = cache
+    return cache
+
+def _column_state(user):
+    return {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+
+def load_user(user_id):
+    """
+    User for an id from the request memo, the TTL cache or the database
+
+    Cached users are merged into the session with load=False, which
+    attaches them without a SELECT; relationships still lazy-load.
+
+    Args:
+        user_id: User primary key from the session cookie
+
+    Returns:
+        User or None
+    """
+    memo = g.setdefault('_user_memo', {}) if has_request_context() else {}
+    if user_id in memo:
+        return memo[user_id]
+
+    cache = get_user_cache()
+    state = cache.get(user_id)
+    if state is not None:
+        detached = User(**state)
+        make_transient_to_detached(detached)
+        user = db.session.merge(detached, load=False)
+    else:
+        generation = cache.generation
+        user = db.session.get(User, user_id)
+        if user is not None:
+            cache.put(user_id, _column_state(user), generation)
+
+    memo[user_id] = user
+    return user
+
+# Profile edits and password resets must not be served from the cache. Rows
+# are only invalidated once their transaction ends: a request reading the
+# user between the flush and the commit would otherwise cache the old row
+@orm_event.listens_for(User, 'after_update')
+@orm_event.listens_for(User, 'after_delete')
+def _collect_changed_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('_changed_user_ids', set()).add(target.id)
+
+@orm_event.listens_for(Session, 'after_commit')
+@orm_event.listens_for(Session, 'after_rollback')
+def _invalidate_changed_users(session):
+    user_ids = session.info.pop('_changed_user_ids', None)
+    if user_ids and has_app_context():
+        cache = get_user_cache()
+        for user_id in user_ids:
+            cache.invalidate(user_id)
@@ -0,0 +1,143 @@
+"""
+View Buffer for invitation page tracking
+Page views are queued in memory and written in bulk by a background thread,
+so guests opening an invite never wait on a database write
+"""
+from collections import deque, Counter
+from datetime import datetime
+import atexit
+import threading
+from flask import current_app
+from sqlalchemy import insert
+from app import db
+from app import counter_service
+from app.models import View
+
+class ViewBuffer:
+    """
+    Coalesces view events and flushes them on a timer or once the
+    buffer holds flush_size events
+
+    Events arriving while max_pending are already waiting are dropped
+    and counted, so a stalled database cannot exhaust memory.
+    """
+
+    def __init__(self, app, flush_interval=5.0, flush_size=500, max_pending=50000):
+        self.app = app
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.max_pending = max_pending
+
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+        self.dropped = 0
+        self.flushed = 0
+        self.failed_flushes = 0
+
+        self._thread = threading.Thread(target=self._run, name='view-buffer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, event_id, when=None):
+        """Queue one view; returns False if it was dropped"""
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending.append((event_id, when or datetime.utcnow()))
+            size = len(self._pending)
+
+        if size >= self.flush_size:
+            self._wakeup.set()
+        return True
+
+    def stats(self):
+        """Pending, flushed and dropped view counts for monitoring"""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            'pending': pending,
+            'flushed': self.flushed,
+            'dropped': self.dropped,
+            'failed_flushes': self.failed_flushes
+        }
+
+    def flush(self):
+        """Write every queued view now; returns the number written"""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+                self._pending.clear()
+
+            if not batch:
+                return 0
+
+            with self.app.app_context():
+                try:
+                    if self.app.config.get('RECORD_VIEW_ROWS', True):
+                        db.session.execute(
+                            insert(View),
+                            [{'event_id': event_id, 'timestamp': when} for event_id, when in batch]
+                        )
+                    deltas = Counter((event_id, 'views', when.date()) for event_id, when in batch)
+                    counter_service.increment_many(deltas)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    self.failed_flushes += 1
+                    self._requeue(batch)
+                    print(f"Error flushing {len(batch)} views: {str(e)}")
+                    return 0
+                finally:
+                    db.session.remove()
+
+            self.flushed += len(batch)
+            return len(batch)
+
+    def _requeue(self, batch):
+        """Put a failed batch back in front, dropping what no longer fits"""
+        with self._lock:
+            room = self.max_pending - len(self._pending)
+            keep = batch[-room:] if room > 0 else []
+            self.dropped += len(batch) - len(keep)
+            self._pending.extendleft(reversed(keep))
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the flush thread and write whatever is still queued"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+_buffer_lock = threading.Lock()
+
+def get_view_buffer():
+    """Return the application's view buffer, starting it on first use"""
+    app = current_app._get_current_object()
+    with _buffer_lock:
+        buffer = app.extensions.get('view_buffer')
+        if buffer is None:
+            buffer = ViewBuffer(
+                app,
+                flush_interval=app.config.get('VIEW_BUFFER_FLUSH_INTERVAL', 5.0),
+                flush_size=app.config.get('VIEW_BUFFER_FLUSH_SIZE', 500),
+                max_pending=app.config.get('VIEW_BUFFER_MAX_PENDING', 50000)
+            )
+            app.extensions['view_buffer'] = buffer
+    return buffer
+
+def record_view(event_id):
+    """Queue a page view for the given event"""
+    return get_view_buffer().record(event_id)
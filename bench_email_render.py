@@ -0,0 +1,88 @@
+"""
+Microbenchmark: per-guest cost of building invitation and RSVP confirmation
+bodies with a full Jinja render versus the pre-compiled per-event body
+
+Usage: python bench_email_render.py [guests]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from app import create_app, db
+from app.models import Event, Guest
+from app import email_service
+
+def make_event():
+    return Event(
+        id='bench-event',
+        title='Asha & Ravi Wedding',
+        type='wedding',
+        template_id='wed_0_royal_navy_gold',
+        host_name='Asha',
+        partner_name='Ravi',
+        event_date='2026-02-14',
+        event_time='18:00',
+        venue='Grand Palace, Hyderabad'
+    )
+
+def make_guests(count):
+    return [
+        Guest(
+            id=f'guest-{i}',
+            event_id='bench-event',
+            name=f'Guest <{i}>',
+            email=f'guest{i}@example.com',
+            rsvp_status='Yes',
+            plus_one_count=i % 3,
+            unique_token=f'token-{i}'
+        )
+        for i in range(count)
+    ]
+
+def timed(label, func, guests):
+    start = time.perf_counter()
+    for guest in guests:
+        func(guest)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1e6 / len(guests):8.1f} us/guest")
+    return elapsed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = create_app()
+    base_url = 'https://invitee.example.com'
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(make_event())
+        db.session.add_all(make_guests(count))
+        db.session.commit()
+
+        event = Event.query.get('bench-event')
+        guests = Guest.query.filter_by(event_id=event.id).all()
+
+        def url(guest):
+            return f"{base_url}/event/{event.id}?guest={guest.unique_token}"
+
+        # One lookup per batch, as the outbox workers do
+        templates = email_service.get_event_templates(event)
+
+        print(f"Invitation email, {count} guests")
+        before = timed('render per guest', lambda g: email_service._render_invitation(event, g, url(g)), guests)
+        after = timed('pre-compiled per event', lambda g: templates.invitation(g, url(g)), guests)
+        print(f"  speedup: {before / after:.1f}x")
+
+        print(f"RSVP confirmation email, {count} guests")
+        before = timed('render per guest', lambda g: email_service._render_rsvp_confirmation(event, g), guests)
+        after = timed('pre-compiled per event', templates.rsvp_confirmation, guests)
+        print(f"  speedup: {before / after:.1f}x")
+
+        # Sanity check: both paths produce the same message
+        for guest in guests[:10]:
+            assert templates.invitation(guest, url(guest)) == email_service._render_invitation(event, guest, url(guest))
+            assert templates.rsvp_confirmation(guest) == email_service._render_rsvp_confirmation(event, guest)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: login throughput and invite-page latency while a burst of logins
+hashes passwords in the request threads versus on the bounded hashing pool
+
+Usage: python bench_password_hashing.py [login_threads] [seconds]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'bench_password_hashing.db'))
+
+from app import create_app, db, password_service
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'bench-password'
+
+def login_loop(app, stop, results):
+    while not stop.is_set():
+        # A fresh client per login, so each one is a signed-out POST
+        status = app.test_client().post('/login', data={'email': EMAIL, 'password': PASSWORD}).status_code
+        results.append(status)
+
+def invite_loop(app, path, stop, latencies):
+    client = app.test_client()
+    while not stop.is_set():
+        start = time.perf_counter()
+        client.get(path)
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.01)
+
+def run(app, path, threads, seconds):
+    stop = threading.Event()
+    statuses, latencies = [], []
+    workers = [threading.Thread(target=login_loop, args=(app, stop, statuses)) for _ in range(threads)]
+    workers.append(threading.Thread(target=invite_loop, args=(app, path, stop, latencies)))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return statuses, latencies
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    client = app.test_client()
+    client.post('/signup', data={'email': EMAIL, 'name': 'Bench', 'password': PASSWORD})
+    event_id = client.post('/api/events', json={
+        'title': 'Bench Event', 'type': 'birthday', 'template_id': 'bday_0_balloons'
+    }).get_json()['id']
+    path = f'/event/{event_id}'
+
+    # Baseline with no logins running
+    _, idle = run(app, path, 0, 1)
+    print(f"{threads} login threads for {seconds:g}s, {os.cpu_count()} CPUs, "
+          f"method {app.config['PASSWORD_HASH_METHOD']}")
+    print(f"  idle invite page         p50 {statistics.median(idle):7.1f} ms  p95 {percentile(idle, 95):7.1f} ms")
+
+    for label, pool_size in (('hash in request thread', 0), ('bounded hashing pool', app.config['PASSWORD_HASH_WORKERS'])):
+        app.config['PASSWORD_HASH_WORKERS'] = pool_size
+        password_service._executor = None
+        statuses, latencies = run(app, path, threads, seconds)
+        ok = statuses.count(302)
+        busy = statuses.count(503)
+        print(f"  {label:<24} p50 {statistics.median(latencies):7.1f} ms  p95 {percentile(latencies, 95):7.1f} ms  "
+              f"{ok / seconds:5.1f} logins/s  ({busy} answered 503)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark bulk email throughput with and without the SMTP connection pool
+
+Runs against a local aiosmtpd server (pip install aiosmtpd) that adds an
+artificial delay to every EHLO, standing in for the TLS + AUTH handshake
+of a real provider.
+
+Usage: python bench_smtp_pool.py [messages] [handshake_delay_seconds]
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from flask_mail import Message
+from app import email_service
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    print("aiosmtpd is required: pip install aiosmtpd")
+    sys.exit(1)
+
+class SlowHandshakeHandler:
+    def __init__(self, delay):
+        self.delay = delay
+        self.received = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        await asyncio.sleep(self.delay)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return '250 Message accepted for delivery'
+
+def make_messages(count):
+    return [
+        Message(
+            subject=f"Benchmark {i}",
+            recipients=[f"guest{i}@example.com"],
+            sender='bench@example.com',
+            body='Hello from the benchmark'
+        )
+        for i in range(count)
+    ]
+
+def bench_per_message(app, messages):
+    """Old behaviour: one connection per message"""
+    with app.app_context():
+        for msg in messages:
+            email_service.mail.send(msg)
+
+def bench_pooled(app, messages, workers):
+    """Pooled sessions shared by a worker per batch, like the outbox"""
+    batch_size = app.config['EMAIL_BATCH_SIZE']
+    batches = [messages[i:i + batch_size] for i in range(0, len(messages), batch_size)]
+
+    def send_batch(batch):
+        with app.app_context():
+            with email_service.get_smtp_pool().connection() as connection:
+                for msg in batch:
+                    connection.send(msg)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send_batch, batches))
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    handler = SlowHandshakeHandler(delay)
+    controller = Controller(handler, hostname='127.0.0.1', port=8025)
+    controller.start()
+
+    app = Flask(__name__)
+    app.config.update(
+        MAIL_SERVER='127.0.0.1',
+        MAIL_PORT=8025,
+        MAIL_USE_TLS=False,
+        MAIL_DEFAULT_SENDER='bench@example.com',
+        MAIL_POOL_SIZE=4,
+        MAIL_POOL_IDLE_TIMEOUT=60,
+        EMAIL_BATCH_SIZE=50
+    )
+    email_service.init_mail(app)
+
+    try:
+        print(f"Sending {count} messages, {delay * 1000:.0f} ms handshake")
+
+        start = time.perf_counter()
+        bench_per_message(app, make_messages(count))
+        elapsed = time.perf_counter() - start
+        print(f"  per-message connection: {elapsed:.2f}s ({count / elapsed:.0f} msg/s)")
+
+        start = time.perf_counter()
+        bench_pooled(app, make_messages(count), workers=app.config['MAIL_POOL_SIZE'])
+        elapsed = time.perf_counter() - start
+        print(f"  pooled sessions:        {elapsed:.2f}s ({count / elapsed:.0f} msg/s)")
+
+        with app.app_context():
+            email_service.get_smtp_pool().close()
+        print(f"Server received {handler.received} messages")
+    finally:
+        controller.stop()
+
+if __name__ == '__main__':
+    main()
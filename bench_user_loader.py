@@ -0,0 +1,69 @@
+"""
+Benchmark: database queries and time per authenticated API request with
+the user loader hitting the database every time versus the user cache
+
+Usage: python bench_user_loader.py [requests]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from sqlalchemy import event as sa_event
+from app import create_app, db
+
+# Calls the dashboard and Design Studio make on page load
+ENDPOINTS = (
+    '/api/my-designs',
+    '/api/metrics/view-buffer',
+    '/api/events/{event_id}/statistics',
+)
+
+def run(client, paths, count, counter):
+    counter['queries'] = counter['user_queries'] = 0
+    start = time.perf_counter()
+    for i in range(count):
+        client.get(paths[i % len(paths)])
+    elapsed = time.perf_counter() - start
+    return counter['queries'] / count, counter['user_queries'] / count, elapsed * 1000 / count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    app = create_app()
+    counter = {'queries': 0, 'user_queries': 0}
+
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        counter['queries'] += 1
+        if 'FROM user' in statement:
+            counter['user_queries'] += 1
+
+    with app.app_context():
+        db.create_all()
+        sa_event.listen(db.engine, 'before_cursor_execute', count_query)
+
+    # Requests run outside an app context, so each gets its own session
+    # as it would under a real server
+    client = app.test_client()
+    client.post('/signup', data={'email': 'bench@example.com', 'name': 'Bench', 'password': 'bench-password'})
+    event_id = client.post('/api/events', json={
+        'title': 'Bench Event', 'type': 'birthday', 'template_id': 'bday_0_balloons'
+    }).get_json()['id']
+    paths = [path.format(event_id=event_id) for path in ENDPOINTS]
+
+    print(f"{count} authenticated requests across {len(paths)} endpoints")
+    results = {}
+    for label, ttl in (('query per request', 0), ('user cache', 30)):
+        app.config['USER_CACHE_TTL'] = ttl
+        app.extensions.pop('user_cache', None)
+        run(client, paths, len(paths), counter)  # warm up
+        results[label] = run(client, paths, count, counter)
+        queries, user_queries, ms = results[label]
+        print(f"  {label:<18} {queries:5.2f} queries/request ({user_queries:.2f} user lookups)  {ms:6.3f} ms/request")
+
+    before, after = results['query per request'], results['user cache']
+    print(f"  saved {before[0] - after[0]:.2f} queries/request, {before[2] - after[2]:.3f} ms/request")
+    print(f"  cache stats: {app.extensions['user_cache'].stats()}")
+
+if __name__ == '__main__':
+    main()
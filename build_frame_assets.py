@@ -0,0 +1,126 @@
+"""
+Build the template frame assets served from /frames/
+
+Each frame data URI in templates_output.json is decoded, minified and written
+to app/static/frames/ as <content hash>.svg with precompressed .gz (and .br
+when the brotli package is installed) siblings, plus a manifest.json mapping
+template ids to file names. Run it after regenerating the templates:
+
+    python build_frame_assets.py --generate   # run generate_premium_templates first
+    python build_frame_assets.py              # build from the existing JSON
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import urllib.parse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_JSON = os.path.join(BASE_DIR, 'templates_output.json')
+FRAMES_DIR = os.path.join(BASE_DIR, 'app', 'static', 'frames')
+
+def minify_svg(svg):
+    """Drop comments and whitespace that does not affect rendering"""
+    svg = re.sub(r'<!--.*?-->', '', svg, flags=re.DOTALL)
+    svg = re.sub(r'>\s+<', '><', svg)
+    svg = re.sub(r'\s+', ' ', svg)
+    svg = re.sub(r'\s*(/?>)', r'\1', svg)
+    return svg.strip()
+
+def decode_frame(frame):
+    """SVG text of a data URI frame, or None for anything else"""
+    if not frame or not frame.startswith('data:image/svg+xml'):
+        return None
+    header, data = frame.split(',', 1)
+    return urllib.parse.unquote(data)
+
+def write_asset(name, data):
+    """
+    Write a file and its precompressed siblings, skipping those already built
+
+    Each file is checked on its own, so a deleted .gz or a .br missing from
+    a build without brotli is written on the next run.
+
+    Returns:
+        bool: True if any file was written
+    """
+    path = os.path.join(FRAMES_DIR, name)
+    encoders = {
+        path: lambda: data,
+        # mtime=0 keeps the .gz byte-identical between builds
+        path + '.gz': lambda: gzip.compress(data, compresslevel=9, mtime=0)
+    }
+    if brotli is not None:
+        encoders[path + '.br'] = lambda: brotli.compress(data, quality=11)
+
+    written = False
+    for target, encode in encoders.items():
+        if os.path.exists(target):
+            continue
+        with open(target, 'wb') as f:
+            f.write(encode())
+        written = True
+    return written
+
+def build(templates):
+    os.makedirs(FRAMES_DIR, exist_ok=True)
+
+    manifest = {}
+    written = 0
+    raw_bytes = 0
+    asset_bytes = 0
+    for category, items in templates.items():
+        for template in items:
+            svg = decode_frame(template.get('frame'))
+            if svg is None:
+                continue
+
+            data = minify_svg(svg).encode('utf-8')
+            # Content-addressed, so identical frames share one file
+            name = f"{hashlib.sha256(data).hexdigest()[:16]}.svg"
+            manifest[template['id']] = name
+            if write_asset(name, data):
+                written += 1
+            raw_bytes += len(template['frame'].encode('utf-8'))
+            asset_bytes += len(data)
+
+    # Remove assets no template refers to any more
+    keep = set(manifest.values())
+    for filename in os.listdir(FRAMES_DIR):
+        base = filename.rsplit('.', 1)[0] if filename.endswith(('.gz', '.br')) else filename
+        if base.endswith('.svg') and base not in keep:
+            os.remove(os.path.join(FRAMES_DIR, filename))
+
+    version = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    with open(os.path.join(FRAMES_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'frames': manifest}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    print(f"{len(manifest)} frames, {len(keep)} unique files, {written} written")
+    print(f"Data URIs: {raw_bytes} bytes -> minified SVG: {asset_bytes} bytes")
+    if brotli is None:
+        print("brotli not installed; only .gz siblings were written")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build hashed, precompressed template frame assets')
+    parser.add_argument('--generate', action='store_true',
+                        help='Regenerate templates_output.json with generate_premium_templates first')
+    args = parser.parse_args()
+
+    if args.generate:
+        from generate_premium_templates import generate_templates
+        templates = generate_templates()
+        with open(TEMPLATES_JSON, 'w', encoding='utf-8') as f:
+            json.dump(templates, f, indent=4)
+    else:
+        with open(TEMPLATES_JSON, encoding='utf-8') as f:
+            templates = json.load(f)
+
+    build(templates)
@@ -0,0 +1,106 @@
+"""
+Migration check against a database shaped like the original schema
+
+Builds a temporary SQLite database with the first-release custom_design
+table (canvas_data text column, no version), runs the design migrations
+over it and checks every row comes out readable. The same is done for a
+database left mid-rebuild by an interrupted storage migration. Exits with
+status 1 on any failure.
+
+Usage: python check_migrations.py
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='check_migrations_'), 'baseline.db')
+os.environ['DATABASE_URL'] = 'sqlite:///' + DB_PATH
+
+from sqlalchemy import inspect
+from app import create_app, db, design_service
+from app.models import CustomDesign
+import migrate_design_storage
+import migrate_design_versions
+
+BASELINE_SCHEMA = (
+    "CREATE TABLE user (id VARCHAR(36) PRIMARY KEY)",
+    "CREATE TABLE custom_design (id VARCHAR(36) NOT NULL, user_id VARCHAR(36) NOT NULL, "
+    "title VARCHAR(200) NOT NULL, canvas_data TEXT NOT NULL, thumbnail_url TEXT, "
+    "created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id), FOREIGN KEY(user_id) REFERENCES user (id))",
+    "CREATE INDEX ix_custom_design_user_updated ON custom_design (user_id, updated_at)",
+)
+
+DESIGNS = {
+    'design-1': {'objects': [{'type': 'rect', 'left': i} for i in range(50)]},
+    'design-2': {},
+}
+
+# State an interrupted rebuild used to leave: originals renamed, new table empty
+INTERRUPTED_REBUILD = (
+    "ALTER TABLE custom_design RENAME TO custom_design_old",
+    "CREATE TABLE custom_design (id VARCHAR(36) NOT NULL, user_id VARCHAR(36) NOT NULL, "
+    "title VARCHAR(200) NOT NULL, canvas_gz BLOB NOT NULL, thumbnail_url VARCHAR(255), "
+    "created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id))",
+)
+
+def build_baseline(interrupted=False):
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    con = sqlite3.connect(DB_PATH)
+    for statement in BASELINE_SCHEMA:
+        con.execute(statement)
+    con.execute("INSERT INTO user VALUES ('user-1')")
+    for design_id, canvas in DESIGNS.items():
+        con.execute(
+            "INSERT INTO custom_design VALUES (?, 'user-1', 'Design', ?, NULL, "
+            "'2025-01-01 10:00:00.000000', '2025-01-02 10:00:00.000000')",
+            (design_id, json.dumps(canvas))
+        )
+    if interrupted:
+        for statement in INTERRUPTED_REBUILD:
+            con.execute(statement)
+    con.commit()
+    con.close()
+
+def check_designs(app, scenario):
+    failures = []
+    with app.app_context():
+        if 'custom_design_old' in inspect(db.engine).get_table_names():
+            failures.append(f'{scenario}: custom_design_old left behind')
+        designs = {d.id: d for d in CustomDesign.query.options(db.undefer(CustomDesign.canvas_gz))}
+        for design_id, canvas in DESIGNS.items():
+            design = designs.get(design_id)
+            if design is None:
+                failures.append(f'{scenario}: {design_id} missing after migration')
+                continue
+            if json.loads(design_service.decompress_canvas(design.canvas_gz)) != canvas:
+                failures.append(f'{scenario}: {design_id} canvas changed')
+            if design.version != 1:
+                failures.append(f'{scenario}: {design_id} version is {design.version}, expected 1')
+    return failures
+
+def run_step(name, step):
+    try:
+        step()
+        return []
+    except Exception as e:
+        return [f'{name} raised {type(e).__name__}: {e}']
+
+def main():
+    failures = []
+    for scenario, interrupted in (('baseline', False), ('interrupted rebuild', True)):
+        build_baseline(interrupted)
+        failures += run_step(f'{scenario}: migrate_design_storage', migrate_design_storage.migrate_db)
+        failures += run_step(f'{scenario}: migrate_design_versions', migrate_design_versions.migrate_db)
+        failures += check_designs(create_app(), scenario)
+
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+    if failures:
+        sys.exit(1)
+    print("\nDesign migrations upgrade baseline and interrupted databases")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Query-plan regression check for the hot queries
+
+Builds an empty in-memory SQLite schema from the models and runs
+EXPLAIN QUERY PLAN on the queries behind the guest list, RSVP, comment,
+dashboard and outbox endpoints. Exits with status 1 if any of them falls
+back to a full table scan or sorts in a temporary B-tree.
+
+Usage: python check_query_plans.py
+"""
+import os
+import sys
+from datetime import datetime
+
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from app import create_app, db
+from sqlalchemy import tuple_
+from app.models import Event, Guest, View, Comment, EmailLog, EventCounter, CustomDesign
+
+def hot_queries():
+    return {
+        'guests by event and RSVP status': Guest.query.filter_by(event_id='e', rsvp_status='Yes'),
+        'guest list for event': Guest.query.filter_by(event_id='e'),
+        'guest by invite token': Guest.query.filter_by(unique_token='t'),
+        'views for event': View.query.filter_by(event_id='e'),
+        'comments for event, newest first': Comment.query.filter_by(event_id='e').order_by(Comment.created_at.desc()),
+        'guest list page after cursor': Guest.query.filter(
+            Guest.event_id == 'e', tuple_(Guest.name, Guest.id) > tuple_('n', 'i')
+        ).order_by(Guest.name, Guest.id).limit(51),
+        'guest list page by RSVP status': Guest.query.filter_by(event_id='e', rsvp_status='Yes').order_by(Guest.name, Guest.id).limit(51),
+        'comment page after cursor': Comment.query.filter(
+            Comment.event_id == 'e', tuple_(Comment.created_at, Comment.id) < tuple_(datetime(2024, 1, 1), 'i')
+        ).order_by(Comment.created_at.desc(), Comment.id.desc()).limit(51),
+        'email log for event': EmailLog.query.filter_by(event_id='e'),
+        'queued email for job': EmailLog.query.filter_by(job_id='j', status='queued'),
+        'events for user dashboard': Event.query.filter_by(user_id='u').order_by(Event.created_at.desc()),
+        'counters for event': EventCounter.query.filter_by(event_id='e'),
+        'designs for user': CustomDesign.query.filter_by(user_id='u').order_by(CustomDesign.updated_at.desc()),
+    }
+
+def explain(query):
+    compiled = query.statement.compile(db.engine)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = db.session.connection().exec_driver_sql('EXPLAIN QUERY PLAN ' + str(compiled), params).fetchall()
+    return [row[-1] for row in rows]
+
+def problems(plan):
+    found = []
+    for step in plan:
+        if step.startswith('SCAN ') and ' USING ' not in step:
+            found.append(f'full table scan: {step}')
+        if 'TEMP B-TREE' in step:
+            found.append(f'unindexed sort: {step}')
+    return found
+
+def main():
+    app = create_app()
+    failures = 0
+
+    with app.app_context():
+        db.create_all()
+        for name, query in hot_queries().items():
+            plan = explain(query)
+            issues = problems(plan)
+            status = 'FAIL' if issues else 'OK'
+            print(f"[{status}] {name}: {' | '.join(plan)}")
+            for issue in issues:
+                print(f"       {issue}")
+            failures += bool(issues)
+
+    if failures:
+        print(f"\n{failures} hot queries degraded; check the indexes in app/models.py")
+        sys.exit(1)
+    print("\nAll hot queries use an index")
+
+if __name__ == '__main__':
+    main()
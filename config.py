@@ -12,17 +12,58 @@ class Config:
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER') or 'noreply@invitations.com'
+    MAIL_POOL_SIZE = int(os.environ.get('MAIL_POOL_SIZE') or 5)  # Open SMTP sessions; keep above EMAIL_WORKERS
+    MAIL_POOL_IDLE_TIMEOUT = int(os.environ.get('MAIL_POOL_IDLE_TIMEOUT') or 60)  # Seconds before an idle session is reopened
+    
+    # Email Outbox (background delivery of bulk sends)
+    EMAIL_WORKERS = int(os.environ.get('EMAIL_WORKERS') or 4)
+    EMAIL_BATCH_SIZE = int(os.environ.get('EMAIL_BATCH_SIZE') or 50)
+    EMAIL_SEND_LEASE = int(os.environ.get('EMAIL_SEND_LEASE') or 300)  # Seconds before another process may requeue a message being sent
+    EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS') or 3)  # Tries per message, and batch runs without progress, before giving up
+    EMAIL_RETRY_DELAY = int(os.environ.get('EMAIL_RETRY_DELAY') or 30)  # Seconds before a failed batch is retried, times the runs without progress
     
     # File Upload Configuration
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app', 'static', 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+    IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS') or 2)  # Threads producing resized upload variants
+    UPLOAD_GC_GRACE_HOURS = int(os.environ.get('UPLOAD_GC_GRACE_HOURS') or 24)  # Unreferenced uploads are kept this long
+    DESIGN_THUMBNAIL_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'design_thumbnails')
+    DESIGN_SNAPSHOT_INTERVAL = int(os.environ.get('DESIGN_SNAPSHOT_INTERVAL') or 20)  # Saves between full canvas snapshots
+    DESIGN_HISTORY_LIMIT = int(os.environ.get('DESIGN_HISTORY_LIMIT') or 100)  # Versions of history kept per design
+    
+    # Analytics
+    # Raw View rows are optional; the dashboard reads the EventCounter totals
+    RECORD_VIEW_ROWS = os.environ.get('RECORD_VIEW_ROWS', 'true').lower() in ['true', 'on', '1']
+    # Page views are buffered in memory and written in bulk
+    VIEW_BUFFER_FLUSH_INTERVAL = float(os.environ.get('VIEW_BUFFER_FLUSH_INTERVAL') or 5.0)  # Seconds
+    VIEW_BUFFER_FLUSH_SIZE = int(os.environ.get('VIEW_BUFFER_FLUSH_SIZE') or 500)
+    VIEW_BUFFER_MAX_PENDING = int(os.environ.get('VIEW_BUFFER_MAX_PENDING') or 50000)  # Views beyond this are dropped
+    
+    # Invite pages served to anonymous guests from memory until the event changes
+    INVITE_CACHE_SIZE = int(os.environ.get('INVITE_CACHE_SIZE') or 512)
     
     # QR Code Configuration
     QR_CODE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app', 'static', 'qrcodes')
+    QR_CACHE_SIZE = int(os.environ.get('QR_CACHE_SIZE') or 256)  # PNGs kept in memory
+    QR_BATCH_WORKERS = int(os.environ.get('QR_BATCH_WORKERS') or os.cpu_count() or 2)  # Processes drawing per-guest codes
+    
+    # Invitation Templates & Rendering
+    TEMPLATE_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates_output.json')
+    FRAME_ASSET_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app', 'static', 'frames')  # Output of build_frame_assets.py
+    RENDER_CACHE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'renders')
+    RENDER_FONT_PATH = os.environ.get('RENDER_FONT_PATH')  # TrueType font for rendered text; Pillow's default if unset
     
     # Security
     WTF_CSRF_ENABLED = True
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
+    # Signed-in users are cached per process; edits in this process invalidate at once
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL') or 30)  # Seconds; 0 disables the cache
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE') or 10000)
+    # Password hashing cost; hashes made with another method are upgraded on login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD') or 'scrypt:32768:8:1'
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS') or 2)  # Threads hashing at once; 0 hashes in the request thread
+    PASSWORD_HASH_QUEUE = int(os.environ.get('PASSWORD_HASH_QUEUE') or 32)  # Logins allowed to wait for a hashing thread
+    PASSWORD_HASH_WAIT = float(os.environ.get('PASSWORD_HASH_WAIT') or 2)  # Seconds to wait for a queue slot before answering 503
@@ -0,0 +1,33 @@
+"""
+Delete uploaded images no event uses any more
+
+Usage: python gc_uploads.py [--rebuild] [--dry-run]
+
+Blobs with no references are removed, with their resized variants, once
+UPLOAD_GC_GRACE_HOURS have passed since they were last uploaded.
+--rebuild recounts references from the events first.
+"""
+import sys
+from app import create_app
+from app import upload_service
+
+def main():
+    args = sys.argv[1:]
+    dry_run = '--dry-run' in args
+
+    app = create_app()
+    with app.app_context():
+        if '--rebuild' in args:
+            referenced = upload_service.rebuild_ref_counts()
+            print(f"Recounted references: {referenced} blobs in use")
+
+        removed, freed = upload_service.collect_garbage(
+            app.config['UPLOAD_FOLDER'],
+            grace_hours=app.config.get('UPLOAD_GC_GRACE_HOURS', 24),
+            dry_run=dry_run
+        )
+        action = "Would remove" if dry_run else "Removed"
+        print(f"{action} {removed} unreferenced blobs, {freed / 1024:.1f} KB")
+
+if __name__ == '__main__':
+    main()
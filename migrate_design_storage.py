@@ -0,0 +1,85 @@
+"""
+Move Design Studio canvases and thumbnails out of the custom_design rows
+
+Usage: python migrate_design_storage.py
+
+The table is rebuilt with the compressed canvas_gz column in place of
+canvas_data; base64 thumbnails are written to DESIGN_THUMBNAIL_FOLDER and
+the rows keep only their URL.
+"""
+from flask import url_for
+from sqlalchemy import inspect, text
+from app import create_app, db
+from app import design_service
+from app.models import CustomDesign
+
+def migrate_db():
+    app = create_app()
+    with app.app_context(), app.test_request_context():
+        tables = inspect(db.engine).get_table_names()
+        if 'custom_design' not in tables and 'custom_design_old' not in tables:
+            db.create_all()
+            print("Created custom_design table.")
+            return
+
+        # custom_design_old is only left behind by a run that stopped midway
+        # (before the rebuild was one transaction); its rows are the originals
+        interrupted = 'custom_design_old' in tables
+        if not interrupted:
+            columns = [c['name'] for c in inspect(db.engine).get_columns('custom_design')]
+            if 'canvas_gz' in columns:
+                print("Column canvas_gz already exists.")
+                return
+
+        # The whole rebuild is one transaction (SQLite DDL is transactional),
+        # so a failure leaves the original table as it was
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            connection.exec_driver_sql("BEGIN")
+            try:
+                _rebuild(app, connection, interrupted)
+                connection.exec_driver_sql("COMMIT")
+            except Exception:
+                connection.exec_driver_sql("ROLLBACK")
+                raise
+        print("Migration successful.")
+
+def _rebuild(app, connection, interrupted):
+    folder = app.config['DESIGN_THUMBNAIL_FOLDER']
+    if interrupted:
+        print("Resuming from custom_design_old left by an interrupted migration...")
+        connection.execute(text("DROP TABLE IF EXISTS custom_design"))
+    else:
+        print("Rebuilding custom_design table...")
+        connection.execute(text("ALTER TABLE custom_design RENAME TO custom_design_old"))
+    for index in CustomDesign.__table__.indexes:
+        connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    CustomDesign.__table__.create(bind=connection)
+
+    rows = connection.execute(text(
+        "SELECT id, user_id, title, canvas_data, thumbnail_url, created_at, updated_at "
+        "FROM custom_design_old"
+    )).mappings().all()
+
+    raw_bytes = 0
+    stored_bytes = 0
+    for row in rows:
+        thumbnail_url = row['thumbnail_url']
+        if thumbnail_url and thumbnail_url.startswith('data:'):
+            filename = design_service.save_thumbnail(row['id'], thumbnail_url, folder)
+            thumbnail_url = url_for('main.design_thumbnail', filename=filename) if filename else None
+
+        canvas_gz = design_service.compress_canvas(row['canvas_data'])
+        raw_bytes += len((row['canvas_data'] or '').encode('utf-8')) + len(row['thumbnail_url'] or '')
+        stored_bytes += len(canvas_gz) + len(thumbnail_url or '')
+
+        # Plain SQL so the timestamps are copied exactly as stored
+        connection.execute(text(
+            "INSERT INTO custom_design (id, user_id, title, canvas_gz, thumbnail_url, version, created_at, updated_at) "
+            "VALUES (:id, :user_id, :title, :canvas_gz, :thumbnail_url, 1, :created_at, :updated_at)"
+        ), dict(row, canvas_gz=canvas_gz, thumbnail_url=thumbnail_url))
+
+    connection.execute(text("DROP TABLE custom_design_old"))
+    print(f"Migrated {len(rows)} designs: {raw_bytes} -> {stored_bytes} bytes in the table")
+
+if __name__ == "__main__":
+    migrate_db()
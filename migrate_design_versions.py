@@ -0,0 +1,22 @@
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+def migrate_db():
+    app = create_app()
+    with app.app_context():
+        # Creates the new design_version table if it is missing
+        db.create_all()
+
+        inspector = inspect(db.engine)
+        columns = [c['name'] for c in inspector.get_columns('custom_design')]
+
+        if 'version' not in columns:
+            print("Adding version column to custom_design table...")
+            db.session.execute(text("ALTER TABLE custom_design ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+            db.session.commit()
+            print("Migration successful.")
+        else:
+            print("Column version already exists.")
+
+if __name__ == "__main__":
+    migrate_db()
@@ -0,0 +1,28 @@
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+def migrate_db():
+    app = create_app()
+    with app.app_context():
+        # Creates the new email_job table if it is missing
+        db.create_all()
+
+        inspector = inspect(db.engine)
+        columns = [c['name'] for c in inspector.get_columns('email_log')]
+
+        new_columns = {
+            'job_id': "VARCHAR(36) REFERENCES email_job(id)",
+            'claimed_at': "DATETIME",
+            'attempts': "INTEGER NOT NULL DEFAULT 0"
+        }
+        for name, definition in new_columns.items():
+            if name not in columns:
+                print(f"Adding {name} column to email_log table...")
+                db.session.execute(text(f"ALTER TABLE email_log ADD COLUMN {name} {definition}"))
+                db.session.commit()
+                print("Migration successful.")
+            else:
+                print(f"Column {name} already exists.")
+
+if __name__ == "__main__":
+    migrate_db()
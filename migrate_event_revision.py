@@ -0,0 +1,22 @@
+from app import create_app, db
+from sqlalchemy import inspect, text
+
+def migrate_db():
+    app = create_app()
+    with app.app_context():
+        # Creates any missing tables
+        db.create_all()
+
+        inspector = inspect(db.engine)
+        columns = [c['name'] for c in inspector.get_columns('event')]
+
+        if 'revision' not in columns:
+            print("Adding revision column to event table...")
+            db.session.execute(text("ALTER TABLE event ADD COLUMN revision INTEGER NOT NULL DEFAULT 1"))
+            db.session.commit()
+            print("Migration successful.")
+        else:
+            print("Column revision already exists.")
+
+if __name__ == "__main__":
+    migrate_db()
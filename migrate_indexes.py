@@ -0,0 +1,23 @@
+from app import create_app, db
+from sqlalchemy import text
+
+# Replaced by wider indexes that also cover the keyset sort keys
+RETIRED_INDEXES = ('ix_guest_event_status', 'ix_comment_event_created')
+
+def migrate_db():
+    app = create_app()
+    with app.app_context():
+        for name in RETIRED_INDEXES:
+            db.session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"Index {name} dropped.")
+        db.session.commit()
+
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                # checkfirst skips indexes that already exist
+                index.create(bind=db.engine, checkfirst=True)
+                print(f"Index {index.name} on {table.name} ready.")
+    print("Migration successful.")
+
+if __name__ == "__main__":
+    migrate_db()
@@ -0,0 +1,66 @@
+"""
+Move event photos into content-addressed upload storage
+
+Usage: python migrate_upload_blobs.py [--remove-legacy]
+
+Creates the upload_blob table, stores every upload an event refers to
+under its content hash, points background_image_url at the new name and
+recounts references. Duplicate legacy copies collapse into one file.
+With --remove-legacy the old uuid-prefixed files that were converted are
+deleted afterwards.
+"""
+import os
+import sys
+from app import create_app, db
+from app import image_service, upload_service
+from app.models import Event, UploadBlob
+
+def main():
+    remove_legacy = '--remove-legacy' in sys.argv[1:]
+
+    app = create_app()
+    with app.app_context():
+        # Creates the upload_blob table on existing databases
+        db.create_all()
+        folder = app.config['UPLOAD_FOLDER']
+
+        converted = {}
+        events = Event.query.filter(Event.background_image_url.isnot(None)).all()
+        for event in events:
+            parts = event.background_image_url.split('|')
+            for i, url in enumerate(parts):
+                filename = image_service.upload_filename(url.strip())
+                if not filename or upload_service.referenced_blobs(url):
+                    continue
+
+                if filename not in converted:
+                    path = os.path.join(folder, filename)
+                    if not os.path.isfile(path):
+                        print(f"Missing upload {filename} (event {event.id})")
+                        continue
+                    extension = filename.rsplit('.', 1)[-1] if '.' in filename else 'bin'
+                    with open(path, 'rb') as f:
+                        blob, created = upload_service.save_upload(f, extension, folder)
+                    if created:
+                        image_service.process_image(os.path.join(folder, blob.filename))
+                    converted[filename] = blob.filename
+
+                parts[i] = url.replace(filename, converted[filename])
+            event.background_image_url = '|'.join(parts)
+        db.session.commit()
+
+        referenced = upload_service.rebuild_ref_counts()
+        unique = len(set(converted.values()))
+        print(f"Converted {len(converted)} legacy uploads into {unique} blobs")
+        print(f"{UploadBlob.query.count()} blobs, {referenced} referenced by events")
+
+        if remove_legacy:
+            removed = 0
+            for filename in converted:
+                for path in upload_service.blob_files(folder, filename):
+                    os.remove(path)
+                    removed += 1
+            print(f"Removed {removed} legacy files")
+
+if __name__ == '__main__':
+    main()
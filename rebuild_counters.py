@@ -0,0 +1,31 @@
+"""
+Rebuild EventCounter totals from the raw View, Share, Comment and Guest rows
+
+Usage: python rebuild_counters.py [event_id]
+
+View counters are left untouched when RECORD_VIEW_ROWS is off, since the
+raw rows no longer hold the full history.
+"""
+import sys
+from app import create_app, db
+from app import counter_service
+
+def main():
+    event_id = sys.argv[1] if len(sys.argv) > 1 else None
+
+    app = create_app()
+    with app.app_context():
+        # Creates the event_counter table on existing databases
+        db.create_all()
+
+        metrics = counter_service.METRICS
+        if not app.config.get('RECORD_VIEW_ROWS', True):
+            metrics = tuple(m for m in metrics if m != 'views')
+            print("RECORD_VIEW_ROWS is off; keeping existing view counters")
+
+        written = counter_service.rebuild_counters(event_id, metrics)
+        target = f"event {event_id}" if event_id else "all events"
+        print(f"Rebuilt {', '.join(metrics)} for {target}: {written} counter rows")
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,20 @@
 from app import create_app
+from app import outbox_service, template_catalog
 
-app = create_app()
+def create_server_app():
+    """App with the email outbox started and the template catalog indexed"""
+    app = create_app()
+    outbox_service.init_outbox(app)
+
+    # Index the template catalog before the first request
+    with app.app_context():
+        template_catalog.get_catalog()
+    return app
+
+# QR batch workers are spawned processes that import this module again as
+# __mp_main__; only the serving process builds the app and starts the outbox
+if __name__ != '__mp_main__':
+    app = create_server_app()
 
 if __name__ == '__main__':
     app.run(debug=True, port=5001)